@@ -9,8 +9,8 @@ Runs GreedyAgent vs N-1 RandomAgents and N-1 HeuristicAgents for N=2,4,6.
 """
 
 import os
-from multiprocessing import cpu_count
 from src.simulation.n_player_runner import NPlayerRunner
+from src.simulation.runner import available_workers
 from src.simulation.n_player_results import save_n_player_results_csv
 from src.simulation.n_player_analysis import summary_text
 
@@ -29,7 +29,7 @@ MATCHUPS = [
 NUM_GAMES = 1000
 BASE_SEED = 0
 FAST_MODE = True
-NUM_WORKERS = cpu_count()
+NUM_WORKERS = available_workers()
 OUTPUT_DIR = "results"
 
 
@@ -1,8 +1,7 @@
 """Phase 4 production simulation: all matchups, 1000 games each."""
 
 import os
-from multiprocessing import cpu_count
-from src.simulation.runner import SimulationRunner
+from src.simulation.runner import SimulationRunner, available_workers
 from src.simulation.results import save_results_csv
 from src.simulation.analysis import summary_text
 
@@ -19,7 +18,7 @@ MATCHUPS = [
 NUM_GAMES = 1000
 BASE_SEED = 0
 FAST_MODE = True
-NUM_WORKERS = cpu_count()
+NUM_WORKERS = available_workers()
 OUTPUT_DIR = "results"
 
 def main():
@@ -52,5 +52,13 @@ class Agent(ABC):
         """
         return self.choose_action(state, legal_actions)
 
+    def reset(self, seed: int | None = None) -> None:
+        """
+        Prepare the agent for a new game, as if freshly constructed with
+        this seed. Subclasses with per-game state must clear it here.
+        """
+        self.rng.seed(seed)
+        self.last_action_evs = None
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name='{self.name}')"
@@ -5,7 +5,7 @@ from typing import List, Dict, Tuple
 from .base import Agent
 from ..game.game import GameState, Action, ActionType
 from ..game.camel import CamelColor, RACING_CAMELS
-from ..game.dice import DieColor
+from ..game.dice import CAMEL_TO_DIE
 from ..probability.calculator import calculate_all_probabilities
 from ..probability.ev import (
     calculate_leg_ticket_ev,
@@ -68,8 +68,8 @@ class GreedyAgent(Agent):
         """Choose the action with highest expected value."""
         # Get remaining dice info
         remaining_racing = [
-            DieColor[c.name] for c in RACING_CAMELS
-            if DieColor[c.name] in state.pyramid.remaining
+            CAMEL_TO_DIE[c] for c in RACING_CAMELS
+            if CAMEL_TO_DIE[c] in state.pyramid.remaining
         ]
         # In fast_mode, skip grey die for faster calculation
         grey_available = not state.pyramid.grey_rolled and not self.fast_mode
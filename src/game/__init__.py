@@ -1,7 +1,7 @@
 """Camel Up game engine."""
 
 from .camel import CamelColor, CamelStack, CamelPositions, RACING_CAMELS, CRAZY_CAMELS
-from .dice import DieColor, DieRoll, Pyramid, RACING_DIE_FACES
+from .dice import DieColor, DieRoll, Pyramid, RACING_DIE_FACES, DIE_TO_CAMEL, CAMEL_TO_DIE
 from .board import Board, SpectatorTile, TRACK_LENGTH, FINISH_LINE
 from .betting import (
     BettingTicket, BettingState, PlayerState,
@@ -13,7 +13,7 @@ __all__ = [
     # Camels
     "CamelColor", "CamelStack", "CamelPositions", "RACING_CAMELS", "CRAZY_CAMELS",
     # Dice
-    "DieColor", "DieRoll", "Pyramid", "RACING_DIE_FACES",
+    "DieColor", "DieRoll", "Pyramid", "RACING_DIE_FACES", "DIE_TO_CAMEL", "CAMEL_TO_DIE",
     # Board
     "Board", "SpectatorTile", "TRACK_LENGTH", "FINISH_LINE",
     # Betting
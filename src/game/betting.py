@@ -1,6 +1,7 @@
 """Betting tickets and scoring for Camel Up."""
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Tuple
 from .camel import CamelColor, RACING_CAMELS
 
@@ -25,6 +26,22 @@ class BettingTicket:
     value: int  # Payout if camel wins (5, 3, 2, or 2)
 
 
+# Tickets are immutable, so the standard ones are built once and shared
+_TICKETS: Dict[Tuple[CamelColor, int], BettingTicket] = {
+    (camel, value): BettingTicket(camel=camel, value=value)
+    for camel in RACING_CAMELS
+    for value in TICKET_VALUES
+}
+
+
+def _ticket(camel: CamelColor, value: int) -> BettingTicket:
+    """The shared ticket for (camel, value), built only for non-standard values."""
+    ticket = _TICKETS.get((camel, value))
+    if ticket is None:
+        ticket = BettingTicket(camel=camel, value=value)
+    return ticket
+
+
 @dataclass(frozen=True)
 class OverallBet:
     """A bet on the overall winner or loser of the race."""
@@ -33,6 +50,19 @@ class OverallBet:
     is_winner_bet: bool  # True = betting on winner, False = betting on loser
 
 
+# Start-of-leg ticket stacks, shared by every fresh BettingState. States
+# never mutate it (take_ticket copies before taking), so one copy serves all.
+_FULL_TICKETS: Dict[CamelColor, Tuple[int, ...]] = {
+    camel: TICKET_VALUES for camel in RACING_CAMELS
+}
+
+
+@lru_cache(maxsize=None)
+def _empty_holdings(num_players: int) -> Tuple[Tuple[Tuple[()], ...], Tuple[int, ...]]:
+    """(player_tickets, player_pyramid_tickets) at the start of a leg."""
+    return ((),) * num_players, (0,) * num_players
+
+
 @dataclass(frozen=True)
 class BettingState:
     """
@@ -65,10 +95,11 @@ class BettingState:
     @classmethod
     def create_for_players(cls, num_players: int) -> "BettingState":
         """Create initial betting state for given number of players."""
+        player_tickets, player_pyramid_tickets = _empty_holdings(num_players)
         return cls(
-            available_tickets={camel: TICKET_VALUES for camel in RACING_CAMELS},
-            player_tickets=tuple(() for _ in range(num_players)),
-            player_pyramid_tickets=tuple(0 for _ in range(num_players)),
+            available_tickets=_FULL_TICKETS,
+            player_tickets=player_tickets,
+            player_pyramid_tickets=player_pyramid_tickets,
             winner_bets=(),
             loser_bets=()
         )
@@ -77,17 +108,17 @@ class BettingState:
         """Get the top available ticket for a camel, if any."""
         tickets = self.available_tickets.get(camel, ())
         if tickets:
-            return BettingTicket(camel=camel, value=tickets[0])
+            return _ticket(camel, tickets[0])
         return None
 
     def get_all_available_tickets(self) -> List[BettingTicket]:
         """Get all available betting tickets."""
-        tickets = []
-        for camel in RACING_CAMELS:
-            ticket = self.get_available_ticket(camel)
-            if ticket:
-                tickets.append(ticket)
-        return tickets
+        available = self.available_tickets
+        return [
+            _ticket(camel, available[camel][0])
+            for camel in RACING_CAMELS
+            if available.get(camel)
+        ]
 
     def take_ticket(self, player: int, camel: CamelColor) -> "BettingState":
         """
@@ -95,8 +126,8 @@ class BettingState:
 
         Returns new betting state with ticket taken.
         """
-        ticket = self.get_available_ticket(camel)
-        if ticket is None:
+        remaining = self.available_tickets.get(camel)
+        if not remaining:
             raise ValueError(f"No tickets available for {camel}")
 
         if player < 0 or player >= len(self.player_tickets):
@@ -104,11 +135,11 @@ class BettingState:
 
         # Remove ticket from available
         new_available = dict(self.available_tickets)
-        new_available[camel] = self.available_tickets[camel][1:]
+        new_available[camel] = remaining[1:]
 
         # Add ticket to player's collection
         new_player_tickets = list(self.player_tickets)
-        new_player_tickets[player] = self.player_tickets[player] + (ticket,)
+        new_player_tickets[player] += (_ticket(camel, remaining[0]),)
 
         return BettingState(
             available_tickets=new_available,
@@ -162,16 +193,29 @@ class BettingState:
 
     def reset_for_new_leg(self) -> "BettingState":
         """Reset betting state for a new leg (keep overall bets)."""
-        num_players = len(self.player_tickets)
+        player_tickets, player_pyramid_tickets = _empty_holdings(len(self.player_tickets))
         return BettingState(
-            available_tickets={camel: TICKET_VALUES for camel in RACING_CAMELS},
-            player_tickets=tuple(() for _ in range(num_players)),
-            player_pyramid_tickets=tuple(0 for _ in range(num_players)),
+            available_tickets=_FULL_TICKETS,
+            player_tickets=player_tickets,
+            player_pyramid_tickets=player_pyramid_tickets,
             winner_bets=self.winner_bets,
             loser_bets=self.loser_bets
         )
 
 
+def expected_leg_ticket_payout(p_first: float, p_second: float, ticket_value: int) -> float:
+    """
+    Expected payout of a leg ticket worth ticket_value, given the bet camel's
+    chance of finishing the leg 1st and 2nd.
+    """
+    # p1*v + p2*SECOND + (1 - p1 - p2)*OTHER, collected into one expression
+    return (
+        p_first * (ticket_value - LEG_OTHER_PLACE_PAYOUT)
+        + p_second * (LEG_SECOND_PLACE_PAYOUT - LEG_OTHER_PLACE_PAYOUT)
+        + LEG_OTHER_PLACE_PAYOUT
+    )
+
+
 def calculate_leg_scores(
     betting_state: BettingState,
     first_place: CamelColor,
@@ -182,25 +226,43 @@ def calculate_leg_scores(
 
     Returns tuple of score changes per player.
     """
-    num_players = len(betting_state.player_tickets)
-    scores = [0] * num_players
-
-    for player in range(num_players):
-        # Score betting tickets
-        for ticket in betting_state.player_tickets[player]:
-            if ticket.camel == first_place:
-                scores[player] += ticket.value
-            elif ticket.camel == second_place:
-                scores[player] += LEG_SECOND_PLACE_PAYOUT
+    scores = []
+    # Each player starts from their pyramid tickets (+1 coin each)
+    for tickets, score in zip(
+        betting_state.player_tickets, betting_state.player_pyramid_tickets
+    ):
+        # Score betting tickets. Compared by identity (enum members are
+        # singletons); a (first, second) payout table measured slower.
+        for ticket in tickets:
+            camel = ticket.camel
+            if camel is first_place:
+                score += ticket.value
+            elif camel is second_place:
+                score += LEG_SECOND_PLACE_PAYOUT
             else:
-                scores[player] += LEG_OTHER_PLACE_PAYOUT
-
-        # Score pyramid tickets
-        scores[player] += betting_state.player_pyramid_tickets[player]
+                score += LEG_OTHER_PLACE_PAYOUT
+        scores.append(score)
 
     return tuple(scores)
 
 
+def _score_overall_bets(
+    scores: List[int],
+    bets: Tuple[OverallBet, ...],
+    camel: CamelColor
+) -> None:
+    """Add payouts for bets (in order placed) on the given result camel."""
+    # Payout for the nth correct bet; every bet past the table gets the last
+    last = len(OVERALL_PAYOUTS) - 1
+    correct = 0
+    for bet in bets:
+        if bet.camel is camel:
+            scores[bet.player] += OVERALL_PAYOUTS[correct if correct < last else last]
+            correct += 1
+        else:
+            scores[bet.player] += OVERALL_WRONG_PAYOUT
+
+
 def calculate_overall_scores(
     betting_state: BettingState,
     winner: CamelColor,
@@ -211,30 +273,10 @@ def calculate_overall_scores(
 
     Returns tuple of score changes per player.
     """
-    num_players = len(betting_state.player_tickets)
-    scores = [0] * num_players
-
-    # Score winner bets
-    correct_winner_count = 0
-    for bet in betting_state.winner_bets:
-        if bet.camel == winner:
-            # Get payout based on order (first correct gets 8, etc.)
-            payout_idx = min(correct_winner_count, len(OVERALL_PAYOUTS) - 1)
-            scores[bet.player] += OVERALL_PAYOUTS[payout_idx]
-            correct_winner_count += 1
-        else:
-            scores[bet.player] += OVERALL_WRONG_PAYOUT
-
-    # Score loser bets
-    correct_loser_count = 0
-    for bet in betting_state.loser_bets:
-        if bet.camel == loser:
-            payout_idx = min(correct_loser_count, len(OVERALL_PAYOUTS) - 1)
-            scores[bet.player] += OVERALL_PAYOUTS[payout_idx]
-            correct_loser_count += 1
-        else:
-            scores[bet.player] += OVERALL_WRONG_PAYOUT
-
+    scores = [0] * len(betting_state.player_tickets)
+    # First correct bet gets 8, the next 5, etc.
+    _score_overall_bets(scores, betting_state.winner_bets, winner)
+    _score_overall_bets(scores, betting_state.loser_bets, loser)
     return tuple(scores)
 
 
@@ -270,11 +312,19 @@ class PlayerState:
             available_finish_cards=self.available_finish_cards
         )
 
+    def finish_leg(self, amount: int) -> "PlayerState":
+        """Add leg winnings (as add_coins) and return the spectator tile."""
+        return PlayerState(
+            coins=max(0, self.coins + amount),
+            has_spectator_tile=True,
+            available_finish_cards=self.available_finish_cards
+        )
+
     def use_finish_card(self, camel: CamelColor) -> "PlayerState":
         """Use a finish card for overall betting."""
         if camel not in self.available_finish_cards:
             raise ValueError(f"Finish card for {camel} not available")
-        new_cards = tuple(c for c in self.available_finish_cards if c != camel)
+        new_cards = tuple([c for c in self.available_finish_cards if c is not camel])
         return PlayerState(
             coins=self.coins,
             has_spectator_tile=self.has_spectator_tile,
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property, lru_cache
 from typing import List, Tuple
 
 
@@ -19,11 +20,11 @@ class CamelColor(Enum):
 
     def is_racing_camel(self) -> bool:
         """Check if this is a racing camel (not crazy)."""
-        return self in RACING_CAMELS
+        return self is not _WHITE and self is not _BLACK
 
     def is_crazy_camel(self) -> bool:
         """Check if this is a crazy camel."""
-        return self in CRAZY_CAMELS
+        return self is _WHITE or self is _BLACK
 
 
 # Camel groups
@@ -36,6 +37,11 @@ CRAZY_CAMELS = frozenset({CamelColor.WHITE, CamelColor.BLACK})
 
 ALL_CAMELS = RACING_CAMELS | CRAZY_CAMELS
 
+# Set membership hashes the member through Enum.__hash__, a Python-level
+# call; members are singletons, so hot paths compare against these instead
+_WHITE = CamelColor.WHITE
+_BLACK = CamelColor.BLACK
+
 
 @dataclass(frozen=True)
 class CamelStack:
@@ -76,10 +82,12 @@ class CamelStack:
 
     def position_of(self, camel: CamelColor) -> int | None:
         """Get the position of a camel in the stack (0 = bottom)."""
-        try:
-            return self.camels.index(camel)
-        except ValueError:
-            return None
+        # Membership test first: most lookups miss (e.g. scanning every
+        # space), and a raised ValueError costs far more than the test
+        camels = self.camels
+        if camel in camels:
+            return camels.index(camel)
+        return None
 
     def get_camels_above(self, camel: CamelColor) -> Tuple[CamelColor, ...]:
         """Get all camels sitting on top of the given camel (including itself)."""
@@ -100,13 +108,12 @@ class CamelStack:
         Remove a camel and all camels above it from the stack.
         Returns (remaining_stack, removed_stack).
         """
-        pos = self.position_of(camel)
-        if pos is None:
+        camels = self.camels
+        if camel not in camels:
             return self, CamelStack.empty()
 
-        remaining = CamelStack(camels=self.camels[:pos])
-        removed = CamelStack(camels=self.camels[pos:])
-        return remaining, removed
+        pos = camels.index(camel)
+        return CamelStack(camels=camels[:pos]), CamelStack(camels=camels[pos:])
 
     def add_on_top(self, other: "CamelStack") -> "CamelStack":
         """Add another stack on top of this stack."""
@@ -118,12 +125,16 @@ class CamelStack:
 
     def get_racing_camels(self) -> Tuple[CamelColor, ...]:
         """Get only the racing camels in this stack (in order)."""
-        return tuple(c for c in self.camels if c.is_racing_camel())
+        camels = self.camels
+        # Most stacks carry no crazy camel and are returned as they are
+        if _WHITE not in camels and _BLACK not in camels:
+            return camels
+        return tuple([c for c in camels if c is not _WHITE and c is not _BLACK])
 
     def get_top_racing_camel(self) -> CamelColor | None:
         """Get the topmost racing camel in this stack."""
         for camel in reversed(self.camels):
-            if camel.is_racing_camel():
+            if camel is not _WHITE and camel is not _BLACK:
                 return camel
         return None
 
@@ -156,9 +167,9 @@ class CamelPositions:
         Returns (space, height) where height is position in stack (0 = bottom).
         """
         for space, stack in enumerate(self.stacks):
-            height = stack.position_of(camel)
-            if height is not None:
-                return (space, height)
+            camels = stack.camels
+            if camel in camels:
+                return (space, camels.index(camel))
         return None
 
     def get_camel_space(self, camel: CamelColor) -> int | None:
@@ -266,19 +277,20 @@ class CamelPositions:
         - If tied on space, camel higher in stack is ahead
         - Crazy camels are ignored for ranking
         """
-        ranked: List[Tuple[int, int, CamelColor]] = []
-
-        for space in range(len(self.stacks) - 1, -1, -1):
-            stack = self.stacks[space]
-            for height, camel in enumerate(stack.camels):
-                if camel.is_racing_camel():
-                    # Use negative space and height for sorting (higher = better)
-                    ranked.append((-space, -height, camel))
-
-        # Sort by space (descending), then height (descending)
-        ranked.sort()
-
-        return [camel for _, _, camel in ranked]
+        # A fresh list each call, so callers can't mutate the cached ranking
+        return list(self._ranking)
+
+    @cached_property
+    def _ranking(self) -> Tuple[CamelColor, ...]:
+        """get_ranking, computed once per (immutable) positions object."""
+        # Walking spaces from the back and each stack from the top visits
+        # camels already in ranking order, so nothing needs sorting
+        return tuple([
+            camel
+            for stack in reversed(self.stacks)
+            for camel in reversed(stack.camels)
+            if camel is not _WHITE and camel is not _BLACK
+        ])
 
     def is_camel_finished(self, camel: CamelColor, finish_line: int = 17) -> bool:
         """Check if a camel has crossed the finish line."""
@@ -287,9 +299,11 @@ class CamelPositions:
 
     def any_camel_finished(self, finish_line: int = 17) -> bool:
         """Check if any racing camel has crossed the finish line."""
-        for camel in RACING_CAMELS:
-            if self.is_camel_finished(camel, finish_line):
-                return True
+        # Stacks are indexed by space, so only those past the line can hold one
+        for stack in self.stacks[finish_line:]:
+            for camel in stack.camels:
+                if camel is not _WHITE and camel is not _BLACK:
+                    return True
         return False
 
     def has_racing_camels_on_back(self, crazy_camel: CamelColor) -> bool:
@@ -301,20 +315,15 @@ class CamelPositions:
         """
         if not crazy_camel.is_crazy_camel():
             return False
+        return self._carries_racers(self.find_camel(crazy_camel))
 
-        pos = self.find_camel(crazy_camel)
+    def _carries_racers(self, pos: Tuple[int, int] | None) -> bool:
+        """Whether any racing camel sits above the (space, height) position."""
         if pos is None:
             return False
-
-        space, _ = pos
-        stack = self.get_stack(space)
-
-        # Get all camels above the crazy camel
-        camels_above = stack.get_camels_above(crazy_camel)
-
-        # Check if any of them (excluding the crazy camel itself) are racing camels
-        for camel in camels_above:
-            if camel != crazy_camel and camel.is_racing_camel():
+        space, height = pos
+        for camel in self.stacks[space].camels[height + 1:]:
+            if camel is not _WHITE and camel is not _BLACK:
                 return True
         return False
 
@@ -334,45 +343,23 @@ class CamelPositions:
         Returns:
             The crazy camel that should actually move
         """
-        white_has_racers = self.has_racing_camels_on_back(CamelColor.WHITE)
-        black_has_racers = self.has_racing_camels_on_back(CamelColor.BLACK)
+        # Each crazy camel is located once and reused by both rules
+        white_pos = self.find_camel(_WHITE)
+        black_pos = self.find_camel(_BLACK)
 
         # Rule 1: If only one has racing camels, move that one
-        if white_has_racers and not black_has_racers:
-            return CamelColor.WHITE
-        if black_has_racers and not white_has_racers:
-            return CamelColor.BLACK
-
-        # Rule 2: If they're stacked directly (no racers between), move top one
-        white_pos = self.find_camel(CamelColor.WHITE)
-        black_pos = self.find_camel(CamelColor.BLACK)
+        white_has_racers = self._carries_racers(white_pos)
+        if white_has_racers != self._carries_racers(black_pos):
+            return _WHITE if white_has_racers else _BLACK
 
+        # Rule 2: If they're stacked directly (no racers between), move top one.
+        # Every camel between the two crazy camels is a racing camel, so
+        # stacked directly means adjacent heights.
         if white_pos and black_pos and white_pos[0] == black_pos[0]:
-            # Both on same space - check if stacked directly
-            space = white_pos[0]
-            stack = self.get_stack(space)
-
-            white_height = stack.position_of(CamelColor.WHITE)
-            black_height = stack.position_of(CamelColor.BLACK)
-
-            if white_height is not None and black_height is not None:
-                # Check if they're adjacent in the stack (no camels between)
-                lower_height = min(white_height, black_height)
-                upper_height = max(white_height, black_height)
-
-                # Check if there are any racing camels between them
-                has_racers_between = False
-                for h in range(lower_height + 1, upper_height):
-                    if stack.camels[h].is_racing_camel():
-                        has_racers_between = True
-                        break
-
-                if not has_racers_between:
-                    # Move the one on top
-                    if white_height > black_height:
-                        return CamelColor.WHITE
-                    else:
-                        return CamelColor.BLACK
+            white_height = white_pos[1]
+            black_height = black_pos[1]
+            if abs(white_height - black_height) == 1:
+                return _WHITE if white_height > black_height else _BLACK
 
         # Default: move the camel indicated by the grey die
         return grey_die_camel
@@ -389,6 +376,18 @@ def create_initial_positions(
         dice_rolls: List of (camel_color, roll_value) for racing camels
         crazy_positions: List of (camel_color, space) for crazy camels
     """
+    return _initial_positions(tuple(dice_rolls), tuple(crazy_positions or ()))
+
+
+# Games roll camels in a fixed order, so there are only 3^5 racing layouts
+# times 3^2 crazy ones (2187). The key keeps roll order: camels rolling the
+# same value stack in the order they were rolled.
+@lru_cache(maxsize=4096)
+def _initial_positions(
+    dice_rolls: Tuple[Tuple[CamelColor, int], ...],
+    crazy_positions: Tuple[Tuple[CamelColor, int], ...]
+) -> CamelPositions:
+    """create_initial_positions on hashable arguments (the result is immutable)."""
     positions = CamelPositions.create_empty()
 
     # Place racing camels based on dice rolls
@@ -398,10 +397,9 @@ def create_initial_positions(
             positions = positions.move_camel(camel, roll)
 
     # Place crazy camels at their starting positions
-    if crazy_positions:
-        for camel, space in crazy_positions:
-            if camel.is_crazy_camel():
-                # Crazy camels start at spaces 14-16 based on grey die
-                positions = positions.place_camel(camel, space)
+    for camel, space in crazy_positions:
+        if camel.is_crazy_camel():
+            # Crazy camels start at spaces 14-16 based on grey die
+            positions = positions.place_camel(camel, space)
 
     return positions
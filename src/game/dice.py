@@ -2,9 +2,12 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Tuple, List, FrozenSet
+from functools import lru_cache
+from typing import Dict, Tuple, FrozenSet
 import random
 
+from .camel import CamelColor
+
 
 class DieColor(Enum):
     """Colors for racing dice (matches racing camels)."""
@@ -16,6 +19,18 @@ class DieColor(Enum):
     GREY = "grey"  # For crazy camels
 
 
+# Racing die -> the camel it moves (and back). Cheaper than looking colors
+# up by name (CamelColor[die.name]) on every move.
+DIE_TO_CAMEL: Dict[DieColor, CamelColor] = {
+    DieColor.BLUE: CamelColor.BLUE,
+    DieColor.GREEN: CamelColor.GREEN,
+    DieColor.YELLOW: CamelColor.YELLOW,
+    DieColor.RED: CamelColor.RED,
+    DieColor.PURPLE: CamelColor.PURPLE,
+}
+CAMEL_TO_DIE: Dict[CamelColor, DieColor] = {camel: die for die, camel in DIE_TO_CAMEL.items()}
+
+
 # Racing die faces: 1, 1, 2, 2, 3, 3 (6 faces, uniform distribution)
 RACING_DIE_FACES: Tuple[int, ...] = (1, 1, 2, 2, 3, 3)
 
@@ -37,20 +52,51 @@ class DieRoll:
     crazy_camel: str | None = None
 
 
+# Every possible roll, one shared DieRoll per die face. Picking a face from
+# these draws from the rng exactly as picking from the face tuples does, so
+# seeded games are unchanged, but no DieRoll is built per roll.
+_RACING_ROLLS: Dict[DieColor, Tuple[DieRoll, ...]] = {
+    color: tuple(DieRoll(color=color, value=value) for value in RACING_DIE_FACES)
+    for color in DieColor
+}
+_GREY_ROLLS: Tuple[DieRoll, ...] = tuple(
+    DieRoll(color=DieColor.GREY, value=value, crazy_camel=crazy_camel)
+    for crazy_camel, value in GREY_DIE_FACES
+)
+
+
 def roll_racing_die(color: DieColor, rng: random.Random | None = None) -> DieRoll:
     """Roll a racing die and return the result."""
     if rng is None:
         rng = random.Random()
-    value = rng.choice(RACING_DIE_FACES)
-    return DieRoll(color=color, value=value)
+    return rng.choice(_RACING_ROLLS[color])
 
 
 def roll_grey_die(rng: random.Random | None = None) -> DieRoll:
     """Roll the grey die and return which crazy camel moves and how far."""
     if rng is None:
         rng = random.Random()
-    crazy_camel, value = rng.choice(GREY_DIE_FACES)
-    return DieRoll(color=DieColor.GREY, value=value, crazy_camel=crazy_camel)
+    return rng.choice(_GREY_ROLLS)
+
+
+# Order roll_from_pyramid picks from: fixed, so which die a given rng state
+# selects doesn't depend on frozenset iteration order
+_ROLL_ORDER: Tuple[DieColor, ...] = tuple(DieColor)
+
+
+@lru_cache(maxsize=None)
+def _roll_choices(remaining: FrozenSet[DieColor], grey_rolled: bool) -> Tuple[DieColor, ...]:
+    """Dice a pyramid can still roll. Only 64 pyramids exist, so all are cached."""
+    return tuple([
+        die for die in _ROLL_ORDER
+        if die in remaining or (die is DieColor.GREY and not grey_rolled)
+    ])
+
+
+@lru_cache(maxsize=None)
+def _without(remaining: FrozenSet[DieColor], die: DieColor) -> FrozenSet[DieColor]:
+    """remaining minus one die, shared between pyramids."""
+    return remaining - {die}
 
 
 @dataclass(frozen=True)
@@ -89,11 +135,7 @@ class Pyramid:
         if rng is None:
             rng = random.Random()
 
-        # Build list of available dice
-        available: List[DieColor] = list(self.remaining)
-        if not self.grey_rolled:
-            available.append(DieColor.GREY)
-
+        available = _roll_choices(self.remaining, self.grey_rolled)
         if not available:
             raise ValueError("No dice remaining in pyramid")
 
@@ -101,13 +143,13 @@ class Pyramid:
         selected = rng.choice(available)
 
         # Roll the selected die
-        if selected == DieColor.GREY:
+        if selected is DieColor.GREY:
             roll = roll_grey_die(rng)
             new_pyramid = Pyramid(remaining=self.remaining, grey_rolled=True)
         else:
             roll = roll_racing_die(selected, rng)
             new_pyramid = Pyramid(
-                remaining=self.remaining - {selected},
+                remaining=_without(self.remaining, selected),
                 grey_rolled=self.grey_rolled
             )
 
@@ -2,7 +2,8 @@
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import List, Tuple
+from functools import cached_property
+from typing import Dict, FrozenSet, List, Tuple
 import random
 
 from .camel import (
@@ -10,7 +11,9 @@ from .camel import (
     create_initial_positions
 )
 from .board import Board, TRACK_LENGTH, FINISH_LINE, CRAZY_START_POSITIONS
-from .dice import Pyramid, DieColor, roll_racing_die, roll_grey_die, DieRoll
+from .dice import (
+    Pyramid, DieColor, roll_racing_die, roll_grey_die, DieRoll, DIE_TO_CAMEL, CAMEL_TO_DIE
+)
 from .betting import (
     BettingState, BettingTicket, PlayerState,
     calculate_leg_scores, calculate_overall_scores
@@ -27,6 +30,15 @@ class ActionType(Enum):
     BET_OVERALL_LOSER = auto()  # Bet on overall loser
 
 
+# Action types bound once, so apply_action dispatches on identity checks
+# instead of an enum attribute lookup and == per branch
+_TAKE_BETTING_TICKET = ActionType.TAKE_BETTING_TICKET
+_PLACE_SPECTATOR_TILE = ActionType.PLACE_SPECTATOR_TILE
+_TAKE_PYRAMID_TICKET = ActionType.TAKE_PYRAMID_TICKET
+_BET_OVERALL_WINNER = ActionType.BET_OVERALL_WINNER
+_BET_OVERALL_LOSER = ActionType.BET_OVERALL_LOSER
+
+
 @dataclass(frozen=True)
 class Action:
     """An action a player can take."""
@@ -52,6 +64,34 @@ class Action:
         return str(self.action_type)
 
 
+# Shared Action instances for get_legal_actions. Actions are frozen, so every
+# state can hand out the same objects, and play_game's legality check then
+# matches by identity before falling back to field comparison.
+_LEG_BET_ACTIONS: Dict[CamelColor, Action] = {
+    camel: Action(action_type=ActionType.TAKE_BETTING_TICKET, camel=camel)
+    for camel in RACING_CAMELS
+}
+_OVERALL_BET_ACTIONS: Dict[CamelColor, Tuple[Action, Action]] = {
+    camel: (
+        Action(action_type=ActionType.BET_OVERALL_WINNER, camel=camel),
+        Action(action_type=ActionType.BET_OVERALL_LOSER, camel=camel),
+    )
+    for camel in RACING_CAMELS
+}
+_PYRAMID_ACTION = Action(action_type=ActionType.TAKE_PYRAMID_TICKET)
+_SPECTATOR_ACTIONS: Dict[int, Tuple[Action, Action]] = {
+    space: (
+        Action(action_type=ActionType.PLACE_SPECTATOR_TILE, space=space, is_cheering=True),
+        Action(action_type=ActionType.PLACE_SPECTATOR_TILE, space=space, is_cheering=False),
+    )
+    for space in range(2, TRACK_LENGTH + 1)
+}
+
+
+# Start-of-leg pyramid, shared by every new game and leg (it is immutable)
+_FULL_PYRAMID = Pyramid()
+
+
 @dataclass(frozen=True)
 class GameState:
     """Complete game state."""
@@ -81,7 +121,7 @@ class GameState:
         # Roll for initial racing camel positions
         camel_rolls = []
         for camel in RACING_CAMELS:
-            die_color = DieColor[camel.name]
+            die_color = CAMEL_TO_DIE[camel]
             roll = roll_racing_die(die_color, rng)
             camel_rolls.append((camel, roll.value))
 
@@ -107,7 +147,7 @@ class GameState:
         betting = BettingState.create_for_players(num_players)
 
         # Create pyramid
-        pyramid = Pyramid()
+        pyramid = _FULL_PYRAMID
 
         return cls(
             board=board,
@@ -130,52 +170,51 @@ class GameState:
 
     def get_legal_actions(self) -> List[Action]:
         """Get all legal actions for the current player."""
+        # A fresh list each call, so callers can't mutate the cached actions
+        return list(self._legal_actions)
+
+    def is_legal(self, action: Action) -> bool:
+        """Whether the current player may take this action."""
+        return action in self._legal_action_set
+
+    @cached_property
+    def _legal_action_set(self) -> FrozenSet[Action]:
+        """Legal actions as a set, for membership tests without a list scan."""
+        return frozenset(self._legal_actions)
+
+    @cached_property
+    def _legal_actions(self) -> Tuple[Action, ...]:
+        """get_legal_actions, computed once per (immutable) state."""
         if self.is_game_over:
-            return []
+            return ()
 
-        actions = []
         player_state = self.get_current_player_state()
 
         # Action 1: Take betting ticket
-        for ticket in self.betting.get_all_available_tickets():
-            actions.append(Action(
-                action_type=ActionType.TAKE_BETTING_TICKET,
-                camel=ticket.camel
-            ))
+        available = self.betting.available_tickets
+        actions = [
+            _LEG_BET_ACTIONS[camel]
+            for camel in RACING_CAMELS
+            if available.get(camel)
+        ]
 
         # Action 2: Place spectator tile (if available)
         if player_state.has_spectator_tile:
             valid_spaces = self.board.get_valid_spectator_spaces(self.current_player)
             for space in valid_spaces:
                 # Can place either side
-                actions.append(Action(
-                    action_type=ActionType.PLACE_SPECTATOR_TILE,
-                    space=space,
-                    is_cheering=True
-                ))
-                actions.append(Action(
-                    action_type=ActionType.PLACE_SPECTATOR_TILE,
-                    space=space,
-                    is_cheering=False
-                ))
+                actions.extend(_SPECTATOR_ACTIONS[space])
 
         # Action 3: Take pyramid ticket (roll dice)
         if not self.pyramid.is_leg_complete():
-            actions.append(Action(action_type=ActionType.TAKE_PYRAMID_TICKET))
+            actions.append(_PYRAMID_ACTION)
 
         # Action 4: Bet on overall winner/loser
         for camel in RACING_CAMELS:
             if player_state.can_bet_on_overall(camel):
-                actions.append(Action(
-                    action_type=ActionType.BET_OVERALL_WINNER,
-                    camel=camel
-                ))
-                actions.append(Action(
-                    action_type=ActionType.BET_OVERALL_LOSER,
-                    camel=camel
-                ))
+                actions.extend(_OVERALL_BET_ACTIONS[camel])
 
-        return actions
+        return tuple(actions)
 
     def apply_action(
         self,
@@ -206,18 +245,19 @@ class GameState:
         player = self.current_player
         player_state = self.players[player]
 
-        if action.action_type == ActionType.TAKE_BETTING_TICKET:
+        action_type = action.action_type
+        if action_type is _TAKE_BETTING_TICKET:
             # Take a betting ticket
             new_betting = self.betting.take_ticket(player, action.camel)
 
-        elif action.action_type == ActionType.PLACE_SPECTATOR_TILE:
+        elif action_type is _PLACE_SPECTATOR_TILE:
             # Place spectator tile
             new_board = self.board.place_spectator_tile(
                 action.space, player, action.is_cheering
             )
             new_players[player] = player_state.use_spectator_tile()
 
-        elif action.action_type == ActionType.TAKE_PYRAMID_TICKET:
+        elif action_type is _TAKE_PYRAMID_TICKET:
             # Take pyramid ticket and roll dice
             new_betting = self.betting.take_pyramid_ticket(player)
             new_last_pyramid_player = player  # Track for starting player rule
@@ -238,7 +278,7 @@ class GameState:
                 )
             else:
                 # Racing die - move racing camel
-                camel = CamelColor[die_roll.color.name]
+                camel = DIE_TO_CAMEL[die_roll.color]
                 new_board, spectator_owner = new_board.move_camel(
                     camel, die_roll.value
                 )
@@ -249,14 +289,14 @@ class GameState:
                     get_tile_payout()
                 )
 
-        elif action.action_type == ActionType.BET_OVERALL_WINNER:
+        elif action_type is _BET_OVERALL_WINNER:
             # Bet on overall winner
             new_betting = self.betting.place_overall_bet(
                 player, action.camel, is_winner_bet=True
             )
             new_players[player] = player_state.use_finish_card(action.camel)
 
-        elif action.action_type == ActionType.BET_OVERALL_LOSER:
+        elif action_type is _BET_OVERALL_LOSER:
             # Bet on overall loser
             new_betting = self.betting.place_overall_bet(
                 player, action.camel, is_winner_bet=False
@@ -279,24 +319,29 @@ class GameState:
 
             if first and second:
                 leg_scores = calculate_leg_scores(new_betting, first, second)
-                for i, score in enumerate(leg_scores):
-                    new_players[i] = new_players[i].add_coins(score)
+            else:
+                leg_scores = (0,) * len(new_players)
 
-            if not is_game_over:
+            if is_game_over:
+                new_players = [
+                    p.add_coins(score) for p, score in zip(new_players, leg_scores)
+                ]
+            else:
                 # Reset for new leg
-                new_pyramid = Pyramid()
+                new_pyramid = _FULL_PYRAMID
                 new_betting = new_betting.reset_for_new_leg()
                 new_board = new_board.clear_all_spectator_tiles()
 
-                # Return spectator tiles to players
-                for i in range(len(new_players)):
-                    new_players[i] = new_players[i].return_spectator_tile()
+                # Pay leg bets and return spectator tiles in one update each
+                new_players = [
+                    p.finish_leg(score) for p, score in zip(new_players, leg_scores)
+                ]
 
                 new_leg_number += 1
 
-        # Process game end
+        # Process game end (ranking is still the one leg scoring used:
+        # the board doesn't change between the two)
         if is_game_over:
-            ranking = new_board.get_ranking()
             winner = ranking[0] if ranking else None
             loser = ranking[-1] if ranking else None
 
@@ -8,7 +8,9 @@ from .renderer import (
 )
 from ..game.camel import CamelColor, RACING_CAMELS
 from ..game.board import Board, TRACK_LENGTH, FINISH_LINE, CRAZY_START_POSITIONS
-from ..game.dice import DieColor, DieRoll, roll_racing_die, roll_grey_die
+from ..game.dice import (
+    DieColor, DieRoll, roll_racing_die, roll_grey_die, DIE_TO_CAMEL, CAMEL_TO_DIE
+)
 from ..game.game import ActionType
 from ..game.betting import calculate_leg_scores
 
@@ -56,7 +58,7 @@ class GameLogger:
             rng = random.Random(seed)
             self.log("Initial placement:")
             for camel in RACING_CAMELS:
-                die_color = DieColor[camel.name]
+                die_color = CAMEL_TO_DIE[camel]
                 roll = roll_racing_die(die_color, rng)
                 space = roll.value
                 # Check if another camel is already on that space
@@ -130,7 +132,7 @@ class GameLogger:
                     self.log(f"    {_CAMEL_FULL_NAMES[camel]} moves {old_space}->{new_space}")
         else:
             color_name = die_roll.color.value.capitalize()
-            camel = CamelColor[die_roll.color.name]
+            camel = DIE_TO_CAMEL[die_roll.color]
             old_space = old_board.camel_positions.get_camel_space(camel)
             new_space = new_board.camel_positions.get_camel_space(camel)
             self.log(f"  Die: {color_name} rolled {die_roll.value} -> {color_name} moves {old_space}->{new_space}")
@@ -150,7 +152,7 @@ class GameLogger:
             old_space = old_state.board.camel_positions.get_camel_space(camel)
             natural_target = old_space - die_roll.value
         else:
-            camel = CamelColor[die_roll.color.name]
+            camel = DIE_TO_CAMEL[die_roll.color]
             old_space = old_state.board.camel_positions.get_camel_space(camel)
             natural_target = old_space + die_roll.value
 
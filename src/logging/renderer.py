@@ -1,5 +1,7 @@
 """Board and state rendering for human-readable game logs."""
 
+from functools import lru_cache
+
 from ..game.board import Board, TRACK_LENGTH, FINISH_LINE
 from ..game.camel import CamelColor, RACING_CAMELS, CRAZY_CAMELS
 from ..game.dice import Pyramid
@@ -94,7 +96,12 @@ def render_ranking(board):
 
     Format: Ranking: Red 1st, Green 2nd, Yellow 3rd, Blue 4th, Purple 5th
     """
-    ranking = board.get_ranking()
+    return _render_ranking_cached(tuple(board.get_ranking()))
+
+
+@lru_cache(maxsize=None)
+def _render_ranking_cached(ranking):
+    """Format a ranking tuple; at most 5! distinct rankings are seen."""
     parts = []
     for i, camel in enumerate(ranking):
         ordinal = _ORDINALS.get(i + 1, f"{i + 1}th")
@@ -108,11 +115,17 @@ def render_pyramid(pyramid):
 
     Format: Remaining dice: Blue, Green, Yellow | Grey: available
     """
+    return _render_pyramid_cached(pyramid.remaining, pyramid.grey_rolled)
+
+
+@lru_cache(maxsize=None)
+def _render_pyramid_cached(remaining, grey_rolled):
+    """Format a pyramid state; at most 2^6 distinct states exist."""
     racing_names = []
-    for die in sorted(pyramid.remaining, key=lambda d: d.value):
+    for die in sorted(remaining, key=lambda d: d.value):
         racing_names.append(die.value.capitalize())
 
-    grey_status = "available" if not pyramid.grey_rolled else "rolled"
+    grey_status = "available" if not grey_rolled else "rolled"
     if racing_names:
         return f"Remaining dice: {', '.join(racing_names)} | Grey: {grey_status}"
     else:
@@ -0,0 +1,10 @@
+"""Process-pool settings shared by everything that fans work out to workers."""
+
+import multiprocessing
+import sys
+
+# fork starts workers with every module already imported. Other platforms
+# keep their default (spawn): fork is unsafe on macOS and absent on Windows.
+POOL_CONTEXT = multiprocessing.get_context(
+    "fork" if sys.platform.startswith("linux") else None
+)
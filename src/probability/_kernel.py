@@ -0,0 +1,209 @@
+"""Integer simulation kernel for the probability calculator.
+
+The enumeration in calculator.py applies millions of single-die moves.
+Doing that on Board/CamelPositions objects means rebuilding tuples of
+CamelStack dataclasses on every move, so the hot loop works on a packed
+representation instead:
+
+- state: 7-tuple indexed by camel (racing camels in CamelColor order, then
+  White and Black), each entry space * 8 + height (0 = bottom of stack),
+  or -1 if the camel is not on the board
+- tiles: space -> movement modifier (+1 cheering, -1 booing)
+
+Packed values sort like (space, height), so ranking is a sort on the ints.
+The rules mirror Board.move_camel, CamelPositions.move_camel and
+CamelPositions.get_crazy_camel_to_move exactly.
+"""
+
+from typing import Dict, List, Tuple
+
+from ..game.board import Board, FINISH_LINE
+from ..game.camel import CamelColor
+
+State = Tuple[int, ...]
+
+# Camel order used for state indices
+KERNEL_CAMELS: Tuple[CamelColor, ...] = (
+    CamelColor.BLUE,
+    CamelColor.GREEN,
+    CamelColor.YELLOW,
+    CamelColor.RED,
+    CamelColor.PURPLE,
+    CamelColor.WHITE,
+    CamelColor.BLACK,
+)
+CAMEL_INDEX: Dict[CamelColor, int] = {camel: i for i, camel in enumerate(KERNEL_CAMELS)}
+
+NUM_RACING = 5
+WHITE = 5
+BLACK = 6
+ABSENT = -1
+
+_HEIGHT_BITS = 3
+_HEIGHT_MASK = (1 << _HEIGHT_BITS) - 1
+
+# Packed values at or past the finish line
+FINISHED = FINISH_LINE << _HEIGHT_BITS
+
+
+def pack_board(board: Board) -> Tuple[State, Dict[int, int]]:
+    """Convert a Board into (state, tiles) for the kernel."""
+    state = [ABSENT] * len(KERNEL_CAMELS)
+    for space, stack in enumerate(board.camel_positions.stacks):
+        for height, camel in enumerate(stack.camels):
+            state[CAMEL_INDEX[camel]] = (space << _HEIGHT_BITS) | height
+    tiles = {
+        space: tile.movement_modifier
+        for space, tile in board.spectator_tiles.items()
+    }
+    return tuple(state), tiles
+
+
+# Bits per camel in pack_key: packed values (plus one, so ABSENT is 0) stay
+# below 2**9 as long as spaces stay below 64
+_KEY_BITS = 9
+
+
+def pack_key(state: State) -> int:
+    """
+    The whole state as one int, for memo keys.
+
+    Small ints hash and compare far faster than 7-tuples and take a
+    fraction of the memory, and the encoding is injective.
+    """
+    key = 0
+    for p in state:
+        key = (key << _KEY_BITS) | (p + 1)
+    return key
+
+
+def space_of(packed: int) -> int:
+    """Space of a packed camel position (which must not be ABSENT)."""
+    return packed >> _HEIGHT_BITS
+
+
+def move(state: State, camel: int, spaces: int, tiles: Dict[int, int]) -> Tuple[State, int]:
+    """
+    Move a camel (and everything on top of it), applying spectator tiles.
+
+    Returns:
+        (new_state, landing_space) where landing_space is -1 if the camel
+        is not on the board or ends on the space it started from.
+    """
+    packed = state[camel]
+    if packed < 0:
+        return state, -1
+
+    origin = packed >> _HEIGHT_BITS
+    height = packed & _HEIGHT_MASK
+
+    target = origin + spaces
+    modifier = tiles.get(target, 0)
+    target += modifier
+    if target < 1:
+        target = 1
+
+    # Camels already at the target (when target == origin: those below the mover)
+    num_moving = 0
+    num_at_target = 0
+    for p in state:
+        if p >= 0:
+            s = p >> _HEIGHT_BITS
+            if s == origin and (p & _HEIGHT_MASK) >= height:
+                num_moving += 1
+            elif s == target:
+                num_at_target += 1
+
+    base = target << _HEIGHT_BITS
+    new_state = list(state)
+    if modifier < 0:
+        # Booing tile: moving stack goes underneath
+        for i, p in enumerate(state):
+            if p >= 0:
+                s = p >> _HEIGHT_BITS
+                if s == origin and (p & _HEIGHT_MASK) >= height:
+                    new_state[i] = base | ((p & _HEIGHT_MASK) - height)
+                elif s == target:
+                    new_state[i] = p + num_moving
+    else:
+        offset = num_at_target - height
+        for i, p in enumerate(state):
+            if p >= 0 and p >> _HEIGHT_BITS == origin and (p & _HEIGHT_MASK) >= height:
+                new_state[i] = base | ((p & _HEIGHT_MASK) + offset)
+
+    return tuple(new_state), (target if target != origin else -1)
+
+
+def racing_finished(state: State) -> bool:
+    """Whether any racing camel has crossed the finish line."""
+    return max(state[:NUM_RACING]) >= FINISHED
+
+
+# Bits holding the camel index in a ranked_keys entry
+_RANK_KEY_BITS = 3
+RANK_KEY_CAMEL = (1 << _RANK_KEY_BITS) - 1
+
+
+def ranked_keys(state: State) -> List[int]:
+    """
+    Racing camels on the board, 1st to last, each as its packed position
+    shifted left by 3 with the camel index in the low bits (key & 7).
+
+    Packed positions are unique, so the keys sort by position alone and
+    need no sort key or tuple of indices.
+    """
+    keys = sorted([
+        state[0] << _RANK_KEY_BITS,
+        state[1] << _RANK_KEY_BITS | 1,
+        state[2] << _RANK_KEY_BITS | 2,
+        state[3] << _RANK_KEY_BITS | 3,
+        state[4] << _RANK_KEY_BITS | 4,
+    ], reverse=True)
+    if keys[-1] < 0:
+        # Absent camels (-1) give negative keys
+        keys = [key for key in keys if key >= 0]
+    return keys
+
+
+def ranking(state: State) -> Tuple[int, ...]:
+    """Racing camel indices on the board, 1st to last."""
+    return tuple(key & RANK_KEY_CAMEL for key in ranked_keys(state))
+
+
+def has_racing_camels_on_back(state: State, crazy: int) -> bool:
+    """Whether any racing camel sits above the given crazy camel."""
+    packed = state[crazy]
+    if packed < 0:
+        return False
+    # Same space and higher = strictly between packed and the next space
+    next_space = ((packed >> _HEIGHT_BITS) + 1) << _HEIGHT_BITS
+    for i in range(NUM_RACING):
+        if packed < state[i] < next_space:
+            return True
+    return False
+
+
+def crazy_camel_to_move(state: State, shown: int) -> int:
+    """Crazy camel that actually moves when the grey die shows `shown`."""
+    white_has_racers = has_racing_camels_on_back(state, WHITE)
+    black_has_racers = has_racing_camels_on_back(state, BLACK)
+
+    # Rule 1: if only one carries racing camels, move that one
+    if white_has_racers and not black_has_racers:
+        return WHITE
+    if black_has_racers and not white_has_racers:
+        return BLACK
+
+    # Rule 2: stacked directly (no racing camels between) - move the top one
+    white = state[WHITE]
+    black = state[BLACK]
+    if white >= 0 and black >= 0 and white >> _HEIGHT_BITS == black >> _HEIGHT_BITS:
+        lower, upper = min(white, black), max(white, black)
+        for i in range(NUM_RACING):
+            if lower < state[i] < upper:
+                break
+        else:
+            return WHITE if white > black else BLACK
+
+    # Rule 3: the camel shown on the die
+    return shown
@@ -5,17 +5,44 @@ for camel rankings at the end of a leg.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from itertools import permutations, product
-from typing import Dict, List, Tuple, FrozenSet
-from collections import defaultdict
+from math import factorial, perm
+import multiprocessing
+from typing import Dict, Iterable, Iterator, List, Tuple, FrozenSet
 
-from ..game.board import Board
+from ..game.betting import expected_leg_ticket_payout
+from ..game.board import Board, FINISH_LINE, TRACK_LENGTH
 from ..game.camel import CamelColor, CamelPositions, RACING_CAMELS
-from ..game.dice import DieColor
+from ..game.dice import DieColor, DIE_TO_CAMEL
+from ..parallel import POOL_CONTEXT
+from . import _kernel
 
 # Possible values for racing dice (each has 1/3 probability)
 DICE_VALUES = (1, 2, 3)
 
+# Pyramid state as a 6-bit mask: bit i set = die i (in this order)
+_DIE_BITS: Dict[DieColor, int] = {
+    DieColor.BLUE: 1,
+    DieColor.GREEN: 2,
+    DieColor.YELLOW: 4,
+    DieColor.RED: 8,
+    DieColor.PURPLE: 16,
+    DieColor.GREY: 32,
+}
+_BIT_TO_DIE: Dict[int, DieColor] = {bit: die for die, bit in _DIE_BITS.items()}
+_RACING_DICE_MASK = 0x1F
+_ALL_DICE_MASK = 0x3F
+
+# Ranking counts are kept in one flat list: the counts for a camel finishing
+# 1st..5th sit at _RANK_ROW[camel] + 0..4.
+_RACING_ORDER: Tuple[CamelColor, ...] = _kernel.KERNEL_CAMELS[:_kernel.NUM_RACING]
+_NUM_RANKS = len(_RACING_ORDER)
+_RACING_INDEX: Dict[CamelColor, int] = {camel: i for i, camel in enumerate(_RACING_ORDER)}
+_RANK_ROW: Dict[CamelColor, int] = {
+    camel: i * _NUM_RANKS for camel, i in _RACING_INDEX.items()
+}
+
 
 @dataclass(frozen=True)
 class LegOutcome:
@@ -88,6 +115,14 @@ class RankingProbabilities:
         """Probability that camel finishes first or second."""
         return self.prob_first(camel) + self.prob_second(camel)
     
+    def first_second_table(self) -> Dict[CamelColor, Tuple[float, float]]:
+        """(P(1st), P(2nd)) for every racing camel, in RACING_CAMELS order."""
+        table = {}
+        for camel in RACING_CAMELS:
+            row = self.probabilities.get(camel, (0,))
+            table[camel] = (row[0], row[1] if len(row) > 1 else 0.0)
+        return table
+    
     def expected_leg_payout(self, camel: CamelColor, ticket_value: int) -> float:
         """
         Expected payout for a leg betting ticket.
@@ -96,34 +131,95 @@ class RankingProbabilities:
         - 2nd place: +1
         - Other: -1
         """
-        p_first = self.prob_first(camel)
-        p_second = self.prob_second(camel)
-        p_other = 1.0 - p_first - p_second
-        
-        return (p_first * ticket_value) + (p_second * 1) + (p_other * -1)
+        return expected_leg_ticket_payout(
+            self.prob_first(camel), self.prob_second(camel), ticket_value
+        )
+
+
+def _dice_mask(dice) -> int:
+    """Encode a collection of dice as a 6-bit mask (bit i = die i)."""
+    mask = 0
+    for die in dice:
+        mask |= _DIE_BITS[die]
+    return mask
 
 
-def get_remaining_dice(rolled_dice: FrozenSet[DieColor], include_grey: bool = True) -> List[DieColor]:
+def get_remaining_dice(
+    rolled_dice: FrozenSet[DieColor] | int,
+    include_grey: bool = True
+) -> List[DieColor]:
     """
     Get dice that haven't been rolled yet this leg.
     
     Args:
-        rolled_dice: Set of dice already rolled
+        rolled_dice: Set of dice already rolled, or its bitmask encoding
+            (see _DIE_BITS)
         include_grey: Whether to include grey die if not rolled
     
     Returns:
-        List of remaining dice colors
+        List of remaining dice colors (racing dice first, grey last)
     """
-    all_racing = {DieColor.BLUE, DieColor.GREEN, DieColor.YELLOW, 
-                  DieColor.RED, DieColor.PURPLE}
-    remaining = list(all_racing - rolled_dice)
-    
-    if include_grey and DieColor.GREY not in rolled_dice:
-        remaining.append(DieColor.GREY)
+    if isinstance(rolled_dice, int):
+        rolled_mask = rolled_dice
+    else:
+        rolled_mask = _dice_mask(rolled_dice)
+
+    all_mask = _ALL_DICE_MASK if include_grey else _RACING_DICE_MASK
+    remaining_mask = all_mask & ~rolled_mask
+
+    # Pop the lowest set bit until the mask is empty
+    remaining = []
+    while remaining_mask:
+        bit = remaining_mask & -remaining_mask
+        remaining.append(_BIT_TO_DIE[bit])
+        remaining_mask ^= bit
     
     return remaining
 
 
+def _sequence_depth(num_dice: int, depth_limit: int | None) -> int:
+    """Number of dice in each enumerated sequence."""
+    return num_dice if depth_limit is None else min(depth_limit, num_dice)
+
+
+@lru_cache(maxsize=None)
+def _order_indices(num_dice: int, depth: int) -> Tuple[Tuple[int, ...], ...]:
+    """Index orderings of `depth` of `num_dice` dice, built once per shape."""
+    return tuple(permutations(range(num_dice), depth))
+
+
+def count_dice_sequences(num_dice: int, depth_limit: int | None = None) -> int:
+    """
+    Number of sequences enumerate_dice_sequences yields for num_dice dice:
+    N! x 3^N, or P(N,d) x 3^d with depth_limit=d.
+    """
+    d = _sequence_depth(num_dice, depth_limit)
+    return perm(num_dice, d) * len(DICE_VALUES) ** d
+
+
+def iter_dice_sequences(
+    remaining_dice: List[DieColor],
+    depth_limit: int | None = None
+) -> Iterator[Tuple[Tuple[DieColor, int], ...]]:
+    """
+    Lazily yield the sequences of enumerate_dice_sequences, in the same
+    order, without materializing the full list.
+    """
+    n = len(remaining_dice)
+    d = _sequence_depth(n, depth_limit)
+    if d == 0:
+        yield ()
+        return
+
+    # Each die's (die, value) pairs, built once: product() then assembles
+    # the sequences in C instead of zipping dice with values per sequence
+    faces = [tuple((die, value) for value in DICE_VALUES) for die in remaining_dice]
+    # All possible orderings of d dice chosen from remaining, each with all
+    # value combinations (1, 2, or 3 for each die)
+    for order in _order_indices(n, d):
+        yield from product(*[faces[i] for i in order])
+
+
 def enumerate_dice_sequences(
     remaining_dice: List[DieColor],
     depth_limit: int | None = None
@@ -135,6 +231,8 @@ def enumerate_dice_sequences(
     With depth_limit=d, generates P(N,d) x 3^d partial sequences.
     Each sequence is a tuple of (die_color, value) pairs.
 
+    Callers that iterate once should use iter_dice_sequences instead.
+
     Args:
         remaining_dice: List of dice colors still in pyramid
         depth_limit: If set, only enumerate the next d dice instead of all.
@@ -143,23 +241,7 @@ def enumerate_dice_sequences(
     Returns:
         List of all possible dice sequences
     """
-    if not remaining_dice:
-        return [()]
-
-    d = len(remaining_dice) if depth_limit is None else min(depth_limit, len(remaining_dice))
-    if d == 0:
-        return [()]
-
-    sequences = []
-
-    # All possible orderings of d dice chosen from remaining
-    for dice_order in permutations(remaining_dice, d):
-        # All possible value combinations (1, 2, or 3 for each die)
-        for values in product(DICE_VALUES, repeat=d):
-            sequence = tuple(zip(dice_order, values))
-            sequences.append(sequence)
-
-    return sequences
+    return list(iter_dice_sequences(remaining_dice, depth_limit))
 
 
 def simulate_sequence(
@@ -193,7 +275,7 @@ def simulate_sequence(
             pass
         else:
             # Racing die - move corresponding camel
-            camel = CamelColor[die_color.name]
+            camel = DIE_TO_CAMEL[die_color]
             current_board, _ = current_board.move_camel(camel, value)
     
     # Get final ranking
@@ -228,6 +310,8 @@ def simulate_sequence_with_grey(
     """
     Simulate a sequence including grey die at a specific position.
 
+    Runs on the packed kernel rather than rebuilding a Board per die.
+
     Args:
         board: Current board state
         racing_sequence: Sequence of racing die rolls
@@ -241,11 +325,6 @@ def simulate_sequence_with_grey(
     Returns:
         LegOutcome with final ranking, spaces landed, and game finish status
     """
-    current_board = board
-    racing_idx = 0
-    spaces_landed = []
-    game_finished = False
-
     total_dice = len(racing_sequence) + (1 if grey_outcome else 0)
 
     # A leg ends when 1 die remains in the pyramid. When grey is included,
@@ -258,44 +337,640 @@ def simulate_sequence_with_grey(
     else:
         dice_to_simulate = len(racing_sequence)
 
+    state, tiles = _kernel.pack_board(board)
+    movers = [_kernel.CAMEL_INDEX[DIE_TO_CAMEL[die]] for die, _ in racing_sequence]
+    move = _kernel.move
+    racing_idx = 0
+    spaces_landed = []
+    game_finished = False
     for i in range(dice_to_simulate):
         if grey_outcome and i == grey_position:
-            # Roll grey die
             grey_camel_shown, value = grey_outcome
-            # Apply crazy camel rules to determine which one actually moves
-            actual_camel = current_board.camel_positions.get_crazy_camel_to_move(grey_camel_shown)
-            old_space = current_board.camel_positions.get_camel_space(actual_camel)
-            current_board, _ = current_board.move_camel(actual_camel, -value)
-            new_space = current_board.camel_positions.get_camel_space(actual_camel)
-            # Track landing space (for spectator tile calculation)
-            if new_space != old_space:
-                spaces_landed.append(new_space)
+            crazy = _kernel.crazy_camel_to_move(state, _kernel.CAMEL_INDEX[grey_camel_shown])
+            state, landed = move(state, crazy, -value, tiles)
+        elif racing_idx < len(racing_sequence):
+            state, landed = move(state, movers[racing_idx], racing_sequence[racing_idx][1], tiles)
+            racing_idx += 1
         else:
-            # Roll racing die
-            if racing_idx < len(racing_sequence):
-                die_color, value = racing_sequence[racing_idx]
-                camel = CamelColor[die_color.name]
-                old_space = current_board.camel_positions.get_camel_space(camel)
-                current_board, _ = current_board.move_camel(camel, value)
-                new_space = current_board.camel_positions.get_camel_space(camel)
-                # Track landing space
-                if new_space is not None and (old_space is None or new_space != old_space):
-                    spaces_landed.append(new_space)
-                racing_idx += 1
-
-        # Check if game finished (any racing camel crossed finish line)
-        if current_board.is_game_over():
+            continue
+        if landed >= 0:
+            spaces_landed.append(landed)
+        if _kernel.racing_finished(state):
             game_finished = True
             break
 
-    ranking = tuple(current_board.get_ranking())
     return LegOutcome(
-        ranking=ranking,
+        ranking=tuple([_RACING_ORDER[camel] for camel in _kernel.ranking(state)]),
         spaces_landed=tuple(spaces_landed),
         game_finished=game_finished
     )
 
 
+def _max_steps(tiles: Dict[int, int]) -> Tuple[int, int]:
+    """
+    Furthest a stack can travel on one die, forward (racing) and backward
+    (crazy): 3 spaces, plus one if a tile can extend the move that way.
+    """
+    forward = max(DICE_VALUES) + (1 if any(m > 0 for m in tiles.values()) else 0)
+    backward = max(DICE_VALUES) + (1 if any(m < 0 for m in tiles.values()) else 0)
+    return forward, backward
+
+
+def _completions(num_racing: int, grey_available: bool) -> int:
+    """
+    Number of equally likely enumeration outcomes below a node whose
+    pyramid holds num_racing racing dice (plus grey if available): every
+    order of the pyramid times every face of every die in it.
+    """
+    if grey_available:
+        return factorial(num_racing + 1) * 3 ** num_racing * 6
+    return factorial(num_racing) * 3 ** num_racing
+
+
+# _completions for every pyramid, indexed [grey_available][num_racing]; the
+# depth-first enumeration looks one up per node
+_COMPLETIONS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(_completions(n, grey) for n in range(len(_RACING_ORDER) + 1))
+    for grey in (False, True)
+)
+
+
+# Landing count slots for a board that has not grown past its initial
+# TRACK_LENGTH + 5 spaces (see _num_space_slots)
+_DEFAULT_SPACE_SLOTS = TRACK_LENGTH + 5 + max(DICE_VALUES) + 1
+
+
+def _num_space_slots(state: _kernel.State) -> int:
+    """
+    Length of a landing-count list indexed by space: a move ends at most
+    one die face plus one tile past the furthest camel.
+    """
+    furthest = _kernel.space_of(max(state)) if max(state) >= 0 else 0
+    return max(_DEFAULT_SPACE_SLOTS, furthest + max(DICE_VALUES) + 2)
+
+
+def _new_ranking_counts() -> List[int]:
+    """Zeroed flat ranking counts (see _RANK_ROW)."""
+    return [0] * (_NUM_RANKS * _NUM_RANKS)
+
+
+def _ranking_probs_from_counts(
+    ranking_counts: List[int],
+    total_outcomes: int
+) -> Dict[CamelColor, Tuple[float, ...]]:
+    """
+    Convert flat ranking counts into per-camel rank probabilities.
+
+    Counts stay exact integers until this single division: the enumeration
+    is exhaustive, so a running (Welford-style) average could not stop
+    early and would only add rounding error and a division per outcome.
+    """
+    if total_outcomes == 0:
+        return {camel: (0.0,) * _NUM_RANKS for camel in _RACING_ORDER}
+    scale = 1.0 / total_outcomes
+    return {
+        camel: tuple(count * scale for count in ranking_counts[row:row + _NUM_RANKS])
+        for camel, row in _RANK_ROW.items()
+    }
+
+
+def _find_commuting_die(
+    state: _kernel.State,
+    tiles: Dict[int, int],
+    racing_mask: int,
+    grey_available: bool,
+    draws: int
+) -> int:
+    """
+    Find a remaining racing die whose move commutes with all other moves.
+
+    A die qualifies when its camel stands alone, no other camel can reach
+    its origin or any of its landing spaces within the remaining draws,
+    and no camel can cross the finish line. Then every ordering of the
+    draws gives the same board as rolling that die first.
+
+    Returns:
+        Kernel index of the die's camel, or -1 if no die qualifies.
+    """
+    spaces = [_kernel.space_of(p) if p >= 0 else -1 for p in state]
+    forward, backward = _max_steps(tiles)
+    other_reach = forward * (draws - 1)
+    # A crazy camel (and anything on its back) may go backward once
+    back_reach = backward if grey_available else 0
+
+    mask = racing_mask
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+        moving = bit.bit_length() - 1
+        origin = spaces[moving]
+        if origin < 0:
+            continue
+
+        furthest = origin
+        for value in DICE_VALUES:
+            target = origin + value
+            target += tiles.get(target, 0)
+            furthest = max(furthest, target)
+        if furthest >= FINISH_LINE:
+            continue
+
+        # Another camel in range (including on the same space) blocks it
+        low = origin - other_reach
+        high = furthest + back_reach
+        for camel, space in enumerate(spaces):
+            if camel == moving or space < 0:
+                continue
+            if low <= space <= high:
+                break
+            if camel < _kernel.NUM_RACING and space + other_reach >= FINISH_LINE:
+                break
+        else:
+            return moving
+
+    return -1
+
+
+# Subtrees with fewer draws left than this are not memoized. Even one-draw
+# subtrees repeat often enough that a lookup beats re-simulating them.
+_MEMO_MIN_DRAWS = 1
+
+
+class _LegTally:
+    """Weighted outcome counts accumulated by _enumerate_leg."""
+
+    __slots__ = ("ranking_counts", "space_counts", "win_counts", "lose_counts",
+                 "game_ends", "memo")
+
+    def __init__(self, track_landings: bool, num_spaces: int = _DEFAULT_SPACE_SLOTS):
+        self.ranking_counts = _new_ranking_counts()
+        # None = ranking-only enumeration (allows collapsing grey values)
+        # Indexed by space; num_spaces slots (see _num_space_slots)
+        self.space_counts: List[int] | None = [0] * num_spaces if track_landings else None
+        # Indexed like _RACING_ORDER
+        self.win_counts = [0] * _NUM_RANKS
+        self.lose_counts = [0] * _NUM_RANKS
+        self.game_ends = 0
+        # Transposition table: node key -> counts its subtree adds per unit weight
+        self.memo: Dict[int, tuple] = {}
+
+    def snapshot(self) -> tuple:
+        """Copy of the current counts, for unit_delta."""
+        return (
+            self.ranking_counts[:],
+            self.space_counts[:] if self.space_counts is not None else None,
+            self.win_counts[:],
+            self.lose_counts[:],
+            self.game_ends,
+        )
+
+    def unit_delta(self, before: tuple, weight: int) -> tuple:
+        """
+        Counts added since snapshot `before`, divided by weight. Every count
+        in a subtree is a multiple of the subtree's weight, so this is exact.
+        """
+        ranking, spaces, wins, loses, game_ends = before
+        space_delta = None
+        if spaces is not None:
+            # Sparse: a subtree lands on only a few spaces
+            space_delta = {
+                space: (now - then) // weight
+                for space, (now, then) in enumerate(zip(self.space_counts, spaces))
+                if now != then
+            }
+        return (
+            [(now - then) // weight for now, then in zip(self.ranking_counts, ranking)],
+            space_delta,
+            [(now - then) // weight for now, then in zip(self.win_counts, wins)],
+            [(now - then) // weight for now, then in zip(self.lose_counts, loses)],
+            (self.game_ends - game_ends) // weight,
+        )
+
+    def add_scaled(self, delta: tuple, weight: int) -> None:
+        """Add a unit_delta result scaled by weight."""
+        ranking, spaces, wins, loses, game_ends = delta
+        counts = self.ranking_counts
+        for i, count in enumerate(ranking):
+            if count:
+                counts[i] += count * weight
+        if spaces:
+            space_counts = self.space_counts
+            for space, count in spaces.items():
+                space_counts[space] += count * weight
+        if game_ends:
+            for i in range(_NUM_RANKS):
+                self.win_counts[i] += wins[i] * weight
+                self.lose_counts[i] += loses[i] * weight
+            self.game_ends += game_ends * weight
+
+    def add_leaf(self, state: _kernel.State, weight: int, finished: bool) -> None:
+        """Record the final positions of weight enumeration outcomes."""
+        keys = _kernel.ranked_keys(state)
+        camel_bits = _kernel.RANK_KEY_CAMEL
+        counts = self.ranking_counts
+        for pos, key in enumerate(keys):
+            counts[(key & camel_bits) * _NUM_RANKS + pos] += weight
+        if finished:
+            self.game_ends += weight
+            if keys:
+                self.win_counts[keys[0] & camel_bits] += weight
+                self.lose_counts[keys[-1] & camel_bits] += weight
+
+
+def _enumerate_leg(
+    state: _kernel.State,
+    racing_mask: int,
+    grey_available: bool,
+    draws: int,
+    weight: int,
+    tiles: Dict[int, int],
+    tally: _LegTally
+) -> None:
+    """
+    Depth-first enumeration of the remaining draws of a leg.
+
+    Sequences sharing a prefix share its simulation: each node applies one
+    die to its parent's positions. Each leaf is weighted by the number of
+    full enumeration outcomes it stands for (see _completions), and a
+    landing by the outcomes below it, so counts equal the flat enumeration's.
+
+    A die whose move commutes with the rest (see _find_commuting_die) is
+    applied once instead of being tried at every position in the order:
+    drawn, it stands for `draws` orderings; left in the pyramid, for its
+    3 faces.
+
+    Different orders often reach the same positions with the same dice left
+    (moves that never meet commute). Such subtrees are enumerated once and
+    replayed from tally.memo.
+    """
+    key = None
+    if draws >= _MEMO_MIN_DRAWS:
+        # Dice left (5 bits), grey (1 bit), draws (3 bits) below the state
+        key = (((_kernel.pack_key(state) << 5 | racing_mask) << 1 | grey_available) << 3) | draws
+        delta = tally.memo.get(key)
+        if delta is not None:
+            tally.add_scaled(delta, weight)
+            return
+        before = tally.snapshot()
+
+    _expand_leg_node(state, racing_mask, grey_available, draws, weight, tiles, tally)
+
+    if key is not None:
+        tally.memo[key] = tally.unit_delta(before, weight)
+
+
+def _expand_leg_node(
+    state: _kernel.State,
+    racing_mask: int,
+    grey_available: bool,
+    draws: int,
+    weight: int,
+    tiles: Dict[int, int],
+    tally: _LegTally
+) -> None:
+    """Enumerate the children of one _enumerate_leg node."""
+    num_racing = racing_mask.bit_count()
+    space_counts = tally.space_counts
+    move = _kernel.move
+    completions = _COMPLETIONS
+
+    def visit(camel: int, spaces: int, mask: int, grey: bool, child_weight: int) -> None:
+        child, landed = move(state, camel, spaces, tiles)
+        subtree = child_weight * completions[grey][mask.bit_count()]
+        if space_counts is not None and landed >= 0:
+            space_counts[landed] += subtree
+        finished = _kernel.racing_finished(child)
+        if draws == 1 or finished:
+            tally.add_leaf(child, subtree, finished)
+        else:
+            _enumerate_leg(child, mask, grey, draws - 1, child_weight, tiles, tally)
+
+    camel = _find_commuting_die(state, tiles, racing_mask, grey_available, draws)
+    if camel >= 0:
+        rest = racing_mask & ~(1 << camel)
+        for value in DICE_VALUES:
+            visit(camel, value, rest, grey_available, weight * draws)
+        if draws < num_racing + grey_available:
+            # The die is the one left in the pyramid
+            _enumerate_leg(state, rest, grey_available, draws, weight * len(DICE_VALUES), tiles, tally)
+        return
+
+    mask = racing_mask
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+        camel = bit.bit_length() - 1
+        rest = racing_mask ^ bit
+        for value in DICE_VALUES:
+            visit(camel, value, rest, grey_available, weight)
+
+    if grey_available:
+        for shown in (_kernel.WHITE, _kernel.BLACK):
+            crazy = _kernel.crazy_camel_to_move(state, shown)
+            if space_counts is None and not _kernel.has_racing_camels_on_back(state, crazy):
+                # Moving alone it cannot reorder racing camels: any value will do
+                visit(crazy, -1, racing_mask, False, weight * len(DICE_VALUES))
+            else:
+                for value in DICE_VALUES:
+                    visit(crazy, -value, racing_mask, False, weight)
+
+
+@dataclass
+class _CamelGroup:
+    """Camels whose moves can only ever affect each other (see _split_leg)."""
+    camels: List[int]  # kernel indices
+    racing_mask: int  # remaining racing dice moving these camels
+    grey: bool  # whether the grey die moves these camels
+    low: int = 0  # lowest space reachable this leg
+    high: int = 0  # highest space reachable this leg
+
+    @property
+    def num_dice(self) -> int:
+        return self.racing_mask.bit_count() + self.grey
+
+
+def _split_leg(
+    state: _kernel.State,
+    tiles: Dict[int, int],
+    racing_mask: int,
+    grey_available: bool
+) -> List[_CamelGroup] | None:
+    """
+    Partition the camels into groups that cannot meet during the leg.
+
+    Each group's camels are only moved by its own dice, so they stay within
+    [lowest space - a crazy move, highest space + one full step per die].
+    Groups whose ranges overlap are merged until the ranges are disjoint.
+    The crazy camels share a group when grey is available, since which one
+    moves depends on both.
+
+    Returns:
+        The groups in track order, or None if the leg does not split into
+        two or more groups with dice, or a camel could finish.
+    """
+    forward, backward = _max_steps(tiles)
+    groups = []
+    crazy_group = None
+    for camel, packed in enumerate(state):
+        if packed < 0:
+            continue
+        is_racing = camel < _kernel.NUM_RACING
+        if grey_available and not is_racing and crazy_group is not None:
+            crazy_group.camels.append(camel)
+            space = _kernel.space_of(packed)
+            crazy_group.low = min(crazy_group.low, space)
+            crazy_group.high = max(crazy_group.high, space)
+            continue
+        space = _kernel.space_of(packed)
+        group = _CamelGroup(
+            camels=[camel],
+            racing_mask=racing_mask & (1 << camel) if is_racing else 0,
+            grey=grey_available and not is_racing,
+            low=space,
+            high=space,
+        )
+        groups.append(group)
+        if group.grey:
+            crazy_group = group
+
+    if _dice_for_absent_camels(state, racing_mask):
+        return None
+    if grey_available and crazy_group is None:
+        # Grey die with no crazy camel on the board: rolls, moves nothing
+        groups.append(_CamelGroup(camels=[], racing_mask=0, grey=True, low=-1, high=-1))
+
+    def reach(group: _CamelGroup) -> Tuple[int, int]:
+        if not group.camels:
+            return group.low, group.high
+        return (group.low - (backward if group.grey else 0),
+                group.high + forward * group.num_dice)
+
+    merged = True
+    while merged:
+        merged = False
+        groups.sort(key=lambda g: reach(g)[0])
+        result = [groups[0]]
+        for group in groups[1:]:
+            last = result[-1]
+            if group.camels and last.camels and reach(group)[0] <= reach(last)[1]:
+                last.camels.extend(group.camels)
+                last.racing_mask |= group.racing_mask
+                last.grey = last.grey or group.grey
+                last.low = min(last.low, group.low)
+                last.high = max(last.high, group.high)
+                merged = True
+            else:
+                result.append(group)
+        groups = result
+
+    if sum(1 for g in groups if g.num_dice) < 2:
+        return None
+    for group in groups:
+        if any(c < _kernel.NUM_RACING for c in group.camels) and reach(group)[1] >= FINISH_LINE:
+            return None
+    return groups
+
+
+def _dice_for_absent_camels(state: _kernel.State, racing_mask: int) -> bool:
+    """Whether any remaining racing die belongs to a camel not on the board."""
+    return any(racing_mask >> camel & 1 and state[camel] < 0 for camel in range(_kernel.NUM_RACING))
+
+
+def _tally_split_leg(
+    state: _kernel.State,
+    tiles: Dict[int, int],
+    groups: List[_CamelGroup],
+    grey_available: bool,
+    tally: _LegTally
+) -> None:
+    """
+    Enumerate each independent group on its own and combine the counts.
+
+    A full draw order is an interleaving of the groups' own orders, so a
+    combination of group outcomes stands for a multinomial number of full
+    outcomes. With grey available the die left in the pyramid belongs to
+    one group: that group runs with its last die left out, the others with
+    all dice drawn. Because groups occupy disjoint stretches of track, a
+    camel's rank is its rank within its group plus a fixed offset, so counts
+    combine group by group with no cross product.
+    """
+    track_landings = tally.space_counts is not None
+    sizes = [group.num_dice for group in groups]
+    totals = [_COMPLETIONS[group.grey][group.racing_mask.bit_count()] for group in groups]
+    denominator = 1
+    for size in sizes:
+        denominator *= factorial(size)
+
+    if grey_available:
+        # Interleavings when group j holds the left-out die: (|P|-1)! n_j / prod n_i!
+        left_out = [factorial(sum(sizes) - 1) * size // denominator for size in sizes]
+        all_drawn = [sum(left_out) - m for m in left_out]
+    else:
+        left_out = [0] * len(groups)
+        all_drawn = [factorial(sum(sizes)) // denominator] * len(groups)
+
+    def run(group: _CamelGroup, draws: int, total: int) -> _LegTally:
+        sub = _LegTally(track_landings, len(tally.space_counts or ()))
+        if draws == 0:
+            sub.add_leaf(state, total, False)
+        else:
+            _enumerate_leg(state, group.racing_mask, group.grey, draws, 1, tiles, sub)
+        return sub
+
+    for i, group in enumerate(groups):
+        others = 1
+        for j, total in enumerate(totals):
+            if j != i:
+                others *= total
+        parts = [(run(group, sizes[i], totals[i]), all_drawn[i] * others)]
+        if left_out[i]:
+            parts.append((run(group, sizes[i] - 1, totals[i]), left_out[i] * others))
+
+        rows = [camel * _NUM_RANKS for camel in group.camels if camel < _kernel.NUM_RACING]
+        for sub, factor in parts:
+            for row in rows:
+                for pos in range(row, row + _NUM_RANKS):
+                    tally.ranking_counts[pos] += sub.ranking_counts[pos] * factor
+            if track_landings:
+                for space, count in enumerate(sub.space_counts):
+                    if count:
+                        tally.space_counts[space] += count * factor
+
+
+def _pack_leg(
+    board: Board,
+    remaining_racing_dice: List[DieColor]
+) -> Tuple[_kernel.State, Dict[int, int], Tuple[int, ...]]:
+    """Kernel (state, tiles) plus the remaining dice as sorted camel indices."""
+    state, tiles = _kernel.pack_board(board)
+    camels = tuple(sorted(_kernel.CAMEL_INDEX[DIE_TO_CAMEL[die]] for die in remaining_racing_dice))
+    return state, tiles, camels
+
+
+def _tally_full_leg(
+    state: _kernel.State,
+    tiles: Dict[int, int],
+    camels: Iterable[int],
+    grey_available: bool,
+    tally: _LegTally
+) -> int:
+    """
+    Enumerate every remaining draw of the leg into tally (with grey, the
+    last die stays in the pyramid). Returns the total outcome count.
+    """
+    # A racing camel's kernel index is also its die's bit (see _DIE_BITS)
+    racing_mask = 0
+    for camel in camels:
+        racing_mask |= 1 << camel
+    draws = racing_mask.bit_count()
+    total_outcomes = _COMPLETIONS[grey_available][draws]
+    if draws == 0:
+        tally.add_leaf(state, total_outcomes, False)
+        return total_outcomes
+
+    groups = _split_leg(state, tiles, racing_mask, grey_available)
+    if groups is not None:
+        _tally_split_leg(state, tiles, groups, grey_available, tally)
+    else:
+        _enumerate_leg(state, racing_mask, grey_available, draws, 1, tiles, tally)
+    return total_outcomes
+
+
+def _tally_depth_limited(
+    state: _kernel.State,
+    tiles: Dict[int, int],
+    camels: Tuple[int, ...],
+    grey_available: bool,
+    depth_limit: int,
+    tally: _LegTally
+) -> int:
+    """
+    Enumerate the next depth_limit dice into tally, counting exactly what
+    simulate_sequence_with_grey gives over iter_dice_sequences x grey
+    outcomes x grey positions. Returns the total outcome count.
+
+    Simulation and counting are fused on kernel state: each racing
+    sequence's moves are applied once, and the grey die is spliced in
+    after every prefix. All racing dice of a sequence are always rolled,
+    so grey position p means "after min(p, len(sequence)) racing dice";
+    positions past the end of the sequence all land on its last slot.
+
+    In ranking-only mode a crazy camel with no racing camels on its back
+    cannot reorder them however far it moves (ranking ignores crazy
+    camels, and racing stacks keep their relative order when they land on
+    or under it), so its three values are simulated once with weight 3.
+    """
+    num_slots = depth_limit
+    depth = _sequence_depth(len(camels), depth_limit - 1 if grey_available else depth_limit)
+
+    space_counts = tally.space_counts
+    move = _kernel.move
+    racing_finished = _kernel.racing_finished
+    num_values = len(DICE_VALUES)
+    num_sequences = 0
+
+    def record(final: _kernel.State, landings: List[int], weight: int, finished: bool) -> None:
+        if space_counts is not None:
+            for landed in landings:
+                if landed >= 0:
+                    space_counts[landed] += weight
+        tally.add_leaf(final, weight, finished)
+
+    for order in _order_indices(len(camels), depth):
+        for values in product(DICE_VALUES, repeat=depth):
+            num_sequences += 1
+            moves = [(camels[i], value) for i, value in zip(order, values)]
+
+            # Positions after each racing prefix, up to the end of the leg
+            prefix = [state]
+            landings = []
+            finished_at = -1
+            current = state
+            for camel, value in moves:
+                current, landed = move(current, camel, value, tiles)
+                prefix.append(current)
+                landings.append(landed)
+                if racing_finished(current):
+                    finished_at = len(landings)
+                    break
+
+            if not grey_available:
+                record(current, landings, 1, finished_at >= 0)
+                continue
+
+            for k in range(depth + 1):
+                # Grey positions that roll the grey die after k racing dice
+                slot_weight = 1 if k < depth else num_slots - depth
+                if 0 <= finished_at <= k:
+                    # Leg over before the grey die: all its faces agree
+                    record(current, landings, slot_weight * 2 * num_values, True)
+                    continue
+
+                base = prefix[k]
+                for shown in (_kernel.WHITE, _kernel.BLACK):
+                    crazy = _kernel.crazy_camel_to_move(base, shown)
+                    if space_counts is None and not _kernel.has_racing_camels_on_back(base, crazy):
+                        grey_values, weight = DICE_VALUES[:1], slot_weight * num_values
+                    else:
+                        grey_values, weight = DICE_VALUES, slot_weight
+                    for grey_value in grey_values:
+                        # Moving backwards cannot finish the race
+                        after, landed = move(base, crazy, -grey_value, tiles)
+                        suffix = [landed]
+                        finished = False
+                        for camel, value in moves[k:]:
+                            after, landed = move(after, camel, value, tiles)
+                            suffix.append(landed)
+                            if racing_finished(after):
+                                finished = True
+                                break
+                        record(after, landings[:k] + suffix, weight, finished)
+
+    if grey_available:
+        return num_sequences * 2 * num_values * num_slots
+    return num_sequences
+
+
 def calculate_ranking_probabilities(
     board: Board,
     remaining_racing_dice: List[DieColor],
@@ -318,71 +993,54 @@ def calculate_ranking_probabilities(
         RankingProbabilities with exact probabilities
     """
     # Count occurrences of each ranking
-    ranking_counts: Dict[CamelColor, List[int]] = {
-        camel: [0] * 5 for camel in RACING_CAMELS
-    }
-    total_outcomes = 0
-
-    if grey_die_available and depth_limit is not None:
-        # Depth-limited with grey die: grey takes one slot
-        racing_depth = depth_limit - 1
-        racing_sequences = enumerate_dice_sequences(remaining_racing_dice, depth_limit=racing_depth)
-        grey_outcomes = enumerate_grey_die_outcomes()
-
-        for racing_seq in racing_sequences:
-            for grey_outcome in grey_outcomes:
-                for grey_pos in range(depth_limit):
-                    outcome = simulate_sequence_with_grey(
-                        board, racing_seq, grey_outcome, grey_pos,
-                        total_dice_to_simulate=depth_limit
-                    )
-
-                    for pos, camel in enumerate(outcome.ranking):
-                        if camel in ranking_counts:
-                            ranking_counts[camel][pos] += 1
-
-                    total_outcomes += 1
-
-    elif grey_die_available:
-        # Full enumeration with grey die
-        racing_sequences = enumerate_dice_sequences(remaining_racing_dice)
-        grey_outcomes = enumerate_grey_die_outcomes()
-        num_total_dice = len(remaining_racing_dice) + 1
-
-        for racing_seq in racing_sequences:
-            for grey_outcome in grey_outcomes:
-                for grey_pos in range(num_total_dice):
-                    outcome = simulate_sequence_with_grey(
-                        board, racing_seq, grey_outcome, grey_pos
-                    )
-
-                    for pos, camel in enumerate(outcome.ranking):
-                        if camel in ranking_counts:
-                            ranking_counts[camel][pos] += 1
-
-                    total_outcomes += 1
+    state, tiles, camels = _pack_leg(board, remaining_racing_dice)
+    tally = _LegTally(track_landings=False)
+    if depth_limit is None:
+        # Full enumeration, depth-first
+        total_outcomes = _tally_full_leg(state, tiles, camels, grey_die_available, tally)
     else:
-        # No grey die (with or without depth_limit)
-        racing_sequences = enumerate_dice_sequences(remaining_racing_dice, depth_limit=depth_limit)
-        for racing_seq in racing_sequences:
-            outcome = simulate_sequence_with_grey(board, racing_seq, None, None)
+        # Depth-limited (with grey, the grey die takes one slot)
+        total_outcomes = _tally_depth_limited(
+            state, tiles, camels, grey_die_available, depth_limit, tally
+        )
 
-            for pos, camel in enumerate(outcome.ranking):
-                if camel in ranking_counts:
-                    ranking_counts[camel][pos] += 1
+    # Convert counts to probabilities
+    probabilities = _ranking_probs_from_counts(tally.ranking_counts, total_outcomes)
+    return RankingProbabilities(probabilities=probabilities)
 
-            total_outcomes += 1
 
-    # Convert counts to probabilities
-    probabilities = {}
-    for camel, counts in ranking_counts.items():
-        if total_outcomes > 0:
-            probs = tuple(count / total_outcomes for count in counts)
-        else:
-            probs = tuple(0.0 for _ in counts)
-        probabilities[camel] = probs
+def calculate_expected_payouts(
+    board: Board,
+    remaining_racing_dice: List[DieColor],
+    grey_die_available: bool,
+    tickets: Dict[CamelColor, int],
+    depth_limit: int | None = None
+) -> Dict[CamelColor, float]:
+    """
+    Expected leg-ticket payouts without computing space landings or
+    game-end statistics.
 
-    return RankingProbabilities(probabilities=probabilities)
+    Leg-ticket EV is linear in the 1st/2nd place probabilities, so only
+    the ranking distribution is needed; this uses the ranking-only path
+    (which aggregates grey outcomes that cannot change the ranking).
+
+    Args:
+        board: Current board state
+        remaining_racing_dice: Racing dice still in pyramid
+        grey_die_available: Whether grey die hasn't been rolled yet
+        tickets: Camel -> value of the top available leg ticket
+        depth_limit: Optional lookahead limit (see calculate_ranking_probabilities)
+
+    Returns:
+        Camel -> expected payout of taking that ticket
+    """
+    probs = calculate_ranking_probabilities(
+        board, remaining_racing_dice, grey_die_available, depth_limit=depth_limit
+    )
+    return {
+        camel: probs.expected_leg_payout(camel, value)
+        for camel, value in tickets.items()
+    }
 
 
 def calculate_probabilities_from_game_state(board: Board, grey_rolled: bool) -> RankingProbabilities:
@@ -438,94 +1096,93 @@ def calculate_all_probabilities(
             remaining. Models bounded lookahead (e.g. human cognition).
 
     Returns:
-        FullProbabilities with all calculated values
+        FullProbabilities with all calculated values. Results are cached
+        (see _calculate_all_packed), but each call gets its own copy.
+    """
+    state, tiles, camels = _pack_leg(board, remaining_racing_dice)
+    return _copy_probabilities(_calculate_all_packed(
+        state, tuple(sorted(tiles.items())), camels, grey_die_available, depth_limit
+    ))
+
+
+def _copy_probabilities(full: FullProbabilities) -> FullProbabilities:
+    """
+    A FullProbabilities with fresh dicts, so callers can't alter the cached one.
+
+    The dicts are small (at most one entry per camel or space), so
+    copying costs nothing next to an enumeration.
     """
+    overall = full.overall_race
+    return FullProbabilities(
+        ranking=RankingProbabilities(probabilities=dict(full.ranking.probabilities)),
+        space_landings=SpaceLandingProbabilities(
+            space_probs=dict(full.space_landings.space_probs)
+        ),
+        overall_race=OverallRaceProbabilities(
+            win_probs=dict(overall.win_probs),
+            lose_probs=dict(overall.lose_probs),
+            prob_game_ends=overall.prob_game_ends
+        )
+    )
+
+
+# Number of recent calculate_all_probabilities results kept
+_RESULT_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_RESULT_CACHE_SIZE)
+def _calculate_all_packed(
+    state: _kernel.State,
+    tile_items: Tuple[Tuple[int, int], ...],
+    camels: Tuple[int, ...],
+    grey_die_available: bool,
+    depth_limit: int | None
+) -> FullProbabilities:
+    """
+    calculate_all_probabilities on hashable packed arguments (see _pack_leg).
+
+    The result depends only on positions, tile modifiers and the dice
+    left, so repeated queries (agents re-evaluating a position, analysis
+    of a search tree) are answered from the cache.
+    """
+    tiles = dict(tile_items)
+
     # Count occurrences
-    ranking_counts: Dict[CamelColor, List[int]] = {
-        camel: [0] * 5 for camel in RACING_CAMELS
-    }
-    space_landing_counts: Dict[int, int] = defaultdict(int)
-    win_counts: Dict[CamelColor, int] = {camel: 0 for camel in RACING_CAMELS}
-    lose_counts: Dict[CamelColor, int] = {camel: 0 for camel in RACING_CAMELS}
-    game_ends_count = 0
-    total_outcomes = 0
-
-    def _record_outcome(outcome):
-        nonlocal total_outcomes, game_ends_count
-        # Record ranking - count positions among racing camels only
-        racing_pos = 0
-        for camel in outcome.ranking:
-            if camel in ranking_counts:
-                ranking_counts[camel][racing_pos] += 1
-                racing_pos += 1
-
-        # Record space landings
-        for space in outcome.spaces_landed:
-            space_landing_counts[space] += 1
-
-        # Record game end outcomes
-        if outcome.game_finished:
-            game_ends_count += 1
-            if outcome.ranking:
-                racing_ranking = [c for c in outcome.ranking if c in RACING_CAMELS]
-                if racing_ranking:
-                    winner = racing_ranking[0]
-                    loser = racing_ranking[-1]
-                    win_counts[winner] += 1
-                    lose_counts[loser] += 1
-
-        total_outcomes += 1
-
-    if grey_die_available and depth_limit is not None:
-        # Depth-limited with grey die: grey takes one slot
-        racing_depth = depth_limit - 1
-        racing_sequences = enumerate_dice_sequences(remaining_racing_dice, depth_limit=racing_depth)
-        grey_outcomes = enumerate_grey_die_outcomes()
-
-        for racing_seq in racing_sequences:
-            for grey_outcome in grey_outcomes:
-                for grey_pos in range(depth_limit):
-                    outcome = simulate_sequence_with_grey(
-                        board, racing_seq, grey_outcome, grey_pos,
-                        total_dice_to_simulate=depth_limit
-                    )
-                    _record_outcome(outcome)
-
-    elif grey_die_available:
-        # Full enumeration with grey die
-        racing_sequences = enumerate_dice_sequences(remaining_racing_dice)
-        grey_outcomes = enumerate_grey_die_outcomes()
-        num_total_dice = len(remaining_racing_dice) + 1
-
-        for racing_seq in racing_sequences:
-            for grey_outcome in grey_outcomes:
-                for grey_pos in range(num_total_dice):
-                    outcome = simulate_sequence_with_grey(
-                        board, racing_seq, grey_outcome, grey_pos
-                    )
-                    _record_outcome(outcome)
+    tally = _LegTally(track_landings=True, num_spaces=_num_space_slots(state))
+    if depth_limit is None:
+        # Full enumeration, depth-first: shared prefixes are simulated once
+        total_outcomes = _tally_full_leg(state, tiles, camels, grey_die_available, tally)
     else:
-        # No grey die (with or without depth_limit)
-        racing_sequences = enumerate_dice_sequences(remaining_racing_dice, depth_limit=depth_limit)
-        for racing_seq in racing_sequences:
-            outcome = simulate_sequence_with_grey(board, racing_seq, None, None)
-            _record_outcome(outcome)
+        # Depth-limited (with grey, the grey die takes one slot)
+        total_outcomes = _tally_depth_limited(
+            state, tiles, camels, grey_die_available, depth_limit, tally
+        )
+    ranking_counts = tally.ranking_counts
+    space_landing_counts = tally.space_counts
+    # Indexed like _RACING_ORDER
+    win_counts = tally.win_counts
+    lose_counts = tally.lose_counts
+    game_ends_count = tally.game_ends
 
     # Convert counts to probabilities
     if total_outcomes > 0:
-        ranking_probs = {
-            camel: tuple(count / total_outcomes for count in counts)
-            for camel, counts in ranking_counts.items()
-        }
+        ranking_probs = _ranking_probs_from_counts(ranking_counts, total_outcomes)
+        scale = 1.0 / total_outcomes
         space_probs = {
-            space: count / total_outcomes
-            for space, count in space_landing_counts.items()
+            space: count * scale
+            for space, count in enumerate(space_landing_counts)
+            if count
         }
-        prob_game_ends = game_ends_count / total_outcomes
+        prob_game_ends = game_ends_count * scale
 
         if game_ends_count > 0:
-            win_probs = {camel: count / game_ends_count for camel, count in win_counts.items()}
-            lose_probs = {camel: count / game_ends_count for camel, count in lose_counts.items()}
+            end_scale = 1.0 / game_ends_count
+            win_probs = {
+                camel: count * end_scale for camel, count in zip(_RACING_ORDER, win_counts)
+            }
+            lose_probs = {
+                camel: count * end_scale for camel, count in zip(_RACING_ORDER, lose_counts)
+            }
         else:
             # Game doesn't end this leg - use leg ranking as estimate
             win_probs = {camel: ranking_probs[camel][0] for camel in RACING_CAMELS}
@@ -546,3 +1203,42 @@ def calculate_all_probabilities(
             prob_game_ends=prob_game_ends
         )
     )
+
+
+def _calculate_scenario(
+    scenario: Tuple[Board, List[DieColor], bool, int | None]
+) -> FullProbabilities:
+    """Run one batch scenario. Module-level for multiprocessing."""
+    return calculate_all_probabilities(*scenario)
+
+
+def calculate_all_probabilities_batch(
+    scenarios: Iterable[Tuple[Board, List[DieColor], bool]],
+    depth_limit: int | None = None,
+    num_workers: int = 1
+) -> List[FullProbabilities]:
+    """
+    calculate_all_probabilities for many positions, e.g. every candidate
+    state in a search.
+
+    Each scenario is independent, so with num_workers > 1 they are spread
+    over a process pool (one whole calculation per task, as the simulation
+    runner does with games). A new pool is started per call.
+
+    Pool workers are daemonic and may not start pools of their own, so when
+    called from inside one (e.g. an agent playing in SimulationRunner) the
+    scenarios are calculated in-process regardless of num_workers.
+
+    Args:
+        scenarios: (board, remaining_racing_dice, grey_die_available) tuples
+        depth_limit: Lookahead limit applied to every scenario
+        num_workers: Worker processes; 1 runs in this process
+
+    Returns:
+        FullProbabilities per scenario, in input order
+    """
+    jobs = [(board, list(dice), grey, depth_limit) for board, dice, grey in scenarios]
+    if num_workers == 1 or len(jobs) < 2 or multiprocessing.current_process().daemon:
+        return [_calculate_scenario(job) for job in jobs]
+    with POOL_CONTEXT.Pool(processes=num_workers) as pool:
+        return pool.map(_calculate_scenario, jobs)
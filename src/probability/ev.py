@@ -5,10 +5,11 @@ probability distribution of outcomes.
 """
 
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import Dict, List, Tuple
 
-from ..game.camel import CamelColor, RACING_CAMELS
-from ..game.betting import TICKET_VALUES, OVERALL_PAYOUTS
+from ..game.camel import CamelColor
+from ..game.betting import TICKET_VALUES, OVERALL_PAYOUTS, expected_leg_ticket_payout
 from .calculator import (
     RankingProbabilities, SpaceLandingProbabilities,
     OverallRaceProbabilities, FullProbabilities
@@ -33,8 +34,7 @@ class BettingEVs:
     
     def best_leg_bet(self) -> Tuple[CamelColor, float]:
         """Return the best leg bet and its EV."""
-        best_camel = max(self.leg_ticket_evs, key=self.leg_ticket_evs.get)
-        return best_camel, self.leg_ticket_evs[best_camel]
+        return max(self.leg_ticket_evs.items(), key=itemgetter(1))
     
     def should_take_pyramid(self) -> bool:
         """Whether pyramid ticket (+1) is better than best leg bet."""
@@ -63,12 +63,28 @@ def calculate_leg_ticket_ev(
     Returns:
         Expected value in coins
     """
-    p_first = probs.prob_first(camel)
-    p_second = probs.prob_second(camel)
-    p_other = 1.0 - p_first - p_second
-    
-    ev = (p_first * ticket_value) + (p_second * 1) + (p_other * -1)
-    return ev
+    return expected_leg_ticket_payout(
+        probs.prob_first(camel), probs.prob_second(camel), ticket_value
+    )
+
+
+def _leg_ticket_ev_table(
+    probs: RankingProbabilities,
+    available_tickets: Dict[CamelColor, Tuple[int, ...]]
+) -> List[Tuple[CamelColor, int, float]]:
+    """
+    (camel, top ticket value, EV) for every camel with a ticket left, in
+    RACING_CAMELS order: calculate_leg_ticket_ev for all camels in one
+    pass over the probability table.
+    """
+    table = []
+    for camel, (p_first, p_second) in probs.first_second_table().items():
+        tickets = available_tickets.get(camel, ())
+        if tickets:
+            top_value = tickets[0]  # Top ticket has highest value
+            ev = expected_leg_ticket_payout(p_first, p_second, top_value)
+            table.append((camel, top_value, ev))
+    return table
 
 
 def calculate_all_leg_ticket_evs(
@@ -85,13 +101,7 @@ def calculate_all_leg_ticket_evs(
     Returns:
         Map of camel -> EV for taking their top ticket
     """
-    evs = {}
-    for camel in RACING_CAMELS:
-        tickets = available_tickets.get(camel, ())
-        if tickets:
-            top_ticket_value = tickets[0]  # Top ticket has highest value
-            evs[camel] = calculate_leg_ticket_ev(probs, camel, top_ticket_value)
-    return evs
+    return {camel: ev for camel, _, ev in _leg_ticket_ev_table(probs, available_tickets)}
 
 
 def calculate_pyramid_ticket_ev() -> float:
@@ -120,15 +130,18 @@ def calculate_overall_bet_ev(
     Payouts for correct: 8, 5, 3, 2, 1, 1, 1, 1 (by position)
     Payout for incorrect: -1
     """
-    if position_in_queue >= len(OVERALL_PAYOUTS):
-        payout_if_correct = 1  # Beyond the list, assume +1
-    else:
-        payout_if_correct = OVERALL_PAYOUTS[position_in_queue]
-
+    payout_if_correct = _overall_payout(position_in_queue)
     ev = (prob_correct * payout_if_correct) + ((1 - prob_correct) * -1)
     return ev
 
 
+def _overall_payout(position_in_queue: int) -> int:
+    """Payout of a correct overall bet at this queue position."""
+    if position_in_queue >= len(OVERALL_PAYOUTS):
+        return 1  # Beyond the list, assume +1
+    return OVERALL_PAYOUTS[position_in_queue]
+
+
 def calculate_spectator_tile_ev(
     space_probs: SpaceLandingProbabilities,
     space: int
@@ -245,18 +258,14 @@ def rank_actions_by_ev(
     Returns:
         List of ActionEV sorted by EV (highest first)
     """
-    actions = []
-
     # Leg betting tickets
-    for camel in RACING_CAMELS:
-        tickets = available_tickets.get(camel, ())
-        if tickets:
-            top_value = tickets[0]
-            ev = calculate_leg_ticket_ev(probs, camel, top_value)
-            actions.append(ActionEV(
-                action_description=f"Bet on {camel.value} (ticket value {top_value})",
-                expected_value=ev
-            ))
+    actions = [
+        ActionEV(
+            action_description=f"Bet on {camel.value} (ticket value {top_value})",
+            expected_value=ev
+        )
+        for camel, top_value, ev in _leg_ticket_ev_table(probs, available_tickets)
+    ]
 
     # Pyramid ticket
     actions.append(ActionEV(
@@ -293,18 +302,17 @@ def rank_all_actions_by_ev(
     Returns:
         List of ActionEV sorted by EV (highest first)
     """
-    actions = []
+    # Each group is computed in one pass over its probability table, with
+    # payouts looked up once rather than per action
 
     # Leg betting tickets
-    for camel in RACING_CAMELS:
-        tickets = available_tickets.get(camel, ())
-        if tickets:
-            top_value = tickets[0]
-            ev = calculate_leg_ticket_ev(full_probs.ranking, camel, top_value)
-            actions.append(ActionEV(
-                action_description=f"Leg bet: {camel.value} (value {top_value})",
-                expected_value=ev
-            ))
+    actions = [
+        ActionEV(
+            action_description=f"Leg bet: {camel.value} (value {top_value})",
+            expected_value=ev
+        )
+        for camel, top_value, ev in _leg_ticket_ev_table(full_probs.ranking, available_tickets)
+    ]
 
     # Pyramid ticket
     actions.append(ActionEV(
@@ -313,32 +321,28 @@ def rank_all_actions_by_ev(
     ))
 
     # Spectator tiles
-    for space in valid_spectator_spaces:
-        ev = calculate_spectator_tile_ev(full_probs.space_landings, space)
-        actions.append(ActionEV(
+    space_landings = full_probs.space_landings
+    actions.extend(
+        ActionEV(
             action_description=f"Spectator tile: space {space}",
-            expected_value=ev
-        ))
-
-    # Overall winner bets
-    for camel in available_finish_cards:
-        ev = calculate_overall_winner_bet_ev(
-            full_probs.overall_race, camel, num_winner_bets_placed
+            expected_value=calculate_spectator_tile_ev(space_landings, space)
         )
-        actions.append(ActionEV(
-            action_description=f"Overall winner: {camel.value}",
-            expected_value=ev
-        ))
+        for space in valid_spectator_spaces
+    )
 
-    # Overall loser bets
-    for camel in available_finish_cards:
-        ev = calculate_overall_loser_bet_ev(
-            full_probs.overall_race, camel, num_loser_bets_placed
-        )
-        actions.append(ActionEV(
-            action_description=f"Overall loser: {camel.value}",
-            expected_value=ev
-        ))
+    # Overall winner and loser bets
+    overall = full_probs.overall_race
+    for kind, probs_by_camel, bets_placed in (
+        ("winner", overall.win_probs, num_winner_bets_placed),
+        ("loser", overall.lose_probs, num_loser_bets_placed),
+    ):
+        payout = _overall_payout(bets_placed)
+        for camel in available_finish_cards:
+            p = probs_by_camel.get(camel, 0.0)
+            actions.append(ActionEV(
+                action_description=f"Overall {kind}: {camel.value}",
+                expected_value=(p * payout) + ((1 - p) * -1)
+            ))
 
     # Sort by EV descending
     actions.sort(key=lambda a: a.expected_value, reverse=True)
@@ -352,17 +356,17 @@ def format_probabilities(probs: RankingProbabilities) -> str:
     lines.append(f"{'Camel':<10} {'1st':>8} {'2nd':>8} {'Top 2':>8}")
     lines.append("-" * 50)
     
-    # Sort camels by 1st place probability
-    sorted_camels = sorted(
-        RACING_CAMELS,
-        key=lambda c: probs.prob_first(c),
+    # Sort camels by 1st place probability, reading each row once
+    sorted_rows = sorted(
+        probs.first_second_table().items(),
+        key=lambda item: item[1][0],
         reverse=True
     )
     
-    for camel in sorted_camels:
-        p1 = probs.prob_first(camel) * 100
-        p2 = probs.prob_second(camel) * 100
-        p_top2 = probs.prob_top_two(camel) * 100
+    for camel, (p_first, p_second) in sorted_rows:
+        p1 = p_first * 100
+        p2 = p_second * 100
+        p_top2 = (p_first + p_second) * 100
         lines.append(f"{camel.value:<10} {p1:>7.1f}% {p2:>7.1f}% {p_top2:>7.1f}%")
     
     return "\n".join(lines)
@@ -1,7 +1,15 @@
 """Simulation framework for batch game execution and analysis."""
 
-from .results import GameResult, MatchupResult, save_results_csv, load_results_csv
-from .runner import SimulationRunner, AGENT_REGISTRY, GameConfig
+from .results import (
+    GameResult,
+    MatchupResult,
+    save_results_csv,
+    load_results_csv,
+    load_results_columns,
+    save_results_bin,
+    load_results_bin,
+)
+from .runner import SimulationRunner, AGENT_REGISTRY
 from .analysis import (
     agent_a_wins,
     agent_b_wins,
@@ -19,6 +27,8 @@ from .n_player_results import (
     NPlayerMatchupResult,
     save_n_player_results_csv,
     load_n_player_results_csv,
+    save_n_player_results_bin,
+    load_n_player_results_bin,
 )
 from .n_player_runner import NPlayerRunner, NPlayerGameConfig
 from .n_player_analysis import (
@@ -41,9 +51,11 @@ __all__ = [
     "MatchupResult",
     "save_results_csv",
     "load_results_csv",
+    "load_results_columns",
+    "save_results_bin",
+    "load_results_bin",
     "SimulationRunner",
     "AGENT_REGISTRY",
-    "GameConfig",
     "agent_a_wins",
     "agent_b_wins",
     "tie_count",
@@ -59,6 +71,8 @@ __all__ = [
     "NPlayerMatchupResult",
     "save_n_player_results_csv",
     "load_n_player_results_csv",
+    "save_n_player_results_bin",
+    "load_n_player_results_bin",
     "NPlayerRunner",
     "NPlayerGameConfig",
     "focal_wins",
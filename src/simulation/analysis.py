@@ -5,54 +5,109 @@ All account for seat alternation via game_index % 2.
 """
 
 import math
+from dataclasses import dataclass
 from typing import Tuple
 
 from src.simulation.results import MatchupResult
-
-
-def _agent_a_score(game) -> int:
-    """Get agent A's score from a game, accounting for seat alternation."""
-    if game.first_player == 0:
-        # Agent A is seat 0
-        return game.scores[0]
-    else:
-        # Agent A is seat 1
-        return game.scores[1]
-
-
-def _agent_b_score(game) -> int:
-    """Get agent B's score from a game, accounting for seat alternation."""
-    if game.first_player == 0:
-        # Agent B is seat 1
-        return game.scores[1]
-    else:
-        # Agent B is seat 0
-        return game.scores[0]
-
-
-def _agent_a_won(game) -> bool | None:
-    """Did agent A win? None if tie."""
-    if game.winner is None:
-        return None
-    if game.first_player == 0:
-        return game.winner == 0
-    else:
-        return game.winner == 1
+from src.simulation.welford import Welford
+
+
+@dataclass(frozen=True)
+class _MatchupStats:
+    """Every statistic's raw ingredients, aggregated in one pass."""
+    n: int  # number of games
+    a_total: int  # sum of agent A's scores
+    b_total: int  # sum of agent B's scores
+    a_var: float  # sample variance of agent A's scores
+    b_var: float  # sample variance of agent B's scores
+    diff_mean: float  # mean per-game score difference (A - B)
+    diff_var: float  # sample variance of the per-game differences
+    a_wins: int
+    b_wins: int
+    ties: int
+    seat_0_wins: int
+
+
+def _matchup_stats(matchup: MatchupResult) -> _MatchupStats:
+    """Score moments and win counts per agent, accounting for seat alternation.
+
+    Everything summary_text reports is derived from these, so summary_text
+    walks the games once and hands the result to the _from_stats helpers.
+    Single statistics that need no moments use the cheaper passes below.
+    """
+    a_total = b_total = 0
+    a_acc = Welford()
+    b_acc = Welford()
+    diff_acc = Welford()
+    # Bound once: the loop body runs for every game
+    a_add = a_acc.add
+    b_add = b_acc.add
+    diff_add = diff_acc.add
+    a_wins = b_wins = ties = seat_0_wins = 0
+    for game in matchup.games:
+        # Agent A sits in seat first_player, agent B in the other seat
+        seat = game.first_player
+        scores = game.scores
+        a_score = scores[seat]
+        b_score = scores[1 - seat]
+        a_total += a_score
+        b_total += b_score
+        a_add(a_score)
+        b_add(b_score)
+        diff_add(a_score - b_score)
+
+        # winner is a seat index, or None for a tie
+        winner = game.winner
+        if winner is None:
+            ties += 1
+        else:
+            if winner == seat:
+                a_wins += 1
+            else:
+                b_wins += 1
+            if winner == 0:
+                seat_0_wins += 1
+
+    return _MatchupStats(
+        n=len(matchup.games),
+        a_total=a_total,
+        b_total=b_total,
+        a_var=a_acc.variance,
+        b_var=b_acc.variance,
+        diff_mean=diff_acc.mean,
+        diff_var=diff_acc.variance,
+        a_wins=a_wins,
+        b_wins=b_wins,
+        ties=ties,
+        seat_0_wins=seat_0_wins,
+    )
+
+
+def _win_counts(matchup: MatchupResult) -> Tuple[int, int, int]:
+    """(agent A wins, agent B wins, ties), without reading any scores."""
+    a_wins = ties = 0
+    for game in matchup.games:
+        winner = game.winner
+        if winner is None:
+            ties += 1
+        elif winner == game.first_player:
+            a_wins += 1
+    return (a_wins, len(matchup.games) - a_wins - ties, ties)
 
 
 def agent_a_wins(matchup: MatchupResult) -> int:
     """Count games won by agent A."""
-    return sum(1 for g in matchup.games if _agent_a_won(g) is True)
+    return _win_counts(matchup)[0]
 
 
 def agent_b_wins(matchup: MatchupResult) -> int:
     """Count games won by agent B."""
-    return sum(1 for g in matchup.games if _agent_a_won(g) is False)
+    return _win_counts(matchup)[1]
 
 
 def tie_count(matchup: MatchupResult) -> int:
     """Count tied games."""
-    return sum(1 for g in matchup.games if _agent_a_won(g) is None)
+    return _win_counts(matchup)[2]
 
 
 def win_rate_with_ci(matchup: MatchupResult) -> Tuple[float, float, float]:
@@ -61,8 +116,12 @@ def win_rate_with_ci(matchup: MatchupResult) -> Tuple[float, float, float]:
     Ties are excluded from the denominator.
     Returns (rate, ci_lo, ci_hi).
     """
-    a_wins = agent_a_wins(matchup)
-    b_wins = agent_b_wins(matchup)
+    a_wins, b_wins, _ = _win_counts(matchup)
+    return _win_rate_with_ci_from_counts(a_wins, b_wins)
+
+
+def _win_rate_with_ci_from_counts(a_wins: int, b_wins: int) -> Tuple[float, float, float]:
+    """win_rate_with_ci on already counted wins."""
     decisive = a_wins + b_wins
 
     if decisive == 0:
@@ -77,30 +136,43 @@ def win_rate_with_ci(matchup: MatchupResult) -> Tuple[float, float, float]:
 
 def mean_scores(matchup: MatchupResult) -> Tuple[float, float]:
     """Mean scores for agent A and agent B."""
-    n = len(matchup.games)
+    a_total = b_total = 0
+    for game in matchup.games:
+        seat = game.first_player
+        scores = game.scores
+        a_total += scores[seat]
+        b_total += scores[1 - seat]
+    return _mean_scores_from_totals(a_total, b_total, len(matchup.games))
+
+
+def _mean_scores_from_totals(a_total: int, b_total: int, n: int) -> Tuple[float, float]:
+    """mean_scores on already summed scores."""
     if n == 0:
         return (0.0, 0.0)
-    a_total = sum(_agent_a_score(g) for g in matchup.games)
-    b_total = sum(_agent_b_score(g) for g in matchup.games)
     return (a_total / n, b_total / n)
 
 
 def score_std_dev(matchup: MatchupResult) -> Tuple[float, float]:
     """Standard deviation of scores for agent A and B (Bessel's correction)."""
-    n = len(matchup.games)
-    if n < 2:
-        return (0.0, 0.0)
+    return _score_std_dev_from_stats(_matchup_stats(matchup))
 
-    a_mean, b_mean = mean_scores(matchup)
-    a_var = sum((_agent_a_score(g) - a_mean) ** 2 for g in matchup.games) / (n - 1)
-    b_var = sum((_agent_b_score(g) - b_mean) ** 2 for g in matchup.games) / (n - 1)
-    return (math.sqrt(a_var), math.sqrt(b_var))
+
+def _score_std_dev_from_stats(stats: _MatchupStats) -> Tuple[float, float]:
+    """score_std_dev on already aggregated stats."""
+    if stats.n < 2:
+        return (0.0, 0.0)
+    return (math.sqrt(stats.a_var), math.sqrt(stats.b_var))
 
 
 def coefficient_of_variation(matchup: MatchupResult) -> Tuple[float, float]:
     """Coefficient of variation (std / mean) for agent A and B."""
-    a_mean, b_mean = mean_scores(matchup)
-    a_std, b_std = score_std_dev(matchup)
+    return _coefficient_of_variation_from_stats(_matchup_stats(matchup))
+
+
+def _coefficient_of_variation_from_stats(stats: _MatchupStats) -> Tuple[float, float]:
+    """coefficient_of_variation on already aggregated stats."""
+    a_mean, b_mean = _mean_scores_from_totals(stats.a_total, stats.b_total, stats.n)
+    a_std, b_std = _score_std_dev_from_stats(stats)
 
     a_cv = a_std / a_mean if a_mean != 0 else 0.0
     b_cv = b_std / b_mean if b_mean != 0 else 0.0
@@ -119,13 +191,16 @@ def t_test_scores(matchup: MatchupResult) -> Tuple[float, float]:
     Returns (t_statistic, p_value).
     Uses normal approximation for p-value via math.erfc.
     """
-    n = len(matchup.games)
+    return _t_test_scores_from_stats(_matchup_stats(matchup))
+
+
+def _t_test_scores_from_stats(stats: _MatchupStats) -> Tuple[float, float]:
+    """t_test_scores on already aggregated stats."""
+    n = stats.n
     if n < 2:
         return (0.0, 1.0)
 
-    diffs = [_agent_a_score(g) - _agent_b_score(g) for g in matchup.games]
-    d_mean = sum(diffs) / n
-    d_var = sum((d - d_mean) ** 2 for d in diffs) / (n - 1)
+    d_mean, d_var = stats.diff_mean, stats.diff_var
 
     if d_var == 0:
         if d_mean == 0:
@@ -143,8 +218,18 @@ def t_test_scores(matchup: MatchupResult) -> Tuple[float, float]:
 
 def first_player_win_rate(matchup: MatchupResult) -> float:
     """Fraction of decisive games won by seat 0 (the first player)."""
-    seat_0_wins = sum(1 for g in matchup.games if g.winner == 0)
-    decisive = sum(1 for g in matchup.games if g.winner is not None)
+    seat_0_wins = decisive = 0
+    for game in matchup.games:
+        winner = game.winner
+        if winner is not None:
+            decisive += 1
+            if winner == 0:
+                seat_0_wins += 1
+    return _first_player_win_rate_from_counts(seat_0_wins, decisive)
+
+
+def _first_player_win_rate_from_counts(seat_0_wins: int, decisive: int) -> float:
+    """first_player_win_rate on already counted wins."""
     if decisive == 0:
         return 0.0
     return seat_0_wins / decisive
@@ -153,16 +238,16 @@ def first_player_win_rate(matchup: MatchupResult) -> float:
 def summary_text(matchup: MatchupResult) -> str:
     """Human-readable summary of matchup results."""
     n = len(matchup.games)
-    a_w = agent_a_wins(matchup)
-    b_w = agent_b_wins(matchup)
-    ties = tie_count(matchup)
-    rate, ci_lo, ci_hi = win_rate_with_ci(matchup)
-    a_mean, b_mean = mean_scores(matchup)
-    a_std, b_std = score_std_dev(matchup)
-    a_cv, b_cv = coefficient_of_variation(matchup)
-    adv = mean_score_advantage(matchup)
-    t_stat, p_val = t_test_scores(matchup)
-    fp_rate = first_player_win_rate(matchup)
+    # One pass over the games feeds every statistic below
+    stats = _matchup_stats(matchup)
+    a_w, b_w, ties = stats.a_wins, stats.b_wins, stats.ties
+    rate, ci_lo, ci_hi = _win_rate_with_ci_from_counts(a_w, b_w)
+    a_mean, b_mean = _mean_scores_from_totals(stats.a_total, stats.b_total, n)
+    a_std, b_std = _score_std_dev_from_stats(stats)
+    a_cv, b_cv = _coefficient_of_variation_from_stats(stats)
+    adv = a_mean - b_mean
+    t_stat, p_val = _t_test_scores_from_stats(stats)
+    fp_rate = _first_player_win_rate_from_counts(stats.seat_0_wins, a_w + b_w)
 
     lines = [
         f"Matchup: {matchup.agent_a_name} vs {matchup.agent_b_name}",
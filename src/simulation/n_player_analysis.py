@@ -5,43 +5,100 @@ The focal agent's seat is stored in game.first_player (reusing the field).
 """
 
 import math
-from typing import Tuple
+from dataclasses import dataclass
+from typing import Sequence, Tuple
 
 from src.simulation.n_player_results import NPlayerMatchupResult
+from src.simulation.welford import welford
 
 
-def _focal_score(game) -> int:
-    """Get the focal agent's score from a game."""
-    return game.scores[game.first_player]
+@dataclass(frozen=True)
+class _FocalStats:
+    """Per-game values the statistics need, extracted in one pass."""
+    focal_scores: Tuple[int, ...]  # focal agent's score per game
+    field_totals: Tuple[int, ...]  # sum of the non-focal scores per game
+    field_sizes: Tuple[int, ...]  # number of non-focal scores per game
+    wins: int
+    losses: int
+    ties: int
+    games_by_seat: Tuple[int, ...]  # games with the focal agent in seat i
+    wins_by_seat: Tuple[int, ...]  # focal wins from seat i
 
 
-def _field_scores(game) -> Tuple[int, ...]:
-    """Get all non-focal agent scores from a game."""
-    return tuple(
-        game.scores[i] for i in range(len(game.scores)) if i != game.first_player
+def _focal_stats(result: NPlayerMatchupResult) -> _FocalStats:
+    """Focal scores, field score totals and win counts for every game.
+
+    summary_text computes these once and hands them to the _from_stats
+    helpers, so the games are walked once per summary. Single statistics
+    that need no per-game values use the cheaper passes below.
+    """
+    focal_scores = []
+    field_totals = []
+    field_sizes = []
+    # Bound once: the loop body runs for every game
+    add_focal = focal_scores.append
+    add_field_total = field_totals.append
+    add_field_size = field_sizes.append
+    wins = losses = ties = 0
+    games_by_seat = [0] * result.num_players
+    wins_by_seat = [0] * result.num_players
+    for g in result.games:
+        # The focal agent's seat is stored in first_player
+        seat = g.first_player
+        scores = g.scores
+        games_by_seat[seat] += 1
+        focal = scores[seat]
+        add_focal(focal)
+        add_field_total(sum(scores) - focal)
+        add_field_size(len(scores) - 1)
+
+        # winner is a seat index, or None for a tie
+        winner = g.winner
+        if winner is None:
+            ties += 1
+        elif winner == seat:
+            wins += 1
+            wins_by_seat[seat] += 1
+        else:
+            losses += 1
+
+    return _FocalStats(
+        focal_scores=tuple(focal_scores),
+        field_totals=tuple(field_totals),
+        field_sizes=tuple(field_sizes),
+        wins=wins,
+        losses=losses,
+        ties=ties,
+        games_by_seat=tuple(games_by_seat),
+        wins_by_seat=tuple(wins_by_seat),
     )
 
 
-def _focal_won(game) -> bool | None:
-    """Did the focal agent win? None if tie."""
-    if game.winner is None:
-        return None
-    return game.winner == game.first_player
+def _focal_win_counts(result: NPlayerMatchupResult) -> Tuple[int, int, int]:
+    """(focal wins, focal losses, ties), without reading any scores."""
+    wins = ties = 0
+    for g in result.games:
+        winner = g.winner
+        if winner is None:
+            ties += 1
+        elif winner == g.first_player:
+            wins += 1
+    return (wins, len(result.games) - wins - ties, ties)
 
 
 def focal_wins(result: NPlayerMatchupResult) -> int:
     """Count games won by the focal agent."""
-    return sum(1 for g in result.games if _focal_won(g) is True)
+    return _focal_win_counts(result)[0]
 
 
 def focal_losses(result: NPlayerMatchupResult) -> int:
     """Count games lost by the focal agent."""
-    return sum(1 for g in result.games if _focal_won(g) is False)
+    return _focal_win_counts(result)[1]
 
 
 def tie_count(result: NPlayerMatchupResult) -> int:
     """Count tied games."""
-    return sum(1 for g in result.games if _focal_won(g) is None)
+    return _focal_win_counts(result)[2]
 
 
 def focal_win_rate_with_ci(result: NPlayerMatchupResult) -> Tuple[float, float, float]:
@@ -50,8 +107,12 @@ def focal_win_rate_with_ci(result: NPlayerMatchupResult) -> Tuple[float, float,
     Ties are excluded from the denominator.
     Returns (rate, ci_lo, ci_hi).
     """
-    wins = focal_wins(result)
-    losses = focal_losses(result)
+    wins, losses, _ = _focal_win_counts(result)
+    return _focal_win_rate_with_ci_from_counts(wins, losses)
+
+
+def _focal_win_rate_with_ci_from_counts(wins: int, losses: int) -> Tuple[float, float, float]:
+    """focal_win_rate_with_ci on already counted wins."""
     decisive = wins + losses
 
     if decisive == 0:
@@ -73,25 +134,37 @@ def focal_mean_score(result: NPlayerMatchupResult) -> float:
     n = len(result.games)
     if n == 0:
         return 0.0
-    return sum(_focal_score(g) for g in result.games) / n
+    return sum([g.scores[g.first_player] for g in result.games]) / n
 
 
-def field_mean_score(result: NPlayerMatchupResult) -> float:
-    """Mean of all non-focal scores across all games."""
-    n = len(result.games)
+def _focal_mean_score_from_stats(stats: _FocalStats) -> float:
+    """focal_mean_score on already extracted stats."""
+    n = len(stats.focal_scores)
     if n == 0:
         return 0.0
-    total = 0
-    count = 0
+    return sum(stats.focal_scores) / n
+
+
+def field_mean_score(result: NPlayerMatchupResult) -> float:
+    """Mean of all non-focal scores across all games."""
+    total = count = 0
     for g in result.games:
-        for s in _field_scores(g):
-            total += s
-            count += 1
+        scores = g.scores
+        total += sum(scores) - scores[g.first_player]
+        count += len(scores) - 1
     if count == 0:
         return 0.0
     return total / count
 
 
+def _field_mean_score_from_stats(stats: _FocalStats) -> float:
+    """field_mean_score on already extracted stats."""
+    count = sum(stats.field_sizes)
+    if count == 0:
+        return 0.0
+    return sum(stats.field_totals) / count
+
+
 def mean_score_advantage(result: NPlayerMatchupResult) -> float:
     """Focal mean score minus field mean score."""
     return focal_mean_score(result) - field_mean_score(result)
@@ -99,20 +172,28 @@ def mean_score_advantage(result: NPlayerMatchupResult) -> float:
 
 def focal_score_std_dev(result: NPlayerMatchupResult) -> float:
     """Standard deviation of focal agent's scores (Bessel's correction)."""
-    n = len(result.games)
-    if n < 2:
+    return _focal_score_std_dev_from_stats(_focal_stats(result))
+
+
+def _focal_score_std_dev_from_stats(stats: _FocalStats) -> float:
+    """focal_score_std_dev on already extracted stats."""
+    if len(stats.focal_scores) < 2:
         return 0.0
-    mean = focal_mean_score(result)
-    var = sum((_focal_score(g) - mean) ** 2 for g in result.games) / (n - 1)
+    _, var, _ = welford(stats.focal_scores)
     return math.sqrt(var)
 
 
 def focal_coefficient_of_variation(result: NPlayerMatchupResult) -> float:
     """Coefficient of variation (std / mean) for the focal agent."""
-    mean = focal_mean_score(result)
+    return _focal_coefficient_of_variation_from_stats(_focal_stats(result))
+
+
+def _focal_coefficient_of_variation_from_stats(stats: _FocalStats) -> float:
+    """focal_coefficient_of_variation on already extracted stats."""
+    mean = _focal_mean_score_from_stats(stats)
     if mean == 0:
         return 0.0
-    return focal_score_std_dev(result) / mean
+    return _focal_score_std_dev_from_stats(stats) / mean
 
 
 def t_test_focal_vs_field(result: NPlayerMatchupResult) -> Tuple[float, float]:
@@ -122,18 +203,21 @@ def t_test_focal_vs_field(result: NPlayerMatchupResult) -> Tuple[float, float]:
     different from zero. Returns (t_statistic, p_value).
     Uses normal approximation for p-value via math.erfc.
     """
-    n = len(result.games)
+    return _t_test_focal_vs_field_from_stats(_focal_stats(result))
+
+
+def _t_test_focal_vs_field_from_stats(stats: _FocalStats) -> Tuple[float, float]:
+    """t_test_focal_vs_field on already extracted stats."""
+    n = len(stats.focal_scores)
     if n < 2:
         return (0.0, 1.0)
 
-    diffs = []
-    for g in result.games:
-        f_scores = _field_scores(g)
-        field_mean = sum(f_scores) / len(f_scores)
-        diffs.append(_focal_score(g) - field_mean)
-
-    d_mean = sum(diffs) / n
-    d_var = sum((d - d_mean) ** 2 for d in diffs) / (n - 1)
+    d_mean, d_var, _ = welford(
+        focal - total / size
+        for focal, total, size in zip(
+            stats.focal_scores, stats.field_totals, stats.field_sizes
+        )
+    )
 
     if d_var == 0:
         if d_mean == 0:
@@ -154,40 +238,41 @@ def seat_win_rates(result: NPlayerMatchupResult) -> Tuple[float, ...]:
     Returns a tuple of length num_players, where index i is the focal
     agent's win rate when seated in seat i.
     """
-    n = result.num_players
-    wins_by_seat = [0] * n
-    games_by_seat = [0] * n
-
+    games_by_seat = [0] * result.num_players
+    wins_by_seat = [0] * result.num_players
     for g in result.games:
         seat = g.first_player
         games_by_seat[seat] += 1
-        if _focal_won(g) is True:
+        if g.winner == seat:
             wins_by_seat[seat] += 1
+    return _seat_win_rates_from_counts(wins_by_seat, games_by_seat)
 
-    rates = []
-    for i in range(n):
-        if games_by_seat[i] == 0:
-            rates.append(0.0)
-        else:
-            rates.append(wins_by_seat[i] / games_by_seat[i])
-    return tuple(rates)
+
+def _seat_win_rates_from_counts(
+    wins_by_seat: Sequence[int], games_by_seat: Sequence[int]
+) -> Tuple[float, ...]:
+    """seat_win_rates on already counted wins."""
+    return tuple(
+        wins / games if games else 0.0
+        for wins, games in zip(wins_by_seat, games_by_seat)
+    )
 
 
 def summary_text(result: NPlayerMatchupResult) -> str:
     """Human-readable summary of N-player matchup results."""
     n_games = len(result.games)
-    f_wins = focal_wins(result)
-    f_losses = focal_losses(result)
-    ties = tie_count(result)
-    rate, ci_lo, ci_hi = focal_win_rate_with_ci(result)
+    # One pass over the games feeds every statistic below
+    stats = _focal_stats(result)
+    f_wins, f_losses, ties = stats.wins, stats.losses, stats.ties
+    rate, ci_lo, ci_hi = _focal_win_rate_with_ci_from_counts(f_wins, f_losses)
     baseline = baseline_win_rate(result)
-    f_mean = focal_mean_score(result)
-    fld_mean = field_mean_score(result)
-    f_std = focal_score_std_dev(result)
-    f_cv = focal_coefficient_of_variation(result)
-    adv = mean_score_advantage(result)
-    t_stat, p_val = t_test_focal_vs_field(result)
-    s_rates = seat_win_rates(result)
+    f_mean = _focal_mean_score_from_stats(stats)
+    fld_mean = _field_mean_score_from_stats(stats)
+    f_std = _focal_score_std_dev_from_stats(stats)
+    f_cv = _focal_coefficient_of_variation_from_stats(stats)
+    adv = f_mean - fld_mean
+    t_stat, p_val = _t_test_focal_vs_field_from_stats(stats)
+    s_rates = _seat_win_rates_from_counts(stats.wins_by_seat, stats.games_by_seat)
 
     field_str = ", ".join(result.field_agent_names)
     seat_rates_str = ", ".join(
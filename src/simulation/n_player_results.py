@@ -1,10 +1,10 @@
-"""N-player game result data class and CSV I/O for simulation framework."""
+"""N-player game result data class and CSV/binary I/O for simulation framework."""
 
 import csv
 from dataclasses import dataclass
 from typing import Tuple
 
-from src.simulation.results import GameResult
+from src.simulation.results import GameResult, _load_bin, _save_bin, _seating
 
 
 @dataclass(frozen=True)
@@ -40,14 +40,24 @@ def save_n_player_results_csv(result: NPlayerMatchupResult, filepath: str) -> No
     with open(filepath, "w", newline="") as f:
         writer = csv.writer(f)
         writer.writerow(columns)
-        for game in result.games:
-            row = [game.game_index, game.seed]
-            row += [game.scores[i] for i in range(n)]
-            row.append("tie" if game.winner is None else game.winner)
-            row += [game.num_legs, game.num_turns]
-            row += [game.agent_names[i] for i in range(n)]
-            row.append(game.first_player)
-            writer.writerow(row)
+        # scores and agent_names already hold one entry per seat
+        writer.writerows(
+            (
+                game.game_index,
+                game.seed,
+                *game.scores,
+                "tie" if game.winner is None else game.winner,
+                game.num_legs,
+                game.num_turns,
+                *game.agent_names,
+                game.first_player,
+            )
+            for game in result.games
+        )
+
+
+# Columns present whatever the player count (score_* and agent_seat_* vary)
+_N_PLAYER_FIXED_COLUMNS = ("game_index", "seed", "winner", "num_legs", "num_turns", "focal_seat")
 
 
 def load_n_player_results_csv(filepath: str) -> NPlayerMatchupResult:
@@ -58,29 +68,51 @@ def load_n_player_results_csv(filepath: str) -> NPlayerMatchupResult:
     defaults since they are not stored in the CSV.
     """
     with open(filepath, "r", newline="") as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames or []
+        reader = csv.reader(f)
+        header = next(reader, _N_PLAYER_FIXED_COLUMNS)
+        column = {name: i for i, name in enumerate(header)}
 
         # Detect N from score columns
         n = 0
-        while f"score_{n}" in fieldnames:
+        while f"score_{n}" in column:
             n += 1
 
+        for name in (*_N_PLAYER_FIXED_COLUMNS, *(f"agent_seat_{i}" for i in range(n))):
+            if name not in column:
+                raise ValueError(f"{filepath} has no {name!r} column")
+
+        # Column positions, resolved once rather than per row
+        game_index_col = column["game_index"]
+        seed_col = column["seed"]
+        score_cols = [column[f"score_{i}"] for i in range(n)]
+        winner_col = column["winner"]
+        num_legs_col = column["num_legs"]
+        num_turns_col = column["num_turns"]
+        agent_cols = [column[f"agent_seat_{i}"] for i in range(n)]
+        focal_seat_col = column["focal_seat"]
+
         games = []
         focal_agent_name = None
         field_agent_names = None
         base_seed = 0
 
         for row in reader:
-            game_index = int(row["game_index"])
-            seed = int(row["seed"])
-            scores = tuple(int(row[f"score_{i}"]) for i in range(n))
-            winner_raw = row["winner"]
+            if not row:
+                continue  # Blank line (DictReader skipped these too)
+            if len(row) != len(header):
+                raise ValueError(
+                    f"{filepath} line {reader.line_num}: expected "
+                    f"{len(header)} fields, got {len(row)}"
+                )
+            game_index = int(row[game_index_col])
+            seed = int(row[seed_col])
+            scores = tuple([int(row[j]) for j in score_cols])
+            winner_raw = row[winner_col]
             winner = None if winner_raw == "tie" else int(winner_raw)
-            num_legs = int(row["num_legs"])
-            num_turns = int(row["num_turns"])
-            agent_names = tuple(row[f"agent_seat_{i}"] for i in range(n))
-            focal_seat = int(row["focal_seat"])
+            num_legs = int(row[num_legs_col])
+            num_turns = int(row[num_turns_col])
+            agent_names = _seating(tuple([row[j] for j in agent_cols]))
+            focal_seat = int(row[focal_seat_col])
 
             if focal_agent_name is None:
                 focal_agent_name = agent_names[focal_seat]
@@ -109,3 +141,36 @@ def load_n_player_results_csv(filepath: str) -> NPlayerMatchupResult:
         fast_mode=False,
         elapsed_seconds=0.0,
     )
+
+
+# Same binary layout as save_results_bin, under its own magic
+_N_PLAYER_BIN_MAGIC = b"CUNP"
+
+
+def save_n_player_results_bin(result: NPlayerMatchupResult, filepath: str) -> None:
+    """Save N-player matchup results to a compact binary file.
+
+    A faster, smaller alternative to the CSV for large runs. Reload with
+    load_n_player_results_bin.
+    """
+    _save_bin(
+        filepath, _N_PLAYER_BIN_MAGIC,
+        (result.focal_agent_name, *result.field_agent_names), result.num_players,
+        result.games, result.base_seed, result.fast_mode, result.elapsed_seconds,
+    )
+
+
+def load_n_player_results_bin(filepath: str) -> NPlayerMatchupResult:
+    """Load N-player matchup results saved by save_n_player_results_bin."""
+    names, n, games, base_seed, fast_mode, elapsed = _load_bin(
+        filepath, _N_PLAYER_BIN_MAGIC
+    )
+    return NPlayerMatchupResult(
+        focal_agent_name=names[0],
+        field_agent_names=tuple(names[1:]),
+        num_players=n,
+        games=tuple(games),
+        base_seed=base_seed,
+        fast_mode=fast_mode,
+        elapsed_seconds=elapsed,
+    )
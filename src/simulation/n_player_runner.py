@@ -1,56 +1,16 @@
 """N-player simulation runner for batch game execution."""
 
 import time
-from dataclasses import dataclass
-from multiprocessing import Pool
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
-from src.game.game import play_game
-from src.simulation.results import GameResult
-from src.simulation.runner import AGENT_REGISTRY
+from src.simulation.results import GameResult, _seating
+from src.simulation.runner import (
+    AGENT_REGISTRY, EXECUTION_MODES, ExecutionMode, NPlayerGameConfig,
+    _report_progress, _run_parallel_games, _run_single_n_player_game, close_pool,
+)
 from src.simulation.n_player_results import NPlayerMatchupResult
 
 
-@dataclass(frozen=True)
-class NPlayerGameConfig:
-    """Configuration for a single N-player game in a simulation batch."""
-    game_index: int
-    seed: int
-    agent_names: Tuple[str, ...]  # Ordered by seat
-    focal_seat: int               # Which seat the focal agent occupies
-    fast_mode: bool
-
-
-def _run_single_n_player_game(config: NPlayerGameConfig) -> GameResult:
-    """Run a single N-player game from a config. Module-level for multiprocessing."""
-    n = len(config.agent_names)
-    agents = []
-    for seat in range(n):
-        name = config.agent_names[seat]
-        agent_seed = config.seed + seat * 10000
-        agents.append(AGENT_REGISTRY[name](seed=agent_seed, fast_mode=config.fast_mode))
-
-    final_state, history = play_game(
-        num_players=n,
-        agent_functions=agents,
-        seed=config.seed,
-    )
-
-    scores = final_state.get_scores()
-    winner = final_state.get_winner()
-
-    return GameResult(
-        game_index=config.game_index,
-        seed=config.seed,
-        scores=scores,
-        winner=winner,
-        num_legs=final_state.leg_number,
-        num_turns=len(history),
-        agent_names=config.agent_names,
-        first_player=config.focal_seat,
-    )
-
-
 class NPlayerRunner:
     """Runs batch N-player simulations with one focal agent vs a field."""
 
@@ -63,11 +23,14 @@ class NPlayerRunner:
         fast_mode: bool = True,
         num_workers: int = 1,
         progress_interval: int = 100,
+        execution_mode: ExecutionMode = "process",
     ):
         all_names = [focal_agent_name] + list(field_agent_names)
         for name in all_names:
             if name not in AGENT_REGISTRY:
                 raise ValueError(f"Unknown agent: {name}")
+        if execution_mode not in EXECUTION_MODES:
+            raise ValueError(f"Unknown execution mode: {execution_mode}")
 
         self.focal_agent_name = focal_agent_name
         self.field_agent_names = field_agent_names
@@ -77,33 +40,38 @@ class NPlayerRunner:
         self.fast_mode = fast_mode
         self.num_workers = num_workers
         self.progress_interval = progress_interval
+        self.execution_mode = execution_mode
+
+    @staticmethod
+    def close_pool() -> None:
+        """Shut down the shared worker pool (the next parallel run starts a new one)."""
+        close_pool()
 
-    def _make_configs(self) -> List[NPlayerGameConfig]:
+    def _make_configs(self) -> Iterator[NPlayerGameConfig]:
         """Build game configs with seat rotation.
 
         Game i places the focal agent in seat (i % N). Field agents fill
         remaining seats in their original order.
         """
-        configs = []
         n = self.num_players
-        for i in range(self.num_games):
-            focal_seat = i % n
-            agent_names = []
-            field_idx = 0
-            for seat in range(n):
-                if seat == focal_seat:
-                    agent_names.append(self.focal_agent_name)
-                else:
-                    agent_names.append(self.field_agent_names[field_idx])
-                    field_idx += 1
-            configs.append(NPlayerGameConfig(
+        field = tuple(self.field_agent_names)
+        # Seat names for each focal seat, built once instead of per game
+        rotations = [
+            _seating(field[:focal_seat] + (self.focal_agent_name,) + field[focal_seat:])
+            for focal_seat in range(n)
+        ]
+        # Generated lazily: the parallel path only pulls configs a few
+        # chunks ahead of the workers
+        return (
+            NPlayerGameConfig(
                 game_index=i,
                 seed=self.base_seed + i,
-                agent_names=tuple(agent_names),
-                focal_seat=focal_seat,
+                agent_names=rotations[i % n],
+                focal_seat=i % n,
                 fast_mode=self.fast_mode,
-            ))
-        return configs
+            )
+            for i in range(self.num_games)
+        )
 
     def run(self) -> NPlayerMatchupResult:
         """Run the simulation and return results."""
@@ -115,7 +83,7 @@ class NPlayerRunner:
         else:
             results = self._run_parallel(configs)
 
-        results.sort(key=lambda r: r.game_index)
+        # Both paths return results in game_index order
         elapsed = time.time() - start
 
         return NPlayerMatchupResult(
@@ -128,19 +96,18 @@ class NPlayerRunner:
             elapsed_seconds=elapsed,
         )
 
-    def _run_serial(self, configs: List[NPlayerGameConfig]) -> List[GameResult]:
+    def _run_serial(self, configs: Iterable[NPlayerGameConfig]) -> List[GameResult]:
         results = []
-        for i, config in enumerate(configs):
+        next_report = self.progress_interval
+        for config in configs:
             results.append(_run_single_n_player_game(config))
-            if (i + 1) % self.progress_interval == 0:
-                print(f"Progress: {i + 1}/{self.num_games} games complete", flush=True)
+            if len(results) == next_report:
+                _report_progress(next_report, self.num_games)
+                next_report += self.progress_interval
         return results
 
-    def _run_parallel(self, configs: List[NPlayerGameConfig]) -> List[GameResult]:
-        results = []
-        with Pool(processes=self.num_workers) as pool:
-            for i, result in enumerate(pool.imap_unordered(_run_single_n_player_game, configs)):
-                results.append(result)
-                if (i + 1) % self.progress_interval == 0:
-                    print(f"Progress: {i + 1}/{self.num_games} games complete", flush=True)
-        return results
+    def _run_parallel(self, configs: Iterable[NPlayerGameConfig]) -> List[GameResult]:
+        return _run_parallel_games(
+            _run_single_n_player_game, configs, self.num_games, self.num_players,
+            self.num_workers, self.progress_interval, self.execution_mode,
+        )
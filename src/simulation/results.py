@@ -1,8 +1,11 @@
-"""Game result data classes and CSV I/O for simulation framework."""
+"""Game result data classes and CSV/binary I/O for simulation framework."""
 
 import csv
+import struct
+import sys
 from dataclasses import dataclass
-from typing import Tuple
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
 
 
 @dataclass(frozen=True)
@@ -29,6 +32,17 @@ class MatchupResult:
     elapsed_seconds: float
 
 
+@lru_cache(maxsize=1024)
+def _seating(agent_names: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    One shared, interned tuple per distinct seating.
+
+    A batch only has a handful of seatings, so its games all point at a
+    few tuples instead of each holding its own copy of the names.
+    """
+    return tuple([sys.intern(name) for name in agent_names])
+
+
 _CSV_COLUMNS = [
     "game_index", "seed", "score_0", "score_1", "winner",
     "num_legs", "num_turns", "agent_seat_0", "agent_seat_1", "first_player",
@@ -40,8 +54,8 @@ def save_results_csv(matchup: MatchupResult, filepath: str) -> None:
     with open(filepath, "w", newline="") as f:
         writer = csv.writer(f)
         writer.writerow(_CSV_COLUMNS)
-        for game in matchup.games:
-            writer.writerow([
+        writer.writerows(
+            (
                 game.game_index,
                 game.seed,
                 game.scores[0],
@@ -52,7 +66,53 @@ def save_results_csv(matchup: MatchupResult, filepath: str) -> None:
                 game.agent_names[0],
                 game.agent_names[1],
                 game.first_player,
-            ])
+            )
+            for game in matchup.games
+        )
+
+
+_INT_COLUMNS = (
+    "game_index", "seed", "score_0", "score_1",
+    "num_legs", "num_turns", "first_player",
+)
+
+
+def load_results_columns(filepath: str) -> Dict[str, list]:
+    """Load a results CSV as one list per column, without GameResult objects.
+
+    Keys are the CSV column names. "winner" holds None for ties, the
+    agent_seat columns hold names and every other column holds ints.
+    Cheaper than load_results_csv when only column aggregates are needed.
+    """
+    with open(filepath, "r", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, _CSV_COLUMNS)
+        for name in _CSV_COLUMNS:
+            if name not in header:
+                raise ValueError(f"{filepath} has no {name!r} column")
+        rows = []
+        for row in reader:
+            if not row:
+                continue  # Blank line (DictReader skipped these too)
+            if len(row) != len(header):
+                raise ValueError(
+                    f"{filepath} line {reader.line_num}: expected "
+                    f"{len(header)} fields, got {len(row)}"
+                )
+            rows.append(row)
+        # Transpose once, then convert a whole column per call
+        raw = dict(zip(header, zip(*rows)))
+
+    columns: Dict[str, list] = {}
+    for name in _CSV_COLUMNS:
+        values = raw.get(name, ())
+        if name == "winner":
+            columns[name] = [None if w == "tie" else int(w) for w in values]
+        elif name in _INT_COLUMNS:
+            columns[name] = list(map(int, values))
+        else:
+            columns[name] = list(values)
+    return columns
 
 
 def load_results_csv(filepath: str) -> MatchupResult:
@@ -63,48 +123,214 @@ def load_results_csv(filepath: str) -> MatchupResult:
     not stored in the CSV.
     """
     with open(filepath, "r", newline="") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, None)
         games = []
-        agent_a_name = None
-        agent_b_name = None
-        base_seed = 0
-        for row in reader:
-            game_index = int(row["game_index"])
-            seed = int(row["seed"])
-            scores = (int(row["score_0"]), int(row["score_1"]))
-            winner_raw = row["winner"]
-            winner = None if winner_raw == "tie" else int(winner_raw)
-            num_legs = int(row["num_legs"])
-            num_turns = int(row["num_turns"])
-            agent_names = (row["agent_seat_0"], row["agent_seat_1"])
-            first_player = int(row["first_player"])
-
-            # Determine agent A/B names from the first game
-            if agent_a_name is None:
-                if first_player == 0:
-                    agent_a_name = agent_names[0]
-                    agent_b_name = agent_names[1]
-                else:
-                    agent_a_name = agent_names[1]
-                    agent_b_name = agent_names[0]
-                base_seed = seed
-
-            games.append(GameResult(
-                game_index=game_index,
-                seed=seed,
-                scores=scores,
-                winner=winner,
-                num_legs=num_legs,
-                num_turns=num_turns,
-                agent_names=agent_names,
-                first_player=first_player,
-            ))
+        if header is not None:
+            # Column positions, resolved once rather than per row
+            (game_index_col, seed_col, score_0_col, score_1_col, winner_col,
+             num_legs_col, num_turns_col, seat_0_col, seat_1_col,
+             first_player_col) = [header.index(name) for name in _CSV_COLUMNS]
+            for row in reader:
+                if not row:
+                    continue  # Blank line (DictReader skipped these too)
+                if len(row) != len(header):
+                    raise ValueError(
+                        f"{filepath} line {reader.line_num}: expected "
+                        f"{len(header)} fields, got {len(row)}"
+                    )
+                winner_raw = row[winner_col]
+                games.append(GameResult(
+                    game_index=int(row[game_index_col]),
+                    seed=int(row[seed_col]),
+                    scores=(int(row[score_0_col]), int(row[score_1_col])),
+                    winner=None if winner_raw == "tie" else int(winner_raw),
+                    num_legs=int(row[num_legs_col]),
+                    num_turns=int(row[num_turns_col]),
+                    agent_names=_seating((row[seat_0_col], row[seat_1_col])),
+                    first_player=int(row[first_player_col]),
+                ))
+
+    # Determine agent A/B names from the first game
+    agent_a_name = agent_b_name = ""
+    base_seed = 0
+    if games:
+        first = games[0]
+        agent_a_name = first.agent_names[first.first_player]
+        agent_b_name = first.agent_names[1 - first.first_player]
+        base_seed = first.seed
 
     return MatchupResult(
-        agent_a_name=agent_a_name or "",
-        agent_b_name=agent_b_name or "",
+        agent_a_name=agent_a_name,
+        agent_b_name=agent_b_name,
         games=tuple(games),
         base_seed=base_seed,
         fast_mode=False,
         elapsed_seconds=0.0,
     )
+
+
+# Binary format: a header, the agent name table, then one fixed-size
+# record per game. Integers stay integers, so saving and loading skip the
+# int <-> str conversions of the CSV path, and unlike the CSV the header
+# keeps base_seed, fast_mode and elapsed_seconds. Shared with the N-player
+# format, which differs only in its magic and matchup names.
+_BIN_MAGIC = b"CUMR"
+_BIN_VERSION = 1
+# magic, version, num_seats, num_games, base_seed, fast_mode, elapsed_seconds
+_BIN_HEADER = struct.Struct("<4sBHIq?d")
+_BIN_COUNT = struct.Struct("<H")
+_BIN_TIE = -1  # winner value stored for tied games
+
+
+@lru_cache(maxsize=None)
+def _bin_record(num_seats: int) -> struct.Struct:
+    """Per-game record: game_index, seed, num_legs, num_turns, winner,
+    first_player, then a score and an agent name index per seat."""
+    return struct.Struct(f"<IqHHbB{num_seats}h{num_seats}H")
+
+
+def _record_fields(game: GameResult, name_index: Dict[str, int]) -> tuple:
+    """A game as _bin_record fields, agent names as name_index entries."""
+    return (
+        game.game_index,
+        game.seed,
+        game.num_legs,
+        game.num_turns,
+        _BIN_TIE if game.winner is None else game.winner,
+        game.first_player,
+        *game.scores,
+        *[name_index[name] for name in game.agent_names],
+    )
+
+
+def _game_from_record(fields: tuple, num_seats: int, names: Sequence[str]) -> GameResult:
+    """Inverse of _record_fields, with names indexed like name_index."""
+    winner = fields[4]
+    return GameResult(
+        game_index=fields[0],
+        seed=fields[1],
+        scores=fields[6:6 + num_seats],
+        winner=None if winner == _BIN_TIE else winner,
+        num_legs=fields[2],
+        num_turns=fields[3],
+        agent_names=_seating(tuple([names[i] for i in fields[6 + num_seats:]])),
+        first_player=fields[5],
+    )
+
+
+def _pack_name(name: str) -> bytes:
+    encoded = name.encode("utf-8")
+    return _BIN_COUNT.pack(len(encoded)) + encoded
+
+
+def _save_bin(
+    filepath: str,
+    magic: bytes,
+    matchup_names: Sequence[str],
+    num_seats: int,
+    games: Sequence[GameResult],
+    base_seed: int,
+    fast_mode: bool,
+    elapsed_seconds: float,
+) -> None:
+    """Write games plus matchup metadata in the binary format."""
+    name_index = {name: i for i, name in enumerate(dict.fromkeys(matchup_names))}
+    for game in games:
+        for name in game.agent_names:
+            name_index.setdefault(name, len(name_index))
+
+    record = _bin_record(num_seats)
+    with open(filepath, "wb") as f:
+        f.write(_BIN_HEADER.pack(
+            magic, _BIN_VERSION, num_seats, len(games),
+            base_seed, fast_mode, elapsed_seconds,
+        ))
+        f.write(_BIN_COUNT.pack(len(name_index)))
+        f.write(b"".join(_pack_name(name) for name in name_index))
+        f.write(_BIN_COUNT.pack(len(matchup_names)))
+        f.write(b"".join(_BIN_COUNT.pack(name_index[name]) for name in matchup_names))
+        f.write(b"".join(
+            record.pack(*_record_fields(game, name_index)) for game in games
+        ))
+
+
+def _load_bin(filepath: str, magic: bytes):
+    """
+    Read a file written by _save_bin.
+
+    Returns (matchup_names, num_seats, games, base_seed, fast_mode,
+    elapsed_seconds).
+    """
+    with open(filepath, "rb") as f:
+        data = f.read()
+
+    not_results = ValueError(f"{filepath} is not a {magic.decode()} results file")
+    if len(data) < _BIN_HEADER.size:
+        raise not_results
+    (file_magic, version, n, num_games, base_seed, fast_mode,
+     elapsed_seconds) = _BIN_HEADER.unpack_from(data)
+    if file_magic != magic or version != _BIN_VERSION:
+        raise not_results
+    offset = _BIN_HEADER.size
+
+    def read_count() -> int:
+        nonlocal offset
+        if offset + _BIN_COUNT.size > len(data):
+            raise not_results
+        (count,) = _BIN_COUNT.unpack_from(data, offset)
+        offset += _BIN_COUNT.size
+        return count
+
+    table = []
+    for _ in range(read_count()):
+        length = read_count()
+        if offset + length > len(data):
+            raise not_results
+        try:
+            table.append(data[offset:offset + length].decode("utf-8"))
+        except UnicodeDecodeError:
+            raise not_results from None
+        offset += length
+
+    record = _bin_record(n)
+    try:
+        matchup_names = [table[read_count()] for _ in range(read_count())]
+        end = offset + record.size * num_games
+        if len(data) != end:
+            # Truncated, or trailing bytes: record count disagrees with the header
+            raise not_results
+        games: List[GameResult] = [
+            _game_from_record(fields, n, table)
+            for fields in record.iter_unpack(data[offset:end])
+        ]
+    except IndexError:
+        # A name index past the end of the name table
+        raise not_results from None
+
+    return matchup_names, n, games, base_seed, fast_mode, elapsed_seconds
+
+
+def save_results_bin(matchup: MatchupResult, filepath: str) -> None:
+    """Save matchup results to a compact binary file.
+
+    A faster, smaller alternative to the CSV for large runs that also keeps
+    base_seed, fast_mode and elapsed_seconds. Reload with load_results_bin.
+    """
+    _save_bin(
+        filepath, _BIN_MAGIC, (matchup.agent_a_name, matchup.agent_b_name), 2,
+        matchup.games, matchup.base_seed, matchup.fast_mode, matchup.elapsed_seconds,
+    )
+
+
+def load_results_bin(filepath: str) -> MatchupResult:
+    """Load matchup results saved by save_results_bin."""
+    names, _, games, base_seed, fast_mode, elapsed = _load_bin(filepath, _BIN_MAGIC)
+    return MatchupResult(
+        agent_a_name=names[0],
+        agent_b_name=names[1],
+        games=tuple(games),
+        base_seed=base_seed,
+        fast_mode=fast_mode,
+        elapsed_seconds=elapsed,
+    )
@@ -1,57 +1,253 @@
 """Simulation runner for batch game execution."""
 
+import atexit
+import os
+import sys
+import threading
 import time
-from dataclasses import dataclass
-from multiprocessing import Pool
-from typing import List
+from functools import partial
+from multiprocessing.pool import Pool as PoolType, ThreadPool
+from typing import Callable, Iterable, Iterator, List, Literal, NamedTuple, Tuple
 
-from src.agents import RandomAgent, GreedyAgent, BoundedGreedyAgent, HeuristicAgent, ConservativeAgent
+from src.agents import Agent, RandomAgent, GreedyAgent, BoundedGreedyAgent, HeuristicAgent, ConservativeAgent
 from src.game.game import play_game
-from src.simulation.results import GameResult, MatchupResult
+from src.parallel import POOL_CONTEXT
+from src.simulation.results import (
+    GameResult, MatchupResult, _bin_record, _game_from_record, _record_fields,
+    _seating,
+)
 
 
-# Agent registry: string names -> constructors.
+def _random_agent(seed: int, fast_mode: bool) -> RandomAgent:
+    """RandomAgent factory; it computes no probabilities, so ignores fast_mode."""
+    return RandomAgent(seed=seed)
+
+
+# Agent registry: string names -> constructors taking (seed=, fast_mode=).
 # Avoids pickling issues -- agents are constructed fresh in each worker.
+# Classes are registered directly; module-level factories stay picklable.
 AGENT_REGISTRY = {
-    "RandomAgent": lambda seed, fast_mode: RandomAgent(seed=seed),
-    "GreedyAgent": lambda seed, fast_mode: GreedyAgent(seed=seed, fast_mode=fast_mode),
-    "BoundedGreedyAgent": lambda seed, fast_mode: BoundedGreedyAgent(seed=seed, fast_mode=fast_mode),
-    "HeuristicAgent": lambda seed, fast_mode: HeuristicAgent(seed=seed, fast_mode=fast_mode),
-    "ConservativeAgent": lambda seed, fast_mode: ConservativeAgent(seed=seed, fast_mode=fast_mode),
+    "RandomAgent": _random_agent,
+    "GreedyAgent": GreedyAgent,
+    "BoundedGreedyAgent": BoundedGreedyAgent,
+    "HeuristicAgent": HeuristicAgent,
+    "ConservativeAgent": ConservativeAgent,
 }
 
 
-@dataclass(frozen=True)
-class GameConfig:
-    """Configuration for a single game in a simulation batch."""
+# Registry positions, for sending agent names between processes as ints
+_AGENT_NAMES = tuple(AGENT_REGISTRY)
+_AGENT_INDEX = {name: i for i, name in enumerate(_AGENT_NAMES)}
+
+
+def _run_packed(run_game: Callable, config) -> bytes:
+    """
+    Play a game in a worker and return it as a binary-format record.
+
+    A few dozen bytes instead of a pickled GameResult, so results cost
+    the driver less to receive; _run_parallel_games rebuilds them.
+    """
+    result = run_game(config)
+    record = _bin_record(len(result.scores))
+    return record.pack(*_record_fields(result, _AGENT_INDEX))
+
+
+def _report_progress(done: int, total: int) -> None:
+    """Write one progress line straight to stdout and flush it."""
+    # sys.stdout looked up per call so redirection (and capsys) still work
+    out = sys.stdout
+    out.write(f"Progress: {done}/{total} games complete\n")
+    out.flush()
+
+
+def available_workers() -> int:
+    """CPUs this process may actually run on (respects affinity masks)."""
+    if hasattr(os, "process_cpu_count"):  # Python 3.13+
+        return os.process_cpu_count() or 1
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+# Execution modes for the parallel path. "process" runs games in worker
+# processes; "thread" runs them on threads in this process, which skips
+# pickling configs and results but only scales if the game and agent code
+# release the GIL (plain Python under CPython does not).
+EXECUTION_MODES = ("process", "thread")
+ExecutionMode = Literal["process", "thread"]
+
+# Worker pool shared by every parallel run() (2-player and N-player), so a
+# sweep of matchups pays process startup and imports once, not per matchup.
+_pool: PoolType | None = None
+_pool_key: Tuple[str, int] | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_executor(mode: ExecutionMode, num_workers: int) -> PoolType:
+    """The shared pool, (re)created if it has a different mode or worker count."""
+    global _pool, _pool_key
+    key = (mode, num_workers)
+    with _pool_lock:
+        if _pool is not None and _pool_key != key:
+            _pool.terminate()
+            _pool.join()
+            _pool = None
+        if _pool is None:
+            if mode == "thread":
+                _pool = ThreadPool(processes=num_workers)
+            else:
+                _pool = POOL_CONTEXT.Pool(processes=num_workers)
+            _pool_key = key
+        return _pool
+
+
+def close_pool() -> None:
+    """Shut down the shared worker pool, if one is running."""
+    global _pool, _pool_key
+    with _pool_lock:
+        if _pool is not None:
+            _pool.terminate()
+            _pool.join()
+            _pool = None
+            _pool_key = None
+
+
+atexit.register(close_pool)
+
+
+def _chunksize(num_games: int, num_workers: int) -> int:
+    """
+    Games per task sent to a worker. Roughly 8 chunks per worker: few
+    enough pipe round trips that cheap games are not dominated by IPC,
+    while still balancing slow games across workers.
+    """
+    return max(1, num_games // (num_workers * 8))
+
+
+class _BoundedFeed:
+    """
+    Iterates configs for the pool's task feeder, staying at most `limit`
+    configs ahead of the results consumed so far.
+
+    imap_unordered otherwise drains its whole input into the task queue
+    up front, so a long run holds every pending task in memory at once.
+    """
+
+    def __init__(self, configs: Iterable, limit: int):
+        self._configs = configs
+        self._slots = threading.Semaphore(limit)
+        self._stopped = False
+
+    def __iter__(self) -> Iterator:
+        for config in self._configs:
+            self._slots.acquire()
+            if self._stopped:
+                return
+            yield config
+
+    def consumed(self) -> None:
+        """A result came back: let one more config through."""
+        self._slots.release()
+
+    def stop(self) -> None:
+        """Unblock the feeder and end the iteration early."""
+        self._stopped = True
+        self._slots.release()
+
+
+def _run_parallel_games(
+    run_game: Callable,
+    configs: Iterable,
+    num_games: int,
+    num_seats: int,
+    num_workers: int,
+    progress_interval: int,
+    execution_mode: ExecutionMode = "process",
+) -> List[GameResult]:
+    """
+    Play configs with game_index 0..num_games-1 on the shared pool.
+
+    Results come back in completion order and are slotted straight into
+    game_index order, so no sort is needed afterwards. Thread workers
+    share this process, so their results need no packing.
+    """
+    pool = _get_executor(execution_mode, num_workers)
+    threaded = execution_mode == "thread"
+    func = run_game if threaded else partial(_run_packed, run_game)
+    record = _bin_record(num_seats)
+    chunksize = _chunksize(num_games, num_workers)
+    # Two chunks per worker in flight keeps every worker busy
+    feed = _BoundedFeed(configs, 2 * num_workers * chunksize)
+    results: List[GameResult] = [None] * num_games
+    next_report = progress_interval
+    try:
+        for done, item in enumerate(
+            pool.imap_unordered(func, feed, chunksize=chunksize), 1
+        ):
+            feed.consumed()
+            if threaded:
+                game = item
+            else:
+                game = _game_from_record(record.unpack(item), num_seats, _AGENT_NAMES)
+            results[game.game_index] = game
+            if done == next_report:
+                _report_progress(next_report, num_games)
+                next_report += progress_interval
+    except BaseException:
+        # Don't leave unfinished games queued on the shared pool. The feeder
+        # is released first because terminating the pool joins its thread.
+        feed.stop()
+        close_pool()
+        raise
+    return results
+
+
+# Agents kept per thread (each pool worker, process or thread, has its own)
+# and reset for each game instead of being rebuilt. Keyed by seat too,
+# since both seats may play the same agent type.
+_agent_cache = threading.local()
+
+
+def _get_agent(name: str, seat: int, seed: int, fast_mode: bool) -> Agent:
+    """A registry agent for this seat, reset as if built with this seed."""
+    cache = getattr(_agent_cache, "agents", None)
+    if cache is None:
+        cache = _agent_cache.agents = {}
+    key = (name, fast_mode, seat)
+    agent = cache.get(key)
+    if agent is None:
+        agent = AGENT_REGISTRY[name](seed=seed, fast_mode=fast_mode)
+        cache[key] = agent
+    else:
+        agent.reset(seed)
+    return agent
+
+
+class NPlayerGameConfig(NamedTuple):
+    """Configuration for a single game in a simulation batch.
+
+    Used by both runners: a 2-player game is the N = 2 case, with agent A
+    as the focal agent. A NamedTuple rather than a frozen dataclass: one is
+    built per game, and tuples are cheaper to construct and to pickle to
+    workers.
+    """
     game_index: int
     seed: int
-    agent_a_name: str
-    agent_b_name: str
+    agent_names: Tuple[str, ...]  # Ordered by seat
+    focal_seat: int               # Which seat the focal agent occupies
     fast_mode: bool
 
 
-def _run_single_game(config: GameConfig) -> GameResult:
+def _run_single_n_player_game(config: NPlayerGameConfig) -> GameResult:
     """Run a single game from a config. Module-level for multiprocessing."""
-    # Even game_index -> agent A is seat 0 (goes first)
-    # Odd game_index -> agent B is seat 0 (goes first)
-    a_first = config.game_index % 2 == 0
-
-    if a_first:
-        seat_0_name = config.agent_a_name
-        seat_1_name = config.agent_b_name
-        first_player = 0
-    else:
-        seat_0_name = config.agent_b_name
-        seat_1_name = config.agent_a_name
-        first_player = 1
-
-    agent_0 = AGENT_REGISTRY[seat_0_name](seed=config.seed, fast_mode=config.fast_mode)
-    agent_1 = AGENT_REGISTRY[seat_1_name](seed=config.seed + 10000, fast_mode=config.fast_mode)
+    n = len(config.agent_names)
+    agents = [
+        _get_agent(name, seat, config.seed + seat * 10000, config.fast_mode)
+        for seat, name in enumerate(config.agent_names)
+    ]
 
-    agents = [agent_0, agent_1]
     final_state, history = play_game(
-        num_players=2,
+        num_players=n,
         agent_functions=agents,
         seed=config.seed,
     )
@@ -66,8 +262,8 @@ def _run_single_game(config: GameConfig) -> GameResult:
         winner=winner,
         num_legs=final_state.leg_number,
         num_turns=len(history),
-        agent_names=(seat_0_name, seat_1_name),
-        first_player=first_player,
+        agent_names=config.agent_names,
+        first_player=config.focal_seat,
     )
 
 
@@ -83,11 +279,14 @@ class SimulationRunner:
         fast_mode: bool = True,
         num_workers: int = 1,
         progress_interval: int = 100,
+        execution_mode: ExecutionMode = "process",
     ):
         if agent_a_name not in AGENT_REGISTRY:
             raise ValueError(f"Unknown agent: {agent_a_name}")
         if agent_b_name not in AGENT_REGISTRY:
             raise ValueError(f"Unknown agent: {agent_b_name}")
+        if execution_mode not in EXECUTION_MODES:
+            raise ValueError(f"Unknown execution mode: {execution_mode}")
 
         self.agent_a_name = agent_a_name
         self.agent_b_name = agent_b_name
@@ -96,18 +295,33 @@ class SimulationRunner:
         self.fast_mode = fast_mode
         self.num_workers = num_workers
         self.progress_interval = progress_interval
+        self.execution_mode = execution_mode
+
+    @staticmethod
+    def close_pool() -> None:
+        """Shut down the shared worker pool (the next parallel run starts a new one)."""
+        close_pool()
 
-    def _make_configs(self) -> List[GameConfig]:
-        return [
-            GameConfig(
+    def _make_configs(self) -> Iterator[NPlayerGameConfig]:
+        # Even game_index -> agent A is seat 0 (goes first)
+        # Odd game_index -> agent B is seat 0 (goes first)
+        # Agent A is the focal agent, so focal_seat is first_player
+        seatings = (
+            _seating((self.agent_a_name, self.agent_b_name)),
+            _seating((self.agent_b_name, self.agent_a_name)),
+        )
+        # Generated lazily: the parallel path only pulls configs a few
+        # chunks ahead of the workers
+        return (
+            NPlayerGameConfig(
                 game_index=i,
                 seed=self.base_seed + i,
-                agent_a_name=self.agent_a_name,
-                agent_b_name=self.agent_b_name,
+                agent_names=seatings[i % 2],
+                focal_seat=i % 2,
                 fast_mode=self.fast_mode,
             )
             for i in range(self.num_games)
-        ]
+        )
 
     def run(self) -> MatchupResult:
         """Run the simulation and return results."""
@@ -119,8 +333,7 @@ class SimulationRunner:
         else:
             results = self._run_parallel(configs)
 
-        # Sort by game_index for deterministic output
-        results.sort(key=lambda r: r.game_index)
+        # Both paths return results in game_index order
         elapsed = time.time() - start
 
         return MatchupResult(
@@ -132,19 +345,18 @@ class SimulationRunner:
             elapsed_seconds=elapsed,
         )
 
-    def _run_serial(self, configs: List[GameConfig]) -> List[GameResult]:
+    def _run_serial(self, configs: Iterable[NPlayerGameConfig]) -> List[GameResult]:
         results = []
-        for i, config in enumerate(configs):
-            results.append(_run_single_game(config))
-            if (i + 1) % self.progress_interval == 0:
-                print(f"Progress: {i + 1}/{self.num_games} games complete", flush=True)
+        next_report = self.progress_interval
+        for config in configs:
+            results.append(_run_single_n_player_game(config))
+            if len(results) == next_report:
+                _report_progress(next_report, self.num_games)
+                next_report += self.progress_interval
         return results
 
-    def _run_parallel(self, configs: List[GameConfig]) -> List[GameResult]:
-        results = []
-        with Pool(processes=self.num_workers) as pool:
-            for i, result in enumerate(pool.imap_unordered(_run_single_game, configs)):
-                results.append(result)
-                if (i + 1) % self.progress_interval == 0:
-                    print(f"Progress: {i + 1}/{self.num_games} games complete", flush=True)
-        return results
+    def _run_parallel(self, configs: Iterable[NPlayerGameConfig]) -> List[GameResult]:
+        return _run_parallel_games(
+            _run_single_n_player_game, configs, self.num_games, 2, self.num_workers,
+            self.progress_interval, self.execution_mode,
+        )
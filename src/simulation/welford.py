@@ -0,0 +1,39 @@
+"""One-pass mean and variance (Welford's algorithm) for the analysis modules.
+
+Stdlib only, like the rest of the simulation package.
+"""
+
+from typing import Iterable, Tuple
+
+
+class Welford:
+    """Running count, mean and sum of squared deviations (Welford's update)."""
+
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (Bessel's correction); 0.0 below two values."""
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+
+def welford(values: Iterable[float]) -> Tuple[float, float, int]:
+    """Mean, sample variance (Bessel's correction) and count in one pass.
+
+    The values are walked once and may come from a generator.
+    """
+    acc = Welford()
+    for x in values:
+        acc.add(x)
+    return (acc.mean, acc.variance, acc.n)
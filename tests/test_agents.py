@@ -37,6 +37,17 @@ class TestAgentBase:
         assert "RandomAgent" in repr(agent)
         assert "TestBot" in repr(agent)
 
+    def test_agent_reset_matches_fresh_agent(self):
+        """A reset agent plays a game exactly like a newly built one."""
+        reused = RandomAgent(seed=1)
+        play_game(2, [reused, RandomAgent(seed=2)], seed=7)
+        reused.reset(seed=3)
+
+        fresh_state, fresh_history = play_game(2, [RandomAgent(seed=3), RandomAgent(seed=4)], seed=8)
+        reused_state, reused_history = play_game(2, [reused, RandomAgent(seed=4)], seed=8)
+        assert reused_history == fresh_history
+        assert reused_state.get_scores() == fresh_state.get_scores()
+
 
 class TestRandomAgent:
     """Test RandomAgent implementation."""
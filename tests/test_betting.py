@@ -3,7 +3,7 @@
 import pytest
 from src.game.betting import (
     BettingState, BettingTicket, PlayerState, OverallBet,
-    calculate_leg_scores, calculate_overall_scores,
+    calculate_leg_scores, calculate_overall_scores, expected_leg_ticket_payout,
     TICKET_VALUES, OVERALL_PAYOUTS
 )
 from src.game.camel import CamelColor, RACING_CAMELS
@@ -59,6 +59,15 @@ class TestBettingTickets:
         assert len(blue_tickets) == 3
         assert [t.value for t in blue_tickets] == [5, 3, 2]
 
+    def test_take_ticket_leaves_original_state_unchanged(self):
+        """Taking a ticket returns a new state; earlier states stay valid."""
+        state = BettingState.create_for_players(2)
+        after = state.take_ticket(player=0, camel=CamelColor.BLUE)
+
+        assert state.available_tickets[CamelColor.BLUE] == TICKET_VALUES
+        assert state.player_tickets[0] == ()
+        assert after.player_tickets[0] == (BettingTicket(CamelColor.BLUE, 5),)
+
     def test_no_ticket_available_when_all_taken(self):
         """Returns None when all tickets for a camel are taken."""
         state = BettingState.create_for_players(2)
@@ -204,6 +213,13 @@ class TestLegScoring:
         # Pyramid tickets cleared
         assert state.player_pyramid_tickets[0] == 0
 
+    def test_expected_leg_ticket_payout(self):
+        """Expected payout weighs ticket value, +1 and -1 by finishing place."""
+        for p_first, p_second in ((1.0, 0.0), (0.0, 1.0), (0.0, 0.0), (0.3, 0.25)):
+            for value in (5, 3, 2):
+                expected = p_first * value + p_second - (1 - p_first - p_second)
+                assert expected_leg_ticket_payout(p_first, p_second, value) == pytest.approx(expected)
+
 
 class TestOverallBetting:
     """Tests for overall winner/loser betting."""
@@ -359,6 +375,13 @@ class TestPlayerState:
         player = player.return_spectator_tile()
         assert player.has_spectator_tile is True
 
+    def test_finish_leg_pays_and_returns_tile(self):
+        """finish_leg matches add_coins followed by return_spectator_tile."""
+        player = PlayerState().use_spectator_tile().use_finish_card(CamelColor.RED)
+        for amount in (5, -1, -10):
+            expected = player.add_coins(amount).return_spectator_tile()
+            assert player.finish_leg(amount) == expected
+
     def test_can_bet_on_overall_checks_cards(self):
         """can_bet_on_overall checks if finish card is available."""
         player = PlayerState()
@@ -217,6 +217,19 @@ class TestCamelPositions:
         assert CamelColor.WHITE not in ranking
         assert CamelColor.BLUE in ranking
 
+    def test_ranking_is_cached_but_caller_safe(self):
+        """Repeated calls agree; mutating a returned list doesn't leak."""
+        pos = CamelPositions.create_empty()
+        pos = pos.place_camel(CamelColor.BLUE, 1)
+        pos = pos.place_camel(CamelColor.RED, 2)
+
+        ranking = pos.get_ranking()
+        ranking.clear()
+        assert pos.get_ranking() == [CamelColor.RED, CamelColor.BLUE]
+
+        moved = pos.move_camel(CamelColor.BLUE, 2)
+        assert moved.get_ranking() == [CamelColor.BLUE, CamelColor.RED]
+
 
 class TestCrazyCamelRules:
     """Tests for crazy camel priority and stack rules."""
@@ -332,3 +345,13 @@ class TestInitialPositions:
 
         # Red rolled 3, should be at space 3
         assert positions.get_camel_space(CamelColor.RED) == 3
+
+    def test_initial_positions_shared_and_order_sensitive(self):
+        """Same rolls give the same (cached) positions; roll order sets stacking."""
+        rolls = [(CamelColor.BLUE, 1), (CamelColor.GREEN, 1)]
+        first = create_initial_positions(rolls)
+        assert create_initial_positions(list(rolls)) is first
+        assert first.get_stack(1).camels == (CamelColor.BLUE, CamelColor.GREEN)
+
+        reversed_rolls = create_initial_positions(rolls[::-1])
+        assert reversed_rolls.get_stack(1).camels == (CamelColor.GREEN, CamelColor.BLUE)
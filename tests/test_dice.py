@@ -41,6 +41,14 @@ class TestRacingDie:
         assert 0.30 < counts[2] / 10000 < 0.37  # ~33%
         assert 0.30 < counts[3] / 10000 < 0.37  # ~33%
 
+    def test_rolls_follow_face_choice_on_same_rng(self):
+        """Rolls draw from the rng exactly like choosing from the face tuples."""
+        rng, ref = random.Random(3), random.Random(3)
+        for _ in range(200):
+            assert roll_racing_die(DieColor.RED, rng).value == ref.choice(RACING_DIE_FACES)
+            grey = roll_grey_die(rng)
+            assert (grey.crazy_camel, grey.value) == ref.choice(GREY_DIE_FACES)
+
     def test_racing_die_probabilities(self):
         """Probability helper returns correct values (1/3 each)."""
         probs = get_racing_die_probabilities()
@@ -145,3 +153,14 @@ class TestPyramid:
 
         assert len(reset.remaining) == 5
         assert not reset.grey_rolled
+
+    def test_roll_choice_ignores_set_construction_order(self):
+        """Equal pyramids pick the same die from the same rng state."""
+        dice = [DieColor.BLUE, DieColor.RED, DieColor.PURPLE, DieColor.GREEN]
+        forward = Pyramid(remaining=frozenset(dice))
+        backward = Pyramid(remaining=frozenset(reversed(dice)))
+
+        for seed in range(20):
+            _, roll_a = forward.roll_from_pyramid(random.Random(seed))
+            _, roll_b = backward.roll_from_pyramid(random.Random(seed))
+            assert roll_a == roll_b
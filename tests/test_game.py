@@ -182,7 +182,7 @@ class TestLegScoring:
         rng = random.Random(42)
         while not state.pyramid.is_leg_complete() and not state.is_game_over:
             action = Action(ActionType.TAKE_PYRAMID_TICKET)
-            if action in state.get_legal_actions():
+            if state.is_legal(action):
                 state = state.apply_action(action, rng)
             else:
                 break
@@ -34,6 +34,52 @@ class TestTurnStructure:
         assert ActionType.BET_OVERALL_LOSER in action_types
         # PLACE_SPECTATOR_TILE may or may not be available depending on board state
 
+    def test_legal_actions_are_shared_but_equal_to_fresh_ones(self):
+        """Legal actions are reused across states and still compare by value."""
+        state = GameState.create_new_game(num_players=2, seed=42)
+        actions = state.get_legal_actions()
+        next_actions = state.apply_action(actions[0]).get_legal_actions()
+
+        pyramid = Action(ActionType.TAKE_PYRAMID_TICKET)
+        assert pyramid in actions
+        assert next(a for a in actions if a == pyramid) is next(
+            a for a in next_actions if a == pyramid
+        )
+        assert Action(ActionType.BET_OVERALL_WINNER, camel=CamelColor.RED) in actions
+
+    def test_legal_actions_are_cached_but_caller_safe(self):
+        """Repeated calls agree, and mutating one result doesn't leak."""
+        state = GameState.create_new_game(num_players=2, seed=42)
+        actions = state.get_legal_actions()
+        expected = list(actions)
+        actions.clear()
+
+        assert state.get_legal_actions() == expected
+        assert state.get_legal_actions() is not state.get_legal_actions()
+
+    def test_is_legal_matches_legal_actions(self):
+        """is_legal agrees with get_legal_actions for fresh Action objects."""
+        state = GameState.create_new_game(num_players=2, seed=42)
+        state = state.apply_action(
+            Action(ActionType.BET_OVERALL_WINNER, camel=CamelColor.BLUE)
+        )
+        state = state.apply_action(
+            Action(ActionType.BET_OVERALL_LOSER, camel=CamelColor.GREEN)
+        )
+
+        for action in state.get_legal_actions():
+            assert state.is_legal(Action(
+                action.action_type, camel=action.camel,
+                space=action.space, is_cheering=action.is_cheering
+            ))
+        # Player 0 has used the blue finish card
+        assert not state.is_legal(
+            Action(ActionType.BET_OVERALL_LOSER, camel=CamelColor.BLUE)
+        )
+        assert not state.is_legal(
+            Action(ActionType.PLACE_SPECTATOR_TILE, space=1, is_cheering=True)
+        )
+
     def test_turn_passes_clockwise(self):
         """Turns pass to the next player in order."""
         state = GameState.create_new_game(num_players=4, seed=42)
@@ -76,16 +122,16 @@ class TestLegMechanics:
     def test_leg_ends_when_five_dice_revealed(self):
         """Leg ends when 5 of 6 dice have been revealed."""
         pyramid = Pyramid()
+        rng = random.Random(0)
 
         # Roll 4 dice - leg not complete
         for _ in range(4):
-            rng = random.Random()
             pyramid, _ = pyramid.roll_from_pyramid(rng)
 
         assert not pyramid.is_leg_complete()
 
         # Roll 5th die - leg complete (1 remains)
-        pyramid, _ = pyramid.roll_from_pyramid(random.Random())
+        pyramid, _ = pyramid.roll_from_pyramid(rng)
         assert pyramid.is_leg_complete()
 
     def test_pyramid_refilled_after_leg(self):
@@ -96,7 +142,7 @@ class TestLegMechanics:
         # Roll dice until leg ends
         while not state.pyramid.is_leg_complete() and not state.is_game_over:
             action = Action(ActionType.TAKE_PYRAMID_TICKET)
-            if action in state.get_legal_actions():
+            if state.is_legal(action):
                 state = state.apply_action(action, rng)
             else:
                 break
@@ -117,7 +163,7 @@ class TestLegMechanics:
         initial_leg = state.leg_number
         while state.leg_number == initial_leg and not state.is_game_over:
             action = Action(ActionType.TAKE_PYRAMID_TICKET)
-            if action in state.get_legal_actions():
+            if state.is_legal(action):
                 state = state.apply_action(action, rng)
             else:
                 # Take any action to progress
@@ -147,7 +193,7 @@ class TestLegMechanics:
         initial_leg = state.leg_number
         while state.leg_number == initial_leg and not state.is_game_over:
             action = Action(ActionType.TAKE_PYRAMID_TICKET)
-            if action in state.get_legal_actions():
+            if state.is_legal(action):
                 state = state.apply_action(action, rng)
             else:
                 actions = state.get_legal_actions()
@@ -182,7 +228,7 @@ class TestLegMechanics:
             initial_leg = state.leg_number
             while state.leg_number == initial_leg and not state.is_game_over:
                 action = Action(ActionType.TAKE_PYRAMID_TICKET)
-                if action in state.get_legal_actions():
+                if state.is_legal(action):
                     state = state.apply_action(action, rng)
                 else:
                     actions = state.get_legal_actions()
@@ -206,7 +252,7 @@ class TestLegMechanics:
 
         while state.leg_number == initial_leg and not state.is_game_over:
             action = Action(ActionType.TAKE_PYRAMID_TICKET)
-            if action in state.get_legal_actions():
+            if state.is_legal(action):
                 last_pyramid_player = state.current_player
                 state = state.apply_action(action, rng)
             else:
@@ -1,8 +1,10 @@
 """Tests for N-player simulation framework."""
 
+import gc
 import math
 import os
 import tempfile
+import weakref
 
 import pytest
 
@@ -11,6 +13,8 @@ from src.simulation.n_player_results import (
     NPlayerMatchupResult,
     save_n_player_results_csv,
     load_n_player_results_csv,
+    save_n_player_results_bin,
+    load_n_player_results_bin,
 )
 from src.simulation.n_player_runner import NPlayerRunner, NPlayerGameConfig
 from src.simulation.n_player_analysis import (
@@ -179,6 +183,43 @@ class TestNPlayerCSVRoundTrip:
         finally:
             os.unlink(path)
 
+    def test_skips_trailing_blank_line(self):
+        result = _four_player_fixture()
+
+        with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as f:
+            path = f.name
+
+        try:
+            save_n_player_results_csv(result, path)
+            with open(path, "a", newline="") as f:
+                f.write("\r\n")
+            loaded = load_n_player_results_csv(path)
+            assert len(loaded.games) == 8
+        finally:
+            os.unlink(path)
+
+    def test_rejects_missing_column(self):
+        result = _four_player_fixture()
+
+        with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as f:
+            path = f.name
+
+        try:
+            save_n_player_results_csv(result, path)
+            with open(path, newline="") as f:
+                lines = f.read().split("\r\n")
+            # Drop the winner column from every line
+            winner = lines[0].split(",").index("winner")
+            with open(path, "w", newline="") as f:
+                f.write("\r\n".join(
+                    ",".join(v for i, v in enumerate(line.split(",")) if i != winner)
+                    for line in lines
+                ))
+            with pytest.raises(ValueError, match="'winner'"):
+                load_n_player_results_csv(path)
+        finally:
+            os.unlink(path)
+
     def test_dynamic_columns(self):
         """CSV has score_0..score_3 and agent_seat_0..agent_seat_3 for 4 players."""
         games = [
@@ -205,6 +246,76 @@ class TestNPlayerCSVRoundTrip:
             os.unlink(path)
 
 
+# ===========================================================================
+# TestNPlayerBinaryRoundTrip
+# ===========================================================================
+
+class TestNPlayerBinaryRoundTrip:
+
+    def test_save_and_load_4_player(self):
+        result = _four_player_fixture()
+
+        with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as f:
+            path = f.name
+
+        try:
+            save_n_player_results_bin(result, path)
+            loaded = load_n_player_results_bin(path)
+            # Unlike the CSV, metadata survives the round trip
+            assert loaded == result
+            assert loaded.games[4].winner is None
+        finally:
+            os.unlink(path)
+
+    def test_repeated_field_names(self):
+        games = [
+            _make_n_game(0, (4, 9, 0, 2), winner=1, focal_seat=2,
+                         agent_names=("Random", "Random", "Greedy", "Random")),
+        ]
+        result = _make_n_matchup(games, focal_name="Greedy",
+                                 field_names=("Random", "Random", "Random"))
+
+        with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as f:
+            path = f.name
+
+        try:
+            save_n_player_results_bin(result, path)
+            assert load_n_player_results_bin(path) == result
+        finally:
+            os.unlink(path)
+
+    def test_rejects_csv_file(self):
+        result = _four_player_fixture()
+
+        with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as f:
+            path = f.name
+
+        try:
+            save_n_player_results_csv(result, path)
+            with pytest.raises(ValueError):
+                load_n_player_results_bin(path)
+        finally:
+            os.unlink(path)
+
+    def test_rejects_truncated_file(self):
+        result = _four_player_fixture()
+
+        with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as f:
+            path = f.name
+
+        try:
+            save_n_player_results_bin(result, path)
+            with open(path, "rb") as f:
+                data = f.read()
+            for size in range(len(data)):
+                with open(path, "wb") as f:
+                    f.write(data[:size])
+                with pytest.raises(ValueError):
+                    load_n_player_results_bin(path)
+        finally:
+            os.unlink(path)
+
+
 # ===========================================================================
 # TestNPlayerRunner
 # ===========================================================================
@@ -409,6 +520,14 @@ class TestNPlayerAnalysis:
         assert "Baseline (1/N)" in text
         assert "Seat win rates" in text
 
+    def test_summary_does_not_keep_result_alive(self):
+        m = _four_player_fixture()
+        summary_text(m)
+        ref = weakref.ref(m)
+        del m
+        gc.collect()
+        assert ref() is None
+
 
 # ===========================================================================
 # TestNPlayerEndToEnd
@@ -1,19 +1,28 @@
 """Tests for probability calculator."""
 
+import random
+
 import pytest
-from src.game.board import Board
+from src.game.board import Board, SpectatorTile
 from src.game.camel import CamelColor, CamelPositions, RACING_CAMELS
 from src.game.dice import DieColor
+from src.parallel import POOL_CONTEXT
 from src.probability.calculator import (
     enumerate_dice_sequences,
+    iter_dice_sequences,
+    count_dice_sequences,
     enumerate_grey_die_outcomes,
+    get_remaining_dice,
     simulate_sequence_with_grey,
     calculate_ranking_probabilities,
     calculate_all_probabilities,
+    calculate_expected_payouts,
+    calculate_all_probabilities_batch,
     LegOutcome,
     RankingProbabilities,
     FullProbabilities
 )
+from src.probability import _kernel, calculator
 from src.probability.ev import (
     calculate_leg_ticket_ev,
     calculate_all_leg_ticket_evs,
@@ -26,6 +35,14 @@ from src.probability.ev import (
 )
 
 
+def _board(placements):
+    """Board with camels placed in order (later camels stack on earlier ones)."""
+    positions = CamelPositions.create_empty()
+    for camel, space in placements:
+        positions = positions.place_camel(camel, space)
+    return Board(camel_positions=positions, spectator_tiles={})
+
+
 class TestEnumeration:
     """Tests for dice sequence enumeration."""
 
@@ -70,6 +87,19 @@ class TestEnumeration:
             for value in [1, 2, 3]:
                 assert (camel, value) in outcomes
 
+    def test_remaining_dice_excludes_rolled(self):
+        """Rolled dice are removed; grey is listed last when still available."""
+        remaining = get_remaining_dice(frozenset({DieColor.RED, DieColor.BLUE}))
+        assert remaining == [DieColor.GREEN, DieColor.YELLOW,
+                             DieColor.PURPLE, DieColor.GREY]
+
+    def test_remaining_dice_without_grey(self):
+        """include_grey=False drops grey; a bitmask input is also accepted."""
+        from_set = get_remaining_dice(frozenset({DieColor.GREEN}), include_grey=False)
+        from_mask = get_remaining_dice(0b000010, include_grey=False)
+        assert from_set == from_mask == [DieColor.BLUE, DieColor.YELLOW,
+                                         DieColor.RED, DieColor.PURPLE]
+
     def test_enumerate_depth_limit_2(self):
         """5 dice, depth_limit=2: P(5,2) * 3^2 = 20 * 9 = 180 sequences."""
         all_racing = [DieColor.BLUE, DieColor.GREEN, DieColor.YELLOW,
@@ -104,6 +134,15 @@ class TestEnumeration:
         sequences = enumerate_dice_sequences(two_dice, depth_limit=5)
         assert len(sequences) == 18
 
+    def test_iter_and_count_match_enumeration(self):
+        """Lazy iterator yields the same sequences; count matches their number."""
+        three_dice = [DieColor.BLUE, DieColor.GREEN, DieColor.RED]
+        for depth in (None, 0, 2, 5):
+            sequences = enumerate_dice_sequences(three_dice, depth_limit=depth)
+            assert list(iter_dice_sequences(three_dice, depth_limit=depth)) == sequences
+            assert count_dice_sequences(3, depth_limit=depth) == len(sequences)
+        assert count_dice_sequences(0) == 1
+
     def test_depth_limited_probabilities_sum_to_one(self):
         """Ranking probs with depth_limit still sum to 1.0 per position."""
         positions = CamelPositions.create_empty()
@@ -202,6 +241,75 @@ class TestSimulation:
         assert outcome.first == CamelColor.GREEN
         assert outcome.second == CamelColor.BLUE
 
+    def test_simulate_skips_absent_camels(self):
+        """Dice for camels that are not on the board move nothing."""
+        board = _board([(CamelColor.BLUE, 3), (CamelColor.GREEN, 5)])
+
+        # Red and both crazy camels are absent; only Blue's 3 -> 4 lands
+        sequence = ((DieColor.RED, 2), (DieColor.BLUE, 1))
+        outcome = simulate_sequence_with_grey(board, sequence, (CamelColor.WHITE, 2), 0, 3)
+
+        assert outcome.ranking == (CamelColor.GREEN, CamelColor.BLUE)
+        assert outcome.spaces_landed == (4,)
+        assert not outcome.game_finished
+
+
+class TestKernel:
+    """The packed simulation kernel must follow Board semantics exactly."""
+
+    def test_kernel_matches_board_moves(self):
+        """Random stacked boards with tiles: moves, rankings and crazy rules agree."""
+        rng = random.Random(0)
+        for _ in range(300):
+            positions = CamelPositions.create_empty(21)
+            for camel in rng.sample(_kernel.KERNEL_CAMELS, 7):
+                positions = positions.place_camel(camel, rng.randint(1, 4))
+            tiles = {}
+            for owner, space in enumerate(rng.sample(range(5, 9), 2)):
+                tiles[space] = SpectatorTile(owner=owner, is_cheering=rng.random() < 0.5)
+            board = Board(camel_positions=positions, spectator_tiles=tiles)
+            state, packed_tiles = _kernel.pack_board(board)
+
+            for _ in range(4):
+                idx = rng.randrange(7)
+                if idx >= _kernel.NUM_RACING:
+                    shown = _kernel.KERNEL_CAMELS[idx]
+                    idx = _kernel.crazy_camel_to_move(state, idx)
+                    expected = board.camel_positions.get_crazy_camel_to_move(shown)
+                    assert _kernel.KERNEL_CAMELS[idx] == expected
+                    spaces = -rng.randint(1, 3)
+                else:
+                    spaces = rng.randint(1, 3)
+                camel = _kernel.KERNEL_CAMELS[idx]
+                old_space = board.camel_positions.get_camel_space(camel)
+
+                board, _ = board.move_camel(camel, spaces)
+                state, landed = _kernel.move(state, idx, spaces, packed_tiles)
+
+                new_space = board.camel_positions.get_camel_space(camel)
+                assert state == _kernel.pack_board(board)[0]
+                assert landed == (new_space if new_space != old_space else -1)
+                ranking = [_kernel.KERNEL_CAMELS[i] for i in _kernel.ranking(state)]
+                assert ranking == board.get_ranking()
+
+    def test_ranking_skips_absent_camels(self):
+        """Camels not on the board are left out of the ranking."""
+        state = (8, -1, 9, 24, -1, -1, -1)
+        assert _kernel.ranking(state) == (3, 2, 0)
+        assert [key & _kernel.RANK_KEY_CAMEL for key in _kernel.ranked_keys(state)] == [3, 2, 0]
+
+    def test_pack_key_distinguishes_states(self):
+        """pack_key is injective, including absent camels and tall stacks."""
+        states = [
+            (8, 9, 16, -1, 24, 40, 41),
+            (8, 9, 16, 24, -1, 40, 41),
+            (8, 9, 10, 11, 12, 13, 14),
+            (160, 9, 16, 24, 32, -1, -1),
+            (9, 8, 16, 24, 32, 41, 40),
+        ]
+        keys = {_kernel.pack_key(state) for state in states}
+        assert len(keys) == len(states)
+
 
 class TestProbabilityCalculation:
     """Tests for probability calculations."""
@@ -264,6 +372,108 @@ class TestProbabilityCalculation:
         # Bottom (Blue) should have lowest
         assert probs.prob_first(CamelColor.PURPLE) > probs.prob_first(CamelColor.BLUE)
 
+    def test_grey_ranking_matches_full_calculation(self):
+        """Ranking-only grey path should agree with the full calculation."""
+        board = _board([
+            (CamelColor.BLUE, 3), (CamelColor.GREEN, 4), (CamelColor.WHITE, 6),
+            (CamelColor.RED, 6),  # On white's back
+            (CamelColor.YELLOW, 5), (CamelColor.PURPLE, 2), (CamelColor.BLACK, 10),
+        ])
+        dice = [DieColor.BLUE, DieColor.RED]
+
+        ranking = calculate_ranking_probabilities(board, dice, grey_die_available=True)
+        full = calculate_all_probabilities(board, dice, grey_die_available=True)
+
+        for camel in RACING_CAMELS:
+            for p_rank, p_full in zip(ranking.probabilities[camel],
+                                      full.ranking.probabilities[camel]):
+                assert abs(p_rank - p_full) < 1e-9
+
+    def test_sparse_board_ranking_matches_full_calculation(self):
+        """Collapsing independent moves on a spread-out board keeps exact results."""
+        board = _board([
+            (CamelColor.BLUE, 1), (CamelColor.GREEN, 6), (CamelColor.YELLOW, 8),
+            (CamelColor.RED, 12), (CamelColor.PURPLE, 3),
+        ])
+        dice = [DieColor.BLUE, DieColor.GREEN, DieColor.RED]
+
+        for grey in (False, True):
+            ranking = calculate_ranking_probabilities(board, dice, grey_die_available=grey)
+            full = calculate_all_probabilities(board, dice, grey_die_available=grey)
+
+            for camel in RACING_CAMELS:
+                for p_rank, p_full in zip(ranking.probabilities[camel],
+                                          full.ranking.probabilities[camel]):
+                    assert abs(p_rank - p_full) < 1e-9
+
+    def test_independent_groups_match_brute_force(self):
+        """Camel groups that cannot meet are enumerated separately, exactly."""
+        board = _board([
+            (CamelColor.BLUE, 1), (CamelColor.GREEN, 2), (CamelColor.RED, 9),
+            (CamelColor.YELLOW, 9), (CamelColor.PURPLE, 11),
+        ])
+        dice = [DieColor.BLUE, DieColor.GREEN, DieColor.RED]
+
+        state, tiles = _kernel.pack_board(board)
+        assert calculator._split_leg(state, tiles, calculator._dice_mask(dice), True)
+
+        for grey in (False, True):
+            counts = {camel: [0] * 5 for camel in RACING_CAMELS}
+            total = 0
+            for seq in enumerate_dice_sequences(dice):
+                grey_cases = [(outcome, pos) for outcome in enumerate_grey_die_outcomes()
+                              for pos in range(len(dice) + 1)] if grey else [(None, None)]
+                for grey_outcome, grey_pos in grey_cases:
+                    outcome = simulate_sequence_with_grey(board, seq, grey_outcome, grey_pos)
+                    for pos, camel in enumerate(outcome.ranking):
+                        counts[camel][pos] += 1
+                    total += 1
+
+            probs = calculate_ranking_probabilities(board, dice, grey_die_available=grey)
+            for camel in RACING_CAMELS:
+                for got, count in zip(probs.probabilities[camel], counts[camel]):
+                    assert got == pytest.approx(count / total, abs=1e-12)
+
+    def test_repeated_calculation_is_cached(self):
+        """The same position with the dice in any order reuses one result,
+        but callers can't alter it through the dicts they get back."""
+        placements = [
+            (CamelColor.BLUE, 2), (CamelColor.GREEN, 4), (CamelColor.YELLOW, 4),
+            (CamelColor.RED, 6), (CamelColor.PURPLE, 7),
+        ]
+        board = _board(placements)
+
+        first = calculate_all_probabilities(board, [DieColor.RED, DieColor.BLUE], False)
+        again = calculate_all_probabilities(_board(placements), [DieColor.BLUE, DieColor.RED], False)
+        assert again == first
+
+        first.ranking.probabilities[CamelColor.BLUE] = (999.0,) * 5
+        first.overall_race.win_probs[CamelColor.BLUE] = 999.0
+        third = calculate_all_probabilities(board, [DieColor.RED, DieColor.BLUE], False)
+        assert third == again
+        assert third.ranking.probabilities[CamelColor.BLUE][0] != 999.0
+
+    def test_batch_matches_single_calculations(self):
+        """Batch results equal one-by-one calls, in order, serial or pooled."""
+        board = _board([
+            (CamelColor.BLUE, 1), (CamelColor.GREEN, 1), (CamelColor.YELLOW, 2),
+            (CamelColor.RED, 3), (CamelColor.PURPLE, 14),
+            (CamelColor.WHITE, 5), (CamelColor.BLACK, 2),
+        ])
+        scenarios = [
+            (board, [DieColor.BLUE, DieColor.RED], True),
+            (board, [DieColor.PURPLE, DieColor.GREEN, DieColor.YELLOW], False),
+            (board, [], True),
+        ]
+
+        expected = [calculate_all_probabilities(*scenario) for scenario in scenarios]
+        assert calculate_all_probabilities_batch(scenarios) == expected
+        assert calculate_all_probabilities_batch(scenarios, num_workers=2) == expected
+
+        # Inside a (daemonic) pool worker it cannot start a pool; runs in-process
+        with POOL_CONTEXT.Pool(processes=1) as pool:
+            assert pool.apply(calculate_all_probabilities_batch, (scenarios, None, 2)) == expected
+
 
 class TestExpectedValue:
     """Tests for EV calculations."""
@@ -304,6 +514,23 @@ class TestExpectedValue:
         # Should be close to -1 (guaranteed loss)
         assert ev < 0
 
+    def test_expected_payouts_match_leg_ticket_ev(self):
+        """EV-only entry point should match EV from ranking probabilities."""
+        board = _board([
+            (CamelColor.BLUE, 1), (CamelColor.GREEN, 2), (CamelColor.YELLOW, 3),
+            (CamelColor.RED, 4), (CamelColor.PURPLE, 5),
+            (CamelColor.WHITE, 12), (CamelColor.BLACK, 14),
+        ])
+        dice = [DieColor.BLUE, DieColor.PURPLE]
+        tickets = {CamelColor.BLUE: 5, CamelColor.PURPLE: 3}
+
+        probs = calculate_ranking_probabilities(board, dice, grey_die_available=True)
+        evs = calculate_expected_payouts(board, dice, True, tickets)
+
+        assert set(evs) == set(tickets)
+        for camel, value in tickets.items():
+            assert evs[camel] == pytest.approx(calculate_leg_ticket_ev(probs, camel, value))
+
     def test_rank_actions(self):
         """Actions should be ranked by EV."""
         positions = CamelPositions.create_empty()
@@ -1,14 +1,18 @@
 """Tests for Phase 4 simulation framework."""
 
+import gc
 import math
 import os
 import tempfile
+import weakref
 
 import pytest
 
 from src.simulation.results import (
     GameResult, MatchupResult, save_results_csv, load_results_csv,
+    save_results_bin, load_results_bin, load_results_columns,
 )
+from src.simulation import runner as runner_module
 from src.simulation.runner import SimulationRunner, AGENT_REGISTRY
 from src.simulation.analysis import (
     agent_a_wins, agent_b_wins, tie_count,
@@ -188,6 +192,170 @@ class TestCSVRoundTrip:
         finally:
             os.unlink(path)
 
+    def test_loaded_games_share_seating_tuples(self):
+        games = [
+            _make_game(i, (10, 5), winner=0, first_player=i % 2,
+                       agent_names=("AgentA", "AgentB") if i % 2 == 0
+                       else ("AgentB", "AgentA"))
+            for i in range(4)
+        ]
+        matchup = _make_matchup(games)
+
+        with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as f:
+            path = f.name
+
+        try:
+            save_results_csv(matchup, path)
+            loaded = load_results_csv(path)
+            assert loaded.games[0].agent_names is loaded.games[2].agent_names
+            assert loaded.games[1].agent_names is loaded.games[3].agent_names
+        finally:
+            os.unlink(path)
+
+    def test_load_columns(self):
+        games = [
+            _make_game(0, (10, 5), winner=0),
+            _make_game(1, (3, 12), winner=None),
+        ]
+        matchup = _make_matchup(games)
+
+        with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as f:
+            path = f.name
+
+        try:
+            save_results_csv(matchup, path)
+            columns = load_results_columns(path)
+            assert columns["game_index"] == [0, 1]
+            assert columns["score_0"] == [10, 3]
+            assert columns["score_1"] == [5, 12]
+            assert columns["winner"] == [0, None]
+            assert columns["agent_seat_0"] == ["AgentA", "AgentB"]
+            assert columns["first_player"] == [0, 1]
+        finally:
+            os.unlink(path)
+
+    def test_loaders_skip_trailing_blank_line(self):
+        games = [
+            _make_game(0, (10, 5), winner=0),
+            _make_game(1, (3, 12), winner=None),
+        ]
+        matchup = _make_matchup(games)
+
+        with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as f:
+            path = f.name
+
+        try:
+            save_results_csv(matchup, path)
+            with open(path, "a", newline="") as f:
+                f.write("\r\n")
+            assert len(load_results_csv(path).games) == 2
+            assert load_results_columns(path)["score_0"] == [10, 3]
+        finally:
+            os.unlink(path)
+
+    def test_load_columns_rejects_missing_column(self):
+        with tempfile.NamedTemporaryFile(suffix=".csv", delete=False, mode="w") as f:
+            f.write("game_index,seed\n0,1000\n")
+            path = f.name
+
+        try:
+            with pytest.raises(ValueError):
+                load_results_columns(path)
+        finally:
+            os.unlink(path)
+
+    def test_loaders_reject_short_row(self):
+        matchup = _make_matchup([_make_game(0, (10, 5), winner=0)])
+
+        with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as f:
+            path = f.name
+
+        try:
+            save_results_csv(matchup, path)
+            with open(path, "a", newline="") as f:
+                f.write("3,1003,7\r\n")
+            with pytest.raises(ValueError, match="line 3"):
+                load_results_columns(path)
+            with pytest.raises(ValueError, match="line 3"):
+                load_results_csv(path)
+        finally:
+            os.unlink(path)
+
+
+# ===========================================================================
+# TestBinaryRoundTrip
+# ===========================================================================
+
+class TestBinaryRoundTrip:
+
+    def test_save_and_load_bin(self):
+        games = [
+            _make_game(0, (10, 5), winner=0),
+            _make_game(1, (3, 12), winner=1),
+            _make_game(2, (7, 7), winner=None),
+            _make_game(3, (4, 9), winner=0, seed=2**40),
+        ]
+        matchup = _make_matchup(games)
+
+        with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as f:
+            path = f.name
+
+        try:
+            save_results_bin(matchup, path)
+            # Metadata survives too, unlike the CSV
+            assert load_results_bin(path) == matchup
+        finally:
+            os.unlink(path)
+
+    def test_mirror_matchup(self):
+        games = [_make_game(0, (10, 5), winner=0, agent_names=("Greedy", "Greedy"))]
+        matchup = _make_matchup(games, agent_a="Greedy", agent_b="Greedy")
+
+        with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as f:
+            path = f.name
+
+        try:
+            save_results_bin(matchup, path)
+            assert load_results_bin(path) == matchup
+        finally:
+            os.unlink(path)
+
+    def test_rejects_csv_file(self):
+        matchup = _make_matchup([_make_game(0, (10, 5), winner=0)])
+
+        with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as f:
+            path = f.name
+
+        try:
+            save_results_csv(matchup, path)
+            with pytest.raises(ValueError):
+                load_results_bin(path)
+        finally:
+            os.unlink(path)
+
+    def test_rejects_truncated_file(self):
+        games = [_make_game(i, (10, 5), winner=0) for i in range(3)]
+        matchup = _make_matchup(games)
+
+        with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as f:
+            path = f.name
+
+        try:
+            save_results_bin(matchup, path)
+            with open(path, "rb") as f:
+                data = f.read()
+            # Every proper prefix, trailing bytes, and a name index past the table
+            corrupt = [data[:size] for size in range(len(data))]
+            corrupt.append(data + b"\x00")
+            corrupt.append(data[:-2] + b"\xff\xff")
+            for content in corrupt:
+                with open(path, "wb") as f:
+                    f.write(content)
+                with pytest.raises(ValueError):
+                    load_results_bin(path)
+        finally:
+            os.unlink(path)
+
 
 # ===========================================================================
 # TestSimulationRunner
@@ -242,6 +410,36 @@ class TestSimulationRunner:
             assert s.scores == p.scores
             assert s.winner == p.winner
 
+    def test_runner_thread_mode_matches_serial(self):
+        kwargs = dict(
+            agent_a_name="RandomAgent", agent_b_name="RandomAgent",
+            num_games=20, base_seed=42, fast_mode=True,
+        )
+        serial = SimulationRunner(num_workers=1, **kwargs).run()
+        threaded = SimulationRunner(
+            num_workers=2, execution_mode="thread", **kwargs
+        ).run()
+        SimulationRunner.close_pool()
+        assert threaded.games == serial.games
+
+    def test_runner_rejects_unknown_execution_mode(self):
+        with pytest.raises(ValueError):
+            SimulationRunner("RandomAgent", "RandomAgent", 2, execution_mode="fiber")
+
+    def test_runner_parallel_reuses_pool(self):
+        kwargs = dict(
+            agent_a_name="RandomAgent", agent_b_name="RandomAgent",
+            num_games=4, base_seed=42, fast_mode=True, num_workers=2,
+        )
+        SimulationRunner(**kwargs).run()
+        pool = runner_module._pool
+        assert pool is not None
+        SimulationRunner(**kwargs).run()
+        assert runner_module._pool is pool
+
+        SimulationRunner.close_pool()
+        assert runner_module._pool is None
+
     def test_runner_alternates_start_player(self):
         runner = SimulationRunner(
             "RandomAgent", "RandomAgent", num_games=10,
@@ -485,6 +683,15 @@ class TestAnalysis:
         # Seat 0 wins: games 0, 1, 2, 4 = 4 out of 6
         assert abs(rate - 4 / 6) < 0.001
 
+    def test_summary_does_not_keep_matchup_alive(self):
+        games = [_make_game(i, (10, 5 + i), winner=0) for i in range(4)]
+        m = _make_matchup(games)
+        summary_text(m)
+        ref = weakref.ref(m)
+        del m
+        gc.collect()
+        assert ref() is None
+
 
 # ===========================================================================
 # TestEndToEnd